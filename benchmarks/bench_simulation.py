@@ -0,0 +1,70 @@
+"""
+AFK Auto-Help Benchmark: Simulated Sessions
+
+Runs the real feed and chop workers against the game simulator to measure
+scheduling efficiency over long simulated periods, without a display.
+
+Scenarios:
+- monitor:      monitor-mode feeding on a VirtualClock (as fast as possible)
+- timer:        timer-mode feeding on a VirtualClock
+- monitor+chop: both together on a ScaledClock at --speed x real time
+
+Reported per scenario: captures, feeds, captures per feed, overfeeds
+(food wasted because the bar was nearly full), ignored feed clicks,
+chop clicks, misclicks, lowest hunger and time spent starving.
+
+Usage:
+    python benchmarks/bench_simulation.py [--hours 24] [--speed 1000]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+import game_simulator  # noqa: E402
+from state import AppState  # noqa: E402
+
+
+def make_state(**settings) -> AppState:
+    """Return an AppState with the given settings applied."""
+    state = AppState()
+    for name, value in settings.items():
+        setattr(state, name, value)
+    return state
+
+
+def main() -> int:
+    """Run all scenarios and print their metrics as JSON lines."""
+    parser = argparse.ArgumentParser(description="Benchmark workers against the game simulator.")
+    parser.add_argument("--hours", type=float, default=24.0,
+                        help="Simulated hours for the feeding scenarios (default: %(default)s)")
+    parser.add_argument("--chop-minutes", type=float, default=10.0,
+                        help="Simulated minutes for the concurrent scenario (default: %(default)s)")
+    parser.add_argument("--speed", type=float, default=1000.0,
+                        help="Speed-up of the concurrent scenario (default: %(default)s)")
+    args = parser.parse_args()
+
+    seconds = args.hours * 3600
+    chop_seconds = args.chop_minutes * 60
+    scenarios = [
+        ("monitor", make_state(feed_mode="MONITOR_BAR", hunger_threshold=40), ["monitor"], seconds, None),
+        ("timer", make_state(feed_mode="TIMER", timer_interval_minutes=10), ["timer"], seconds, None),
+        ("monitor+chop",
+         make_state(feed_mode="MONITOR_BAR", hunger_threshold=40,
+                    chop_click_rate=5, chop_duration=chop_seconds),
+         ["monitor", "chop"], chop_seconds, args.speed),
+    ]
+
+    for name, state, tasks, duration, speed in scenarios:
+        stats = game_simulator.run_simulation(state, tasks, duration, speed=speed)
+        print(json.dumps({"scenario": name, **stats}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
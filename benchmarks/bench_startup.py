@@ -0,0 +1,98 @@
+"""
+AFK Auto-Help Benchmark: Cold Start Time
+
+Measures how long the GUI takes to become usable and checks it against a
+startup budget. Each measurement runs in a fresh interpreter so module
+caches do not hide import costs.
+
+Reported stages:
+- import:  importing afk_auto_help
+- window:  creating the root window and all widgets, through the first
+           idle update (skipped when no display is available)
+- heavy:   capture/input/vision modules loaded at that point (should be none)
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+IMPORT_BUDGET_MS = 150.0
+"""Budget for importing the GUI module."""
+WINDOW_BUDGET_MS = 500.0
+"""Budget from interpreter start of the measurement to a drawn window."""
+HEAVY_MODULES = ("pyautogui", "PIL", "pyscreeze", "pymsgbox", "pytweening", "cv2", "numpy")
+"""Modules that must not be imported before the window is shown."""
+
+_PROBE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import afk_auto_help
+t1 = time.perf_counter()
+result = {"import_ms": (t1 - t0) * 1000.0, "window_ms": None}
+try:
+    import tkinter as tk
+    root = tk.Tk()
+except Exception:
+    root = None
+if root is not None:
+    app = afk_auto_help.AFKAutoHelpApp(root)
+    root.update_idletasks()
+    root.update()
+    result["window_ms"] = (time.perf_counter() - t0) * 1000.0
+    root.destroy()
+result["heavy"] = sorted(m for m in %r if m in sys.modules)
+print(json.dumps(result))
+""" % (HEAVY_MODULES,)
+
+
+def run_probe() -> dict:
+    """
+    Run one cold-start measurement in a fresh interpreter.
+
+    Returns:
+        dict: {"import_ms": float, "window_ms": float or None, "heavy": list}
+    """
+    output = subprocess.check_output(
+        [sys.executable, "-c", _PROBE],
+        cwd=SRC_DIR,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+    )
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def main() -> int:
+    """Run the benchmark and print a summary. Returns 1 if over budget."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts to measure")
+    args = parser.parse_args()
+
+    results = [run_probe() for _ in range(args.runs)]
+    import_ms = statistics.median(r["import_ms"] for r in results)
+    window_samples = [r["window_ms"] for r in results if r["window_ms"] is not None]
+    heavy = sorted(set(m for r in results for m in r["heavy"]))
+
+    ok = import_ms <= IMPORT_BUDGET_MS and not heavy
+    print(f"startup benchmark ({args.runs} cold starts, median)")
+    print(f"  import afk_auto_help: {import_ms:8.1f} ms  (budget {IMPORT_BUDGET_MS:.0f} ms)")
+    if window_samples:
+        window_ms = statistics.median(window_samples)
+        ok = ok and window_ms <= WINDOW_BUDGET_MS
+        print(f"  window drawn:         {window_ms:8.1f} ms  (budget {WINDOW_BUDGET_MS:.0f} ms)")
+    else:
+        print("  window drawn:              n/a  (no display)")
+    print(f"  heavy modules loaded: {', '.join(heavy) if heavy else 'none'}")
+    print(f"  result: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
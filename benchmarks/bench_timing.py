@@ -0,0 +1,72 @@
+"""
+AFK Auto-Help Benchmark: Humanized Timing Patterns
+
+Checks that the default timing profile still shows its human patterns at
+chop click rates: intervals are drawn from a seeded IntervalSchedule and
+micro-pauses (intervals longer than max_factor times the mean, which only
+a pause can produce) are counted against micro_pause_chance. At these
+rates the default pause is longer than that bound, so a clamp that
+swallows the pauses makes this fail.
+
+Reported per click rate: intervals drawn, pauses seen and expected, and
+the longest interval.
+
+Usage:
+    python benchmarks/bench_timing.py [--intervals 20000]
+"""
+
+import argparse
+import os
+import random
+import sys
+
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+import timing_model  # noqa: E402
+
+
+CLICK_RATES = (10.0, 15.0, 20.0)
+"""Chop click rates (clicks per second) to check."""
+MIN_PAUSE_RATIO = 0.5
+"""Pauses seen must be at least this fraction of the expected count."""
+
+
+def count_pauses(rate: float, intervals: int, seed: int = 1):
+    """
+    Draw intervals at a click rate with the default profile.
+
+    Returns:
+        tuple: (pauses seen, longest interval in seconds)
+    """
+    profile = timing_model.default_profile()
+    schedule = timing_model.IntervalSchedule(1.0 / rate, profile, rng=random.Random(seed))
+    schedule.start(0)
+    drawn = [schedule.next_interval() for _ in range(intervals)]
+    high = profile["max_factor"] / rate
+    pauses = sum(1 for interval in drawn if interval > high)
+    return pauses, max(drawn)
+
+
+def main() -> int:
+    """Run the check and print a summary. Returns 1 if pauses are missing."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--intervals", type=int, default=20000, help="Intervals drawn per click rate")
+    args = parser.parse_args()
+
+    chance = timing_model.default_profile()["micro_pause_chance"]
+    expected = chance * args.intervals
+    ok = True
+    print(f"timing benchmark ({args.intervals} intervals per rate, default profile)")
+    for rate in CLICK_RATES:
+        pauses, longest = count_pauses(rate, args.intervals)
+        ok = ok and pauses >= MIN_PAUSE_RATIO * expected
+        print(f"  {rate:4.0f} clicks/s: {pauses:5d} pauses (expected ~{expected:.0f}), "
+              f"longest {longest:.2f} s")
+    print(f"  result: {'PASS' if ok else 'FAIL'}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,21 +12,33 @@ Full implementation will be completed in Phase 1 (Core GUI Framework).
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
+from tkinter import simpledialog
 from typing import Optional
 
-from state import AppState
+from state import AppState, DEFAULT_SETTINGS_PATH, save_settings, load_settings
+from status_sink import StatusSink
 import ui_elements
-import region_selector
-import hunger_detection
-import worker_threads
 import threading
 
+# region_selector, hunger_detection and worker_threads are imported lazily
+# (inside the handlers that use them) so the window appears as quickly as
+# possible. The capture/input backends load on first capture or click.
+DEFERRED_MODULES = ("region_selector", "hunger_detection", "worker_threads")
+"""Application modules warmed up in the background after the window is shown."""
 
-class AFKAutoHelpApp:
+PRELOAD_DELAY_MS = 250
+"""Delay after startup before deferred modules are preloaded."""
+
+CHART_REFRESH_MS = 2000
+"""Interval between hunger chart refreshes."""
+
+
+class AFKAutoHelpApp(StatusSink):
     """
     Main application class for AFK Auto-Help GUI.
     
     Manages the Tkinter window, UI elements, and application state.
+    Also acts as the StatusSink for worker threads.
     """
     
     def __init__(self, root: tk.Tk):
@@ -48,6 +60,68 @@ class AFKAutoHelpApp:
         
         # Update status bar with initial state
         ui_elements.update_status_bar(self.status_bar, self.state.status_message)
+        
+        # Warm up deferred modules once the window is on screen
+        self.hotkeys = None
+        self.root.after(PRELOAD_DELAY_MS, self._start_preload)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+    
+    def _start_preload(self):
+        """Run _preload_modules() on a background thread so the UI stays responsive."""
+        threading.Thread(target=self._preload_modules, name="preload", daemon=True).start()
+    
+    def _preload_modules(self):
+        """
+        Import deferred application modules after the window is visible.
+        
+        Runs on a background thread; anything touching widgets is posted
+        back to the Tk thread with root.after(). A failure is reported there
+        too, since an exception would otherwise end the thread unnoticed.
+        """
+        try:
+            import importlib
+            for name in DEFERRED_MODULES:
+                importlib.import_module(name)
+            
+            # STOP ALL and pause/resume hotkeys that work while the game is in front
+            import global_hotkeys
+            self.hotkeys = global_hotkeys.start_listener(self.state, self)
+            
+            # Hunger history for the chart, kept across runs
+            import hunger_history
+            hunger_history.open_history(self.state)
+        except Exception as e:
+            message = f"Startup incomplete: {e}"
+            self.root.after(0, lambda: messagebox.showerror(
+                "Startup Failed",
+                f"{message}\n\nSome features may not work; see the console for details."
+            ))
+            self.safe_status_update(message)
+            raise
+        self.root.after(0, self._refresh_hunger_chart)
+    
+    def _refresh_hunger_chart(self):
+        """Redraw the hunger chart and its summary, then schedule the next refresh."""
+        history = self.state.hunger_history
+        now = history.time_source()
+        self.hunger_chart.refresh(history, self.state.hunger_threshold, now)
+        drain = history.drain_per_minute()
+        drain_text = f"{drain:.2f}%/min" if drain is not None else "--"
+        self.hunger_stats_label.config(
+            text=f"Drain: {drain_text}, Feeds: {history.feeds_per_hour():.1f}/h"
+        )
+        self.root.after(CHART_REFRESH_MS, self._refresh_hunger_chart)
+    
+    def _on_close(self):
+        """Save the hunger history, remove the frame ring and close the window."""
+        if self.state.hunger_history is not None:
+            try:
+                self.state.hunger_history.save()
+            except OSError as e:
+                messagebox.showwarning("Save Failed", f"Could not save hunger history:\n{e}")
+        import screen_capture
+        screen_capture.disable_frame_ring()
+        self.root.destroy()
     
     def safe_status_update(self, msg: str):
         """
@@ -62,6 +136,17 @@ class AFKAutoHelpApp:
         """
         self.root.after(0, lambda: ui_elements.update_status_bar(self.status_bar, msg))
     
+    def update_hunger(self, percent: float):
+        """
+        Thread-safe update of the current hunger label.
+        
+        Args:
+            percent: Hunger level as a value from 0.0 to 100.0
+        """
+        self.root.after(0, lambda: self.current_hunger_label.config(
+            text=f"Current Hunger: {percent:.1f}%"
+        ))
+    
     def _create_widgets(self):
         """Create and layout all GUI widgets."""
         # Main container
@@ -111,6 +196,24 @@ class AFKAutoHelpApp:
             command=self._on_stop_all
         )
         self.stop_button.pack()
+        
+        # Settings persistence (also used by the headless runner)
+        settings_frame = ttk.Frame(main_container)
+        settings_frame.pack(fill=tk.X)
+        
+        load_button = ttk.Button(
+            settings_frame,
+            text="Load Settings",
+            command=self._on_load_settings
+        )
+        load_button.pack(side=tk.RIGHT, padx=5)
+        
+        save_button = ttk.Button(
+            settings_frame,
+            text="Save Settings",
+            command=self._on_save_settings
+        )
+        save_button.pack(side=tk.RIGHT, padx=5)
     
     def _create_hunger_section(self):
         """Create UI elements for the Hunger Auto-Feed section."""
@@ -160,6 +263,15 @@ class AFKAutoHelpApp:
         threshold_entry.pack(side=tk.LEFT, padx=5)
         threshold_entry.bind("<FocusOut>", lambda e: self._on_hunger_threshold_changed())
         
+        # Stew hotkey (optional: select the stew before each feed click)
+        hotkey_frame = ttk.Frame(settings_frame)
+        hotkey_frame.pack(fill=tk.X, pady=2)
+        ttk.Label(hotkey_frame, text="Stew Hotkey (optional):").pack(side=tk.LEFT, padx=5)
+        self.stew_hotkey_var = tk.StringVar(value=self.state.stew_hotkey)
+        hotkey_entry = ttk.Entry(hotkey_frame, textvariable=self.stew_hotkey_var, width=10)
+        hotkey_entry.pack(side=tk.LEFT, padx=5)
+        hotkey_entry.bind("<FocusOut>", lambda e: self._on_stew_hotkey_changed())
+        
         # Record Hunger Region button
         record_region_button = ttk.Button(
             self.hunger_frame,
@@ -176,6 +288,22 @@ class AFKAutoHelpApp:
         )
         record_feed_button.pack(pady=5)
         
+        # Record Anchor button (keeps regions attached to the game window)
+        record_anchor_button = ttk.Button(
+            self.hunger_frame,
+            text="Record Anchor (static game icon)",
+            command=self._on_record_anchor
+        )
+        record_anchor_button.pack(pady=5)
+        
+        # Alternatively follow the game window's bounds, found by title
+        window_anchor_button = ttk.Button(
+            self.hunger_frame,
+            text="Anchor to Game Window",
+            command=self._on_anchor_to_window
+        )
+        window_anchor_button.pack(pady=5)
+        
         # Debug mode checkbox
         debug_frame = ttk.Frame(self.hunger_frame)
         debug_frame.pack(fill=tk.X, pady=5)
@@ -187,6 +315,16 @@ class AFKAutoHelpApp:
         )
         debug_checkbox.pack(anchor=tk.W, padx=5)
         
+        # Feed verification checkbox (monitor mode)
+        self.feed_verify_var = tk.BooleanVar(value=self.state.feed_verify)
+        verify_checkbox = ttk.Checkbutton(
+            debug_frame,
+            text="Verify Feed (watch hunger bar rise)",
+            variable=self.feed_verify_var,
+            command=self._on_feed_verify_changed
+        )
+        verify_checkbox.pack(anchor=tk.W, padx=5)
+        
         # Test Hunger Bar button
         test_hunger_button = ttk.Button(
             self.hunger_frame,
@@ -195,6 +333,14 @@ class AFKAutoHelpApp:
         )
         test_hunger_button.pack(pady=5)
         
+        # Calibrate Hunger Colors button
+        calibrate_button = ttk.Button(
+            self.hunger_frame,
+            text="Calibrate Hunger Colors",
+            command=self._on_calibrate_hunger
+        )
+        calibrate_button.pack(pady=5)
+        
         # Start Auto-Feed button
         start_feed_button = ttk.Button(
             self.hunger_frame,
@@ -226,6 +372,31 @@ class AFKAutoHelpApp:
             text=f"Hunger Region: {ui_elements.format_region_display(*self.state.hunger_region) if self.state.hunger_region else 'Not Set'}"
         )
         self.hunger_region_label.pack(anchor=tk.W, padx=5, pady=2)
+        
+        # Hunger history chart (filled once the history is loaded)
+        chart_frame = ttk.Frame(self.hunger_frame)
+        chart_frame.pack(fill=tk.X, pady=5)
+        
+        self.hunger_chart = ui_elements.HungerChart(chart_frame)
+        self.hunger_chart.canvas.pack(anchor=tk.W, padx=5)
+        
+        chart_controls = ttk.Frame(chart_frame)
+        chart_controls.pack(fill=tk.X)
+        
+        self.chart_range_var = tk.StringVar(value=self.hunger_chart.range_name)
+        chart_range = ttk.Combobox(
+            chart_controls,
+            textvariable=self.chart_range_var,
+            values=list(ui_elements.CHART_RANGES),
+            state="readonly",
+            width=12
+        )
+        chart_range.pack(side=tk.LEFT, padx=5)
+        chart_range.bind("<<ComboboxSelected>>",
+                         lambda e: self.hunger_chart.set_range(self.chart_range_var.get()))
+        
+        self.hunger_stats_label = ttk.Label(chart_controls, text="Drain: --, Feeds: --")
+        self.hunger_stats_label.pack(side=tk.LEFT, padx=5)
     
     def _create_chop_section(self):
         """Create UI elements for the Auto-Chop Tool section."""
@@ -255,6 +426,28 @@ class AFKAutoHelpApp:
         )
         record_chop_button.pack(pady=5)
         
+        # Record Chop Target button (optional: stop when the target is gone)
+        record_target_button = ttk.Button(
+            self.chop_frame,
+            text="Record Chop Target",
+            command=self._on_record_chop_target
+        )
+        record_target_button.pack(pady=5)
+        
+        # Chop plan: several targets chopped back to back
+        plan_frame = ttk.Frame(self.chop_frame)
+        plan_frame.pack(pady=5)
+        ttk.Button(
+            plan_frame,
+            text="Add Plan Target",
+            command=self._on_add_plan_target
+        ).pack(side=tk.LEFT, padx=2)
+        ttk.Button(
+            plan_frame,
+            text="Clear Plan",
+            command=self._on_clear_plan
+        ).pack(side=tk.LEFT, padx=2)
+        
         # Start/Stop Auto-Chop button
         self.auto_chop_button = ttk.Button(
             self.chop_frame,
@@ -272,6 +465,15 @@ class AFKAutoHelpApp:
             text=f"Chop Trigger: {ui_elements.format_coordinate_display(*self.state.chop_trigger) if self.state.chop_trigger else 'Not Set'}"
         )
         self.chop_trigger_label.pack(anchor=tk.W, padx=5, pady=2)
+        
+        self.chop_target_label = ttk.Label(
+            info_frame,
+            text=f"Chop Target: {ui_elements.format_region_display(*self.state.chop_target_region) if self.state.chop_target_region else 'Not Set'}"
+        )
+        self.chop_target_label.pack(anchor=tk.W, padx=5, pady=2)
+        
+        self.chop_plan_label = ttk.Label(info_frame, text=self._chop_plan_text())
+        self.chop_plan_label.pack(anchor=tk.W, padx=5, pady=2)
     
     # Event handlers (placeholder implementations)
     
@@ -283,6 +485,14 @@ class AFKAutoHelpApp:
             f"Feed mode changed to: {self.state.feed_mode}"
         )
     
+    def _on_feed_verify_changed(self):
+        """Handle Verify Feed checkbox change."""
+        self.state.feed_verify = self.feed_verify_var.get()
+        ui_elements.update_status_bar(
+            self.status_bar,
+            f"Feed verification {'enabled' if self.state.feed_verify else 'disabled'}"
+        )
+    
     def _on_timer_interval_changed(self):
         """Handle timer interval entry change."""
         try:
@@ -313,6 +523,15 @@ class AFKAutoHelpApp:
         except ValueError:
             ui_elements.update_status_bar(self.status_bar, "Invalid hunger threshold value")
     
+    def _on_stew_hotkey_changed(self):
+        """Handle stew hotkey entry change."""
+        self.state.stew_hotkey = self.stew_hotkey_var.get().strip()
+        ui_elements.update_status_bar(
+            self.status_bar,
+            f"Stew hotkey set to: {self.state.stew_hotkey}" if self.state.stew_hotkey
+            else "Stew hotkey cleared - keep the stew selected"
+        )
+    
     def _on_test_hunger_bar(self):
         """Handle Test Hunger Bar button click."""
         # Check if hunger region is set
@@ -330,7 +549,10 @@ class AFKAutoHelpApp:
         
         # Perform hunger detection
         try:
-            hunger_percentage = hunger_detection.read_hunger_percentage(self.state.hunger_region)
+            import hunger_detection
+            hunger_percentage = hunger_detection.read_hunger_percentage(
+                self.state.hunger_region, self.state.hunger_thresholds
+            )
             hunger_percent = hunger_percentage * 100.0
             
             # Update GUI labels
@@ -359,9 +581,91 @@ class AFKAutoHelpApp:
             )
             self.current_hunger_label.config(text="Current Hunger: Error")
     
+    def _on_calibrate_hunger(self):
+        """
+        Open the hunger color calibration wizard.
+        
+        The user captures the bar once full and once nearly empty; the
+        thresholds fitted from the two captures are shown with their
+        accuracy and only stored when Apply is pressed.
+        """
+        if not self.state.hunger_region:
+            messagebox.showerror(
+                "No Hunger Region",
+                "Please record a hunger region before calibrating."
+            )
+            return
+        
+        import hunger_detection
+        import screen_capture
+        
+        wizard = tk.Toplevel(self.root)
+        wizard.title("Calibrate Hunger Colors")
+        wizard.resizable(False, False)
+        captures = {}
+        result = {}
+        
+        ttk.Label(
+            wizard,
+            text="1. Fill the hunger bar and press Capture Full.\n"
+                 "2. Let it drain to near empty and press Capture Near-Empty.\n"
+                 "3. Check the accuracy and press Apply.",
+            justify=tk.LEFT
+        ).pack(padx=10, pady=(10, 5), anchor=tk.W)
+        result_label = ttk.Label(wizard, text="No captures yet")
+        result_label.pack(padx=10, pady=5, anchor=tk.W)
+        
+        def _capture(kind):
+            try:
+                captures[kind] = screen_capture.capture_region(self.state.hunger_region)
+            except Exception as e:
+                result_label.config(text=f"Capture failed: {e}")
+                return
+            if len(captures) < 2:
+                result_label.config(text=f"Captured {kind} bar")
+                return
+            try:
+                result["thresholds"] = hunger_detection.calibrate_thresholds(
+                    captures["full"], captures["empty"], self.state.hunger_region[2]
+                )
+            except ValueError as e:
+                result.pop("thresholds", None)
+                result_label.config(text=str(e))
+                return
+            t = result["thresholds"]
+            apply_button.config(state=tk.NORMAL)
+            result_label.config(
+                text=f"Bar color {tuple(t['color'])}, radius {t['radius']:.1f}, "
+                     f"sample rate {t['sample_rate']}\n"
+                     f"Accuracy: {t['accuracy'] * 100:.1f}%"
+            )
+        
+        def _apply():
+            self.state.hunger_thresholds = result["thresholds"]
+            ui_elements.update_status_bar(self.status_bar, "Hunger colors calibrated")
+            wizard.destroy()
+        
+        def _reset():
+            self.state.hunger_thresholds = None
+            ui_elements.update_status_bar(self.status_bar, "Hunger colors reset to defaults")
+            wizard.destroy()
+        
+        buttons = ttk.Frame(wizard)
+        buttons.pack(padx=10, pady=10)
+        ttk.Button(buttons, text="Capture Full", command=lambda: _capture("full")).pack(side=tk.LEFT, padx=2)
+        ttk.Button(buttons, text="Capture Near-Empty", command=lambda: _capture("empty")).pack(side=tk.LEFT, padx=2)
+        apply_button = ttk.Button(buttons, text="Apply", command=_apply, state=tk.DISABLED)
+        apply_button.pack(side=tk.LEFT, padx=2)
+        ttk.Button(buttons, text="Use Defaults", command=_reset).pack(side=tk.LEFT, padx=2)
+    
     def _on_record_hunger_region(self):
         """Handle Record Hunger Region button click."""
-        region_selector.select_region(self._handle_hunger_region_selected)
+        import region_selector
+        import hunger_detection
+        region_selector.select_region(
+            self._handle_hunger_region_selected,
+            preview_classifier=hunger_detection.make_pixel_classifier(self.state.hunger_thresholds)
+        )
     
     def _handle_hunger_region_selected(self, region):
         """
@@ -386,9 +690,66 @@ class AFKAutoHelpApp:
                 "Hunger region selection cancelled"
             )
     
+    def _on_record_anchor(self):
+        """Handle Record Anchor button click."""
+        import region_selector
+        region_selector.select_region(self._handle_anchor_selected)
+    
+    def _handle_anchor_selected(self, region):
+        """
+        Handle anchor region selection callback.
+        
+        Args:
+            region: Tuple (x, y, width, height) or None if cancelled
+        """
+        if region is None:
+            ui_elements.update_status_bar(self.status_bar, "Anchor selection cancelled")
+            return
+        
+        def _capture():
+            import region_anchor
+            try:
+                region_anchor.record_template_anchor(self.state, region)
+            except Exception as e:
+                ui_elements.update_status_bar(self.status_bar, f"Error recording anchor: {e}")
+                return
+            ui_elements.update_status_bar(
+                self.status_bar,
+                f"Anchor recorded: {ui_elements.format_region_display(*region)}"
+            )
+        
+        # Capture once the overlay has disappeared from the screen
+        self.root.after(150, _capture)
+    
+    def _on_anchor_to_window(self):
+        """Handle Anchor to Game Window button click."""
+        title = simpledialog.askstring(
+            "Anchor to Game Window",
+            "Part of the game window's title or app name:",
+            initialvalue=self.state.anchor_window_title or "Roblox",
+            parent=self.root
+        )
+        if not title or not title.strip():
+            ui_elements.update_status_bar(self.status_bar, "Window anchor cancelled")
+            return
+        
+        import region_anchor
+        title = title.strip()
+        if region_anchor.record_window_anchor(self.state, title):
+            ui_elements.update_status_bar(
+                self.status_bar,
+                f"Anchored to window \"{title}\": {ui_elements.format_region_display(*self.state.anchor_region)}"
+            )
+        else:
+            ui_elements.update_status_bar(self.status_bar, f"No window found matching \"{title}\"")
+    
     def _on_record_feed_trigger(self):
         """Handle Record Feed Trigger button click."""
-        region_selector.select_point(self._handle_feed_trigger_selected)
+        import region_selector
+        region_selector.select_point(
+            self._handle_feed_trigger_selected,
+            on_signature=lambda signature: setattr(self.state, "feed_trigger_signature", signature)
+        )
     
     def _handle_feed_trigger_selected(self, point):
         """
@@ -400,6 +761,12 @@ class AFKAutoHelpApp:
         if point is not None:
             x, y = point
             self.state.feed_trigger = (x, y)
+            if self.state.feed_trigger_signature is None:
+                # No overlay snapshot; read the pixels once the overlay is gone
+                import click_guard
+                self.root.after(150, lambda: setattr(
+                    self.state, "feed_trigger_signature", click_guard.capture_signature((x, y))
+                ))
             coord_text = ui_elements.format_coordinate_display(x, y)
             self.feed_trigger_label.config(
                 text=f"Feed Trigger: {coord_text}"
@@ -416,7 +783,11 @@ class AFKAutoHelpApp:
     
     def _on_record_chop_trigger(self):
         """Handle Record Chop Trigger button click."""
-        region_selector.select_point(self._handle_chop_trigger_selected)
+        import region_selector
+        region_selector.select_point(
+            self._handle_chop_trigger_selected,
+            on_signature=lambda signature: setattr(self.state, "chop_trigger_signature", signature)
+        )
     
     def _handle_chop_trigger_selected(self, point):
         """
@@ -428,6 +799,12 @@ class AFKAutoHelpApp:
         if point is not None:
             x, y = point
             self.state.chop_trigger = (x, y)
+            if self.state.chop_trigger_signature is None:
+                # No overlay snapshot; read the pixels once the overlay is gone
+                import click_guard
+                self.root.after(150, lambda: setattr(
+                    self.state, "chop_trigger_signature", click_guard.capture_signature((x, y))
+                ))
             coord_text = ui_elements.format_coordinate_display(x, y)
             self.chop_trigger_label.config(
                 text=f"Chop Trigger: {coord_text}"
@@ -442,6 +819,76 @@ class AFKAutoHelpApp:
                 "Chop trigger selection cancelled"
             )
     
+    def _on_record_chop_target(self):
+        """Handle Record Chop Target button click."""
+        import region_selector
+        region_selector.select_region(self._handle_chop_target_selected)
+    
+    def _handle_chop_target_selected(self, region):
+        """
+        Handle chop target region selection callback.
+        
+        Args:
+            region: Tuple (x, y, width, height) or None if cancelled
+        """
+        if region is not None:
+            self.state.chop_target_region = region
+            region_text = ui_elements.format_region_display(*region)
+            self.chop_target_label.config(
+                text=f"Chop Target: {region_text}"
+            )
+            ui_elements.update_status_bar(
+                self.status_bar,
+                f"Chop target recorded: {region_text}"
+            )
+        else:
+            ui_elements.update_status_bar(
+                self.status_bar,
+                "Chop target selection cancelled"
+            )
+    
+    def _chop_plan_text(self) -> str:
+        """Return the chop plan label text."""
+        count = len(self.state.chop_plan or [])
+        return f"Chop Plan: {count} target{'s' if count != 1 else ''}" if count else "Chop Plan: Not Set"
+    
+    def _on_add_plan_target(self):
+        """Handle Add Plan Target button click: record a point, then its target region."""
+        import region_selector
+        signature = []
+        
+        def _on_point(point):
+            if point is None:
+                ui_elements.update_status_bar(self.status_bar, "Plan target cancelled")
+                return
+            
+            def _on_region(region):
+                # Esc skips completion detection; the target is chopped for
+                # the chop duration
+                entry = {"point": point, "signature": signature[0] if signature else None}
+                if region is not None:
+                    entry["target_region"] = region
+                self.state.chop_plan = list(self.state.chop_plan or []) + [entry]
+                self.chop_plan_label.config(text=self._chop_plan_text())
+                ui_elements.update_status_bar(
+                    self.status_bar,
+                    f"Plan target added: {ui_elements.format_coordinate_display(*point)}"
+                )
+            
+            ui_elements.update_status_bar(
+                self.status_bar,
+                "Select the target to watch (ESC to chop for the full duration)"
+            )
+            region_selector.select_region(_on_region)
+        
+        region_selector.select_point(_on_point, on_signature=signature.append)
+    
+    def _on_clear_plan(self):
+        """Handle Clear Plan button click."""
+        self.state.chop_plan = []
+        self.chop_plan_label.config(text=self._chop_plan_text())
+        ui_elements.update_status_bar(self.status_bar, "Chop plan cleared")
+    
     def _on_auto_chop_button_pressed(self):
         """Handle Auto-Chop button click (Start/Stop toggle)."""
         if self.state.chop_running:
@@ -456,11 +903,11 @@ class AFKAutoHelpApp:
         else:
             # This is a start request
             # Validate required settings
-            if self.state.chop_trigger is None:
+            if self.state.chop_trigger is None and not self.state.chop_plan:
                 messagebox.showerror(
                     "Missing Configuration",
                     "Chop trigger coordinate is required.\n"
-                    "Please record a chop trigger first."
+                    "Please record a chop trigger or add plan targets first."
                 )
                 return
             
@@ -492,6 +939,7 @@ class AFKAutoHelpApp:
             )
             
             # Create and start worker thread
+            import worker_threads
             thread = threading.Thread(
                 target=worker_threads.auto_chop_worker,
                 args=(self, self.state),
@@ -614,6 +1062,8 @@ class AFKAutoHelpApp:
         # Reset stop flag
         self.state.stop_all_flag = False
         
+        import worker_threads
+        
         # Start appropriate worker thread based on feed mode
         if self.state.feed_mode == "TIMER":
             # Validate timer interval
@@ -659,6 +1109,69 @@ class AFKAutoHelpApp:
                 f"Hunger monitoring started: feeding when hunger ≤ {self.state.hunger_threshold}%"
             )
     
+    def _on_save_settings(self):
+        """Handle Save Settings button click."""
+        try:
+            import display_geometry
+            display_geometry.store_normalized(self.state)
+            save_settings(self.state, DEFAULT_SETTINGS_PATH)
+            ui_elements.update_status_bar(
+                self.status_bar,
+                f"Settings saved to {DEFAULT_SETTINGS_PATH}"
+            )
+        except OSError as e:
+            messagebox.showerror("Save Failed", f"Could not save settings:\n{e}")
+    
+    def _on_load_settings(self):
+        """Handle Load Settings button click."""
+        try:
+            load_settings(DEFAULT_SETTINGS_PATH, self.state)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Load Failed", f"Could not load settings:\n{e}")
+            return
+        
+        # Map saved coordinates onto the current displays; without monitor
+        # information the coordinates are used as saved
+        import display_geometry
+        import screen_capture
+        try:
+            display_geometry.apply_normalized(self.state)
+        except display_geometry.DisplayError as e:
+            messagebox.showwarning(
+                "Displays Unknown",
+                f"Could not map saved coordinates to the current displays:\n{e}\n\n"
+                "Using the coordinates as saved."
+            )
+        ring_error = screen_capture.configure_frame_ring(self.state)
+        if ring_error:
+            messagebox.showwarning("Frame Ring Unavailable", ring_error)
+        
+        # Refresh input fields and labels from the loaded state
+        self.feed_mode_var.set(self.state.feed_mode)
+        self.feed_verify_var.set(self.state.feed_verify)
+        self.timer_interval_var.set(str(self.state.timer_interval_minutes))
+        self.hunger_threshold_var.set(str(self.state.hunger_threshold))
+        self.stew_hotkey_var.set(self.state.stew_hotkey)
+        self.chop_rate_var.set(str(self.state.chop_click_rate))
+        self.chop_duration_var.set(str(self.state.chop_duration))
+        self.feed_trigger_label.config(
+            text=f"Feed Trigger: {ui_elements.format_coordinate_display(*self.state.feed_trigger) if self.state.feed_trigger else 'Not Set'}"
+        )
+        self.hunger_region_label.config(
+            text=f"Hunger Region: {ui_elements.format_region_display(*self.state.hunger_region) if self.state.hunger_region else 'Not Set'}"
+        )
+        self.chop_trigger_label.config(
+            text=f"Chop Trigger: {ui_elements.format_coordinate_display(*self.state.chop_trigger) if self.state.chop_trigger else 'Not Set'}"
+        )
+        self.chop_target_label.config(
+            text=f"Chop Target: {ui_elements.format_region_display(*self.state.chop_target_region) if self.state.chop_target_region else 'Not Set'}"
+        )
+        self.chop_plan_label.config(text=self._chop_plan_text())
+        ui_elements.update_status_bar(
+            self.status_bar,
+            f"Settings loaded from {DEFAULT_SETTINGS_PATH}"
+        )
+    
     def _on_stop_all(self):
         """Handle STOP ALL button click."""
         # Check if any worker is running
@@ -0,0 +1,201 @@
+"""
+AFK Auto-Help Module: Headless Runner
+
+Runs the automation workers from a saved settings file without creating
+any Tkinter window. Status updates go to the console and, optionally, a
+log file. Intended for running under a process supervisor.
+
+Usage:
+    python src/afk_headless.py --config ~/.afk_auto_help.json --task feed --task chop
+    python src/afk_headless.py --sessions sessions.json   (see multi_session)
+    python src/afk_headless.py --control-socket /tmp/afk.sock   (see control_server)
+"""
+
+import argparse
+import logging
+import signal
+import sys
+import threading
+from typing import List, Optional
+
+import display_geometry
+import global_hotkeys
+import screen_capture
+from state import DEFAULT_SETTINGS_PATH, load_settings
+from status_sink import LoggingStatusSink, RecordingStatusSink
+from task_runner import TASK_NAMES, TaskRunner
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+
+    Args:
+        argv: Argument list (defaults to sys.argv[1:])
+
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Run AFK Auto-Help without the GUI.")
+    parser.add_argument(
+        "--config", default=DEFAULT_SETTINGS_PATH,
+        help="Settings file saved from the GUI (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--task", action="append", choices=TASK_NAMES, dest="tasks",
+        help="Task to run; may be given more than once (default: feed)"
+    )
+    parser.add_argument(
+        "--sessions", default=None,
+        help="Run several game sessions from a sessions file instead of --config/--task"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=None,
+        help="Stop after this many seconds (default: run until interrupted)"
+    )
+    parser.add_argument(
+        "--control-socket", default=None,
+        help="Accept control commands on this Unix socket; keeps running while idle "
+             "and starts no task unless --task is given"
+    )
+    parser.add_argument(
+        "--history", default=None,
+        help="Record hunger readings and feeds to this history file (see hunger_history)"
+    )
+    parser.add_argument("--log-file", default=None, help="Also write status to this file")
+    parser.add_argument("--quiet", action="store_true", help="Only log warnings to the console")
+    args = parser.parse_args(argv)
+    if args.sessions:
+        # Each session brings its own settings, tasks and history
+        incompatible = [flag for flag, given in (
+            ("--config", args.config != DEFAULT_SETTINGS_PATH),
+            ("--task", args.tasks),
+            ("--control-socket", args.control_socket),
+            ("--history", args.history),
+        ) if given]
+        if incompatible:
+            parser.error(f"--sessions cannot be combined with {', '.join(incompatible)}")
+    return args
+
+
+def configure_logging(log_file: Optional[str], quiet: bool) -> logging.Logger:
+    """
+    Set up console (and optional file) logging for the headless runner.
+
+    Args:
+        log_file: Path of an additional log file, or None
+        quiet: If True, only warnings and errors go to the console
+
+    Returns:
+        logging.Logger: The "afk_auto_help" logger
+    """
+    logger = logging.getLogger("afk_auto_help")
+    logger.setLevel(logging.INFO)
+    formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
+
+    console = logging.StreamHandler()
+    console.setLevel(logging.WARNING if quiet else logging.INFO)
+    console.setFormatter(formatter)
+    logger.addHandler(console)
+
+    if log_file:
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        logger.addHandler(file_handler)
+
+    return logger
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point for the headless runner.
+
+    Returns:
+        int: Process exit code (0 on clean shutdown)
+    """
+    args = parse_args(argv)
+    logger = configure_logging(args.log_file, args.quiet)
+
+    if args.sessions:
+        import multi_session
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+        return multi_session.run_sessions_file(args.sessions, args.duration, stop_event, logger)
+
+    try:
+        state = load_settings(args.config)
+        display_geometry.apply_normalized(state)
+        ring_error = screen_capture.configure_frame_ring(state)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load settings from {args.config}: {e}")
+        return 2
+    if ring_error:
+        logger.warning(ring_error)
+
+    if args.history:
+        import hunger_history
+        hunger_history.open_history(state, args.history)
+
+    sink = RecordingStatusSink(LoggingStatusSink(state, logger))
+    runner = TaskRunner(state, sink)
+
+    control = None
+    if args.control_socket:
+        import control_server
+        control = control_server.ControlServer(state, runner, sink, args.control_socket)
+        error = control.start()
+        if error is not None:
+            logger.error(error)
+            return 2
+        logger.info(f"Control server listening on {args.control_socket}")
+
+    stop_event = threading.Event()
+
+    def on_signal(signum, frame):
+        logger.info(f"Received signal {signum}, stopping")
+        stop_event.set()
+
+    signal.signal(signal.SIGINT, on_signal)
+    signal.signal(signal.SIGTERM, on_signal)
+
+    hotkeys = global_hotkeys.start_listener(state, sink)
+
+    for task in args.tasks or ([] if control else ["feed"]):
+        error = runner.start(task)
+        if error is not None:
+            logger.error(f"Cannot start {task}: {error}")
+            runner.stop_all()
+            if control is not None:
+                control.stop()
+            return 2
+        logger.info(f"Started task: {task}")
+
+    # Wait until interrupted, the duration elapses, or every worker exits
+    # on its own (auto-chop alone finishes after chop_duration). With a
+    # control server, idle is normal: tasks may be started later.
+    waited = 0.0
+    while not stop_event.wait(0.25):
+        waited += 0.25
+        if args.duration is not None and waited >= args.duration:
+            break
+        if control is None and runner.is_idle():
+            break
+
+    runner.stop_all()
+    if control is not None:
+        control.stop()
+    if hotkeys is not None:
+        hotkeys.stop()
+    if state.hunger_history is not None:
+        try:
+            state.hunger_history.save()
+        except OSError as e:
+            logger.warning(f"Could not save hunger history: {e}")
+    screen_capture.disable_frame_ring()
+    logger.info("Headless runner stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""
+AFK Auto-Help Module: Chop Targets
+
+Lets auto-chop stop as soon as there is nothing left to chop instead of
+clicking for the full chop_duration. The user selects a target region
+(AppState.chop_target_region) that the worker re-captures a couple of
+times per second while clicking:
+
+- GONE:     the region shows the tree/rock itself; the target is done
+            once the region no longer looks like it did when chopping
+            started
+- PROGRESS: the region covers a progress bar that fills left to right;
+            the target is done once the bar has been seen partly filled
+            and its right end then looks like its left end (full, or
+            gone together with the tree)
+
+Captures are reduced to small grayscale thumbnails, so a check is cheap.
+chop_duration still caps each target.
+
+Several targets can be chopped back to back with a chop plan
+(AppState.chop_plan), a list of entries like
+
+    {"point": [x, y], "duration": 20, "target_region": [x, y, w, h],
+     "target_mode": "GONE", "signature": [...]}
+
+where everything but "point" is optional (defaults: chop_duration,
+no completion detection, chop_target_mode, no click guard). Saved entries
+also carry "point_norm" and "target_region_norm" (see display_geometry).
+order_plan() sorts the entries to keep pointer travel between targets short.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import screen_capture
+
+
+TARGET_GONE = "GONE"
+TARGET_PROGRESS = "PROGRESS"
+TARGET_MODES = (TARGET_GONE, TARGET_PROGRESS)
+
+TARGET_CHECK_INTERVAL = 0.5
+"""Seconds between target checks while chopping."""
+TARGET_THUMB_SIZE = 16
+"""Captures are reduced to at most this many pixels per side."""
+TARGET_CHANGE_THRESHOLD = 24
+"""Mean gray-level difference (0-255) that counts as a different picture."""
+TARGET_CONFIRM_CHECKS = 2
+"""Consecutive checks that must agree before a target counts as done."""
+
+
+def capture_thumbnail(region: Tuple[int, int, int, int]):
+    """
+    Capture a region as a small grayscale thumbnail.
+
+    Args:
+        region: Logical (x, y, width, height)
+
+    Returns:
+        PIL.Image: Mode "L" image of at most TARGET_THUMB_SIZE per side
+    """
+    image = screen_capture.grab(region, publish=False).convert("L")
+    width, height = image.size
+    size = (min(width, TARGET_THUMB_SIZE), min(height, TARGET_THUMB_SIZE))
+    return image.resize(size) if size != image.size else image
+
+
+def mean_difference(a: bytes, b: bytes) -> float:
+    """Return the mean absolute difference of two equally sized byte strings."""
+    if not a or len(a) != len(b):
+        return 255.0
+    return sum(abs(x - y) for x, y in zip(a, b)) / len(a)
+
+
+def _edge_columns(thumbnail) -> Tuple[bytes, bytes]:
+    """Return the leftmost and rightmost pixel columns of a thumbnail."""
+    width, height = thumbnail.size
+    data = thumbnail.tobytes()
+    left = bytes(data[row * width] for row in range(height))
+    right = bytes(data[row * width + width - 1] for row in range(height))
+    return left, right
+
+
+class TargetWatch:
+    """Decides when the current chop target is done."""
+
+    def __init__(self, region: Tuple[int, int, int, int], mode: str = TARGET_GONE, clock=None):
+        """
+        Record the target's starting look.
+
+        Args:
+            region: Logical (x, y, width, height) to watch
+            mode: TARGET_GONE or TARGET_PROGRESS
+            clock: Time source (default: real time)
+
+        Raises:
+            ValueError: If mode is unknown
+        """
+        if mode not in TARGET_MODES:
+            raise ValueError(f"Unknown chop target mode: {mode}")
+        if clock is None:
+            from clock import REAL_CLOCK
+            clock = REAL_CLOCK
+        self.region = tuple(region)
+        self.mode = mode
+        self.clock = clock
+        self.baseline = capture_thumbnail(self.region).tobytes() if mode == TARGET_GONE else None
+        self.progress_seen = False
+        self.agreeing = 0
+        self.interval = TARGET_CHECK_INTERVAL
+        """Seconds between checks; may be stretched by the CPU governor."""
+        self.next_check = clock.now() + self.interval
+
+    def _looks_done(self) -> bool:
+        """Capture the region once and apply the mode's rule."""
+        thumbnail = capture_thumbnail(self.region)
+        if self.mode == TARGET_GONE:
+            return mean_difference(thumbnail.tobytes(), self.baseline) >= TARGET_CHANGE_THRESHOLD
+        left, right = _edge_columns(thumbnail)
+        ends_differ = mean_difference(left, right) >= TARGET_CHANGE_THRESHOLD
+        if ends_differ:
+            self.progress_seen = True
+            return False
+        return self.progress_seen
+
+    def done(self) -> bool:
+        """
+        Check the target if a check is due.
+
+        Returns:
+            bool: True once the target has looked done for
+                  TARGET_CONFIRM_CHECKS consecutive checks
+        """
+        now = self.clock.now()
+        if now < self.next_check:
+            return False
+        self.next_check = now + self.interval
+        self.agreeing = self.agreeing + 1 if self._looks_done() else 0
+        return self.agreeing >= TARGET_CONFIRM_CHECKS
+
+
+def watch_for(state, region: Optional[Tuple[int, int, int, int]] = None,
+              mode: Optional[str] = None) -> Optional[TargetWatch]:
+    """
+    Create a TargetWatch from the state's chop target settings.
+
+    Args:
+        state: AppState instance
+        region: Target region (default: state.chop_target_region)
+        mode: Target mode (default: state.chop_target_mode)
+
+    Returns:
+        TargetWatch, or None if no target region is configured
+    """
+    region = region if region is not None else state.chop_target_region
+    if region is None:
+        return None
+    return TargetWatch(region, mode or state.chop_target_mode, clock=state.clock)
+
+
+def plan_from_state(state) -> List[Dict[str, Any]]:
+    """
+    Return the chop targets to work through, in stored order.
+
+    Args:
+        state: AppState instance
+
+    Returns:
+        list: Plan entries with all keys present, plus "anchor": the
+              state's anchor_region the coordinates are relative to;
+              state.chop_plan if it has entries, otherwise a single entry
+              for state.chop_trigger (empty if neither is set)
+    """
+    entries = state.chop_plan or []
+    if not entries:
+        if state.chop_trigger is None:
+            return []
+        entries = [{
+            "point": state.chop_trigger,
+            "target_region": state.chop_target_region,
+            "signature": state.chop_trigger_signature,
+        }]
+    anchor = tuple(state.anchor_region) if state.anchor_region else None
+    plan = []
+    for entry in entries:
+        region = entry.get("target_region")
+        plan.append({
+            "point": tuple(entry["point"]),
+            "duration": entry.get("duration") or state.chop_duration,
+            "target_region": tuple(region) if region else None,
+            "target_mode": entry.get("target_mode") or state.chop_target_mode,
+            "signature": entry.get("signature"),
+            "anchor": anchor,
+        })
+    return plan
+
+
+def _travel(points: Sequence[Tuple[int, int]], start: Tuple[int, int]) -> float:
+    """Return the pointer path length from start through all points."""
+    total = 0.0
+    previous = start
+    for point in points:
+        total += ((point[0] - previous[0]) ** 2 + (point[1] - previous[1]) ** 2) ** 0.5
+        previous = point
+    return total
+
+
+def order_plan(plan: List[Dict[str, Any]],
+               start: Optional[Tuple[int, int]] = None) -> List[Dict[str, Any]]:
+    """
+    Order plan entries to keep pointer travel short.
+
+    Builds a nearest-neighbour path from the start position and then
+    improves it with 2-opt moves (reversing sub-paths while that shortens
+    the total). Plans hold a handful of targets, so this is instant.
+
+    Args:
+        plan: Entries from plan_from_state()
+        start: Current pointer position (default: the first entry's point)
+
+    Returns:
+        list: The same entries in travel order
+    """
+    if len(plan) < 2:
+        return list(plan)
+    remaining = list(plan)
+    position = start if start is not None else remaining[0]["point"]
+    ordered = []
+    while remaining:
+        nearest = min(remaining, key=lambda e: (e["point"][0] - position[0]) ** 2
+                      + (e["point"][1] - position[1]) ** 2)
+        remaining.remove(nearest)
+        ordered.append(nearest)
+        position = nearest["point"]
+
+    origin = start if start is not None else ordered[0]["point"]
+    improved = True
+    while improved:
+        improved = False
+        points = [entry["point"] for entry in ordered]
+        best = _travel(points, origin)
+        for i in range(len(ordered) - 1):
+            for j in range(i + 2, len(ordered) + 1):
+                candidate = ordered[:i] + ordered[i:j][::-1] + ordered[j:]
+                length = _travel([entry["point"] for entry in candidate], origin)
+                if length < best - 1e-9:
+                    ordered, best, improved = candidate, length, True
+    return ordered
@@ -0,0 +1,149 @@
+"""
+AFK Auto-Help Module: Pre-Click Pixel Guard
+
+Checks that the screen under a trigger still looks as it did when the
+trigger was recorded, so a moved window, an open menu or another app in
+front does not receive feed or chop clicks.
+
+A signature is a handful of pixels around the trigger point, stored as
+[dx, dy, r, g, b] lists (logical offsets, JSON-friendly). Recording takes
+them from the overlay's screen snapshot (see region_selector.select_point);
+checking grabs only the tiny square that holds them. The pixel work is far
+below a millisecond, so the cost of a check is the capture itself: about a
+millisecond with mss, but tens of milliseconds with PIL.ImageGrab on macOS,
+which starts a screencapture process per grab. Auto-chop therefore checks
+every click only with a fast backend (see check_stride()).
+"""
+
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+import screen_capture
+
+
+SIGNATURE_RADIUS = 4
+"""Distance in logical pixels of the outer samples from the trigger point."""
+SIGNATURE_OFFSETS = (
+    (0, 0),
+    (-SIGNATURE_RADIUS, 0), (SIGNATURE_RADIUS, 0),
+    (0, -SIGNATURE_RADIUS), (0, SIGNATURE_RADIUS),
+    (-SIGNATURE_RADIUS, -SIGNATURE_RADIUS), (SIGNATURE_RADIUS, -SIGNATURE_RADIUS),
+    (-SIGNATURE_RADIUS, SIGNATURE_RADIUS), (SIGNATURE_RADIUS, SIGNATURE_RADIUS),
+)
+"""Sample positions relative to the trigger point."""
+SIGNATURE_TOLERANCE = 24
+"""Largest per-channel difference for a sample to still match."""
+SIGNATURE_MIN_MATCH = 0.6
+"""Fraction of samples that must match (hover effects change a few)."""
+
+GUARD_RETRIES = 3
+"""Extra checks before a feed click is skipped."""
+GUARD_RETRY_DELAY = 0.2
+"""Seconds between those checks."""
+SLOW_CAPTURE_STRIDE = 5
+"""Chop clicks per check when screen capture is slow (see check_stride())."""
+
+Signature = List[List[int]]
+
+
+def check_stride() -> int:
+    """
+    Return N for checking only every Nth chop click.
+
+    Returns:
+        int: 1 with a fast capture backend, SLOW_CAPTURE_STRIDE on macOS
+             without mss, where every grab starts a subprocess
+    """
+    if sys.platform == "darwin" and screen_capture.backend_name() != "mss":
+        return SLOW_CAPTURE_STRIDE
+    return 1
+
+
+def signature_from_image(image, scale: float, x: int, y: int,
+                         origin: Tuple[int, int] = (0, 0)) -> Optional[Signature]:
+    """
+    Read a trigger signature from an already captured image.
+
+    Args:
+        image: PIL.Image in RGB at physical resolution
+        scale: Physical pixels per logical pixel
+        x: Logical x of the trigger point
+        y: Logical y of the trigger point
+        origin: Logical (x, y) of the image's top-left corner
+
+    Returns:
+        list: [dx, dy, r, g, b] per sample, or None if the samples do not
+              lie inside the image
+    """
+    width, height = image.size
+    signature = []
+    for dx, dy in SIGNATURE_OFFSETS:
+        px = int((x + dx - origin[0]) * scale)
+        py = int((y + dy - origin[1]) * scale)
+        if not (0 <= px < width and 0 <= py < height):
+            return None
+        r, g, b = image.getpixel((px, py))[:3]
+        signature.append([dx, dy, r, g, b])
+    return signature
+
+
+def _sample_region(x: int, y: int, signature: Sequence[Sequence[int]]) -> Tuple[int, int, int, int]:
+    """Return the smallest logical region that holds all samples."""
+    dxs = [sample[0] for sample in signature]
+    dys = [sample[1] for sample in signature]
+    left, top = x + min(dxs), y + min(dys)
+    return (left, top, max(dxs) - min(dxs) + 1, max(dys) - min(dys) + 1)
+
+
+def capture_signature(point: Tuple[int, int]) -> Optional[Signature]:
+    """
+    Capture a trigger signature from the live screen.
+
+    Args:
+        point: Logical (x, y) of the trigger
+
+    Returns:
+        list: Signature as for signature_from_image(), or None on failure
+    """
+    x, y = point
+    template = [[dx, dy] for dx, dy in SIGNATURE_OFFSETS]
+    region = _sample_region(x, y, template)
+    try:
+        image = screen_capture.grab(region, publish=False)
+    except Exception:
+        return None
+    return signature_from_image(image, image.size[0] / region[2], x, y, region[:2])
+
+
+def matches(point: Tuple[int, int], signature: Optional[Sequence[Sequence[int]]]) -> bool:
+    """
+    Check the live screen around a trigger against its recorded signature.
+
+    Args:
+        point: Logical (x, y) of the trigger (its current, anchored position)
+        signature: Recorded signature, or None/empty to skip the check
+
+    Returns:
+        bool: True if enough samples match (or there is nothing to check),
+              False on a mismatch or capture error
+    """
+    if not signature:
+        return True
+    x, y = point
+    region = _sample_region(x, y, signature)
+    try:
+        image = screen_capture.grab(region, publish=False)
+    except Exception:
+        return False
+    scale = image.size[0] / region[2]
+    data = image.tobytes()
+    row = image.size[0] * 3
+    left, top = region[0], region[1]
+    matched = 0
+    tolerance = SIGNATURE_TOLERANCE
+    for dx, dy, r, g, b in signature:
+        i = int((y + dy - top) * scale) * row + int((x + dx - left) * scale) * 3
+        if (abs(data[i] - r) <= tolerance and abs(data[i + 1] - g) <= tolerance
+                and abs(data[i + 2] - b) <= tolerance):
+            matched += 1
+    return matched >= SIGNATURE_MIN_MATCH * len(signature)
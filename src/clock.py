@@ -0,0 +1,174 @@
+"""
+AFK Auto-Help Module: Clocks
+
+Workers never call time.sleep()/time.perf_counter() directly; they use the
+clock on AppState.clock, so the same code can run against real time or a
+simulated game at many times real speed:
+
+- RealClock:    wall-clock time (the default)
+- ScaledClock:  simulated time running `speed` times faster than real
+                time; safe with any number of worker threads
+- VirtualClock: simulated time that only advances when someone sleeps;
+                deterministic and as fast as possible, but only meaningful
+                with a single worker thread
+
+All clocks are monotonic and count seconds from an arbitrary origin;
+wall() maps a clock onto epoch seconds for records kept across runs.
+"""
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+
+class Clock(ABC):
+    """Interface for time sources used by the workers."""
+
+    real = False
+    """True if the clock follows wall-clock time (busy-waiting is useful)."""
+
+    @abstractmethod
+    def now(self) -> float:
+        """Return the current time in seconds."""
+
+    def now_ns(self) -> int:
+        """Return the current time in nanoseconds."""
+        return int(self.now() * 1e9)
+
+    def wall(self) -> float:
+        """
+        Return the current time in seconds since the epoch, advancing at
+        this clock's rate (anchored to time.time() on first use).
+        """
+        origin = getattr(self, "_wall_origin", None)
+        if origin is None:
+            origin = self._wall_origin = time.time() - self.now()
+        return origin + self.now()
+
+    @abstractmethod
+    def sleep(self, seconds: float) -> None:
+        """Block for `seconds` of this clock's time."""
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        """
+        Block for `seconds` of this clock's time or until `event` is set.
+
+        Returns:
+            bool: True if the event is set
+        """
+        if not event.is_set():
+            self.sleep(seconds)
+        return event.is_set()
+
+
+class RealClock(Clock):
+    """Wall-clock time via time.perf_counter()."""
+
+    real = True
+
+    def now(self) -> float:
+        return time.perf_counter()
+
+    def now_ns(self) -> int:
+        return time.perf_counter_ns()
+
+    def wall(self) -> float:
+        return time.time()
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        return event.wait(seconds) if seconds > 0 else event.is_set()
+
+
+class ScaledClock(Clock):
+    """Simulated time running `speed` times faster than real time."""
+
+    def __init__(self, speed: float = 1000.0, start: float = 0.0):
+        """
+        Initialize the clock.
+
+        Args:
+            speed: Simulated seconds per real second
+            start: Simulated time at creation
+        """
+        if speed <= 0:
+            raise ValueError("speed must be positive")
+        self.speed = speed
+        self.start = start
+        self._origin_ns = time.perf_counter_ns()
+
+    def now(self) -> float:
+        return self.start + (time.perf_counter_ns() - self._origin_ns) * self.speed / 1e9
+
+    def now_ns(self) -> int:
+        return int(self.start * 1e9) + int((time.perf_counter_ns() - self._origin_ns) * self.speed)
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            time.sleep(seconds / self.speed)
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        return event.wait(seconds / self.speed) if seconds > 0 else event.is_set()
+
+
+class VirtualClock(Clock):
+    """Simulated time that jumps forward by exactly each sleep."""
+
+    def __init__(self, start: float = 0.0):
+        """
+        Initialize the clock.
+
+        Args:
+            start: Simulated time at creation
+        """
+        self._now_ns = int(start * 1e9)
+        self._lock = threading.Lock()
+        self._limit_ns: Optional[int] = None
+        self._on_limit: Optional[Callable[[], None]] = None
+
+    def stop_at(self, t: float, callback: Callable[[], None]) -> None:
+        """
+        Freeze time at `t` and call `callback` once it is reached.
+
+        Workers sleeping on a VirtualClock run far ahead of any real-time
+        supervisor, so the end of a simulated run is enforced here.
+
+        Args:
+            t: Simulated time at which to stop
+            callback: Called (once) from the sleeping thread, e.g. to set
+                      the stop flag
+        """
+        self._limit_ns = int(t * 1e9)
+        self._on_limit = callback
+
+    def now(self) -> float:
+        return self._now_ns / 1e9
+
+    def now_ns(self) -> int:
+        return self._now_ns
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self.advance(seconds)
+
+    def advance(self, seconds: float) -> None:
+        """Move time forward without sleeping."""
+        callback = None
+        with self._lock:
+            # Round up: a sleep must always move time, or a loop waiting
+            # out a sub-nanosecond remainder would never finish
+            self._now_ns += math.ceil(seconds * 1e9)
+            if self._limit_ns is not None and self._now_ns >= self._limit_ns:
+                self._now_ns = self._limit_ns
+                callback, self._on_limit = self._on_limit, None
+        if callback is not None:
+            callback()
+
+
+REAL_CLOCK = RealClock()
+"""Shared RealClock instance."""
@@ -0,0 +1,346 @@
+"""
+AFK Auto-Help Module: Local Control Server
+
+Lets scripts on the same machine drive a running instance, e.g. a
+supervisor orchestrating many headless instances. The server listens on a
+Unix domain socket and speaks line-delimited JSON: each request is one
+JSON object on one line, each response likewise.
+
+Requests ("id" is optional and echoed back):
+    {"cmd": "status"}                     running tasks, pause, hunger, message
+    {"cmd": "state"}                      persisted settings plus runtime fields
+    {"cmd": "metrics"}                    uptime, input arbiter counters, CPU use
+    {"cmd": "events", "since": 0}         status messages newer than "since"
+    {"cmd": "history", "resolution": "minute", "since": 0}
+                                          hunger history points, feeds and rates
+                                          (needs --history)
+    {"cmd": "start", "task": "chop"}      start a task (see task_runner)
+    {"cmd": "stop", "task": "chop"}       stop auto-chop; "all" stops everything
+    {"cmd": "pause"} / {"cmd": "resume"}  hold or release all tasks
+
+Responses are {"ok": true, ...} or {"ok": false, "error": "..."}.
+
+The server runs an asyncio loop on its own thread. Commands only flip
+state flags or start threads, so they never wait for the workers; the one
+exception, stopping everything, waits for the workers in an executor
+thread and leaves the loop serving other clients.
+
+Feed tasks share AppState.stop_event with auto-chop, so a feed task can
+only be stopped with "all".
+
+Query a running instance:
+    python src/control_server.py /path/to/socket status
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import cpu_governor
+import hunger_history
+import input_arbiter
+from task_runner import TASK_CHOP, TASK_NAMES
+
+
+STOP_ALL = "all"
+MAX_REQUEST_BYTES = 64 * 1024
+"""Longest accepted request line."""
+SHUTDOWN_GRACE = 1.0
+"""Seconds open connections get to finish after the server stops."""
+HISTORY_RESOLUTIONS = (
+    hunger_history.RESOLUTION_RAW, hunger_history.RESOLUTION_MINUTE, hunger_history.RESOLUTION_HOUR
+)
+
+
+class ControlServer:
+    """Serves control requests for one AppState over a Unix socket."""
+
+    def __init__(self, state, runner, sink, path: str):
+        """
+        Initialize the server.
+
+        Args:
+            state: AppState instance
+            runner: TaskRunner starting and stopping its workers
+            sink: RecordingStatusSink the workers report to (for events)
+            path: Filesystem path of the Unix socket
+        """
+        self.state = state
+        self.runner = runner
+        self.sink = sink
+        self.path = path
+        self.started = time.time()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._error: Optional[str] = None
+        self._clients: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    def start(self) -> Optional[str]:
+        """
+        Start serving on a background thread.
+
+        Returns:
+            str: Error message if the socket could not be opened, or None
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return "Control server needs Unix domain sockets (not available on this platform)"
+        self._thread = threading.Thread(target=self._run, name="control-server", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self._error
+
+    def stop(self) -> None:
+        """Stop serving and remove the socket file."""
+        if self._loop is not None and self._server is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=2.0)
+            except Exception:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        """Thread body: open the socket and run the event loop."""
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        try:
+            if os.path.exists(self.path):
+                os.unlink(self.path)  # left behind by an earlier instance
+            self._server = loop.run_until_complete(
+                asyncio.start_unix_server(self._handle_client, path=self.path,
+                                          limit=MAX_REQUEST_BYTES)
+            )
+        except OSError as e:
+            self._error = f"Control server could not listen on {self.path}: {e}"
+            self._ready.set()
+            loop.close()
+            return
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
+
+    async def _shutdown(self) -> None:
+        """Close the listener and open connections, then end the loop."""
+        self._server.close()
+        # Closing a connection ends its handler's read loop; a handler
+        # still busy with a request after the grace period is cancelled
+        for writer in self._clients.values():
+            writer.close()
+        if self._clients:
+            _, pending = await asyncio.wait(list(self._clients), timeout=SHUTDOWN_GRACE)
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+        asyncio.get_running_loop().call_soon(asyncio.get_running_loop().stop)
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        """Answer requests from one client until it disconnects."""
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    response = {"ok": False, "error": "Request too long"}
+                    writer.write((json.dumps(response) + "\n").encode("utf-8"))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                response = await self._respond(line)
+                writer.write((json.dumps(response) + "\n").encode("utf-8"))
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._clients.pop(task, None)
+            writer.close()
+
+    async def _respond(self, line: bytes) -> Dict[str, Any]:
+        """Parse one request line and build its response."""
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+        except ValueError as e:
+            return {"ok": False, "error": f"Invalid request: {e}"}
+        try:
+            response = await self.handle(request)
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute one request.
+
+        Args:
+            request: Decoded request object
+
+        Returns:
+            dict: Response object
+        """
+        state = self.state
+        cmd = request.get("cmd")
+
+        if cmd == "status":
+            return {
+                "ok": True,
+                "running": self.runner.running(),
+                "paused": state.paused or state.user_paused,
+                "hunger": self.sink.last_hunger,
+                "message": state.status_message,
+            }
+
+        if cmd == "state":
+            snapshot = state.to_dict()
+            snapshot.update({
+                "status_message": state.status_message,
+                "paused": state.paused,
+                "user_paused": state.user_paused,
+                "chop_running": state.chop_running,
+                "running": self.runner.running(),
+            })
+            return {"ok": True, "state": snapshot}
+
+        if cmd == "metrics":
+            arbiter = input_arbiter.get_arbiter()
+            return {
+                "ok": True,
+                "uptime": round(time.time() - self.started, 1),
+                "hunger": self.sink.last_hunger,
+                "events": self.sink.seq,
+                "input": {
+                    "executed": arbiter.executed,
+                    "coalesced": arbiter.coalesced,
+                    "focus_switches": arbiter.focus_switches,
+                    "pending": arbiter.pending_count(),
+                },
+                "cpu": cpu_governor.governor_for(state).report(),
+            }
+
+        if cmd == "events":
+            try:
+                since = int(request.get("since", 0))
+            except (TypeError, ValueError):
+                return {"ok": False, "error": f"Invalid request: since must be an integer, not {request.get('since')!r}"}
+            events = [{"seq": seq, "time": t, "message": msg}
+                      for seq, t, msg in self.sink.events_since(since)]
+            return {"ok": True, "events": events, "last": self.sink.seq}
+
+        if cmd == "history":
+            history = state.hunger_history
+            if history is None:
+                return {"ok": False, "error": "No hunger history is being recorded"}
+            try:
+                since = float(request.get("since", 0))
+            except (TypeError, ValueError):
+                return {"ok": False, "error": f"Invalid request: since must be a number, not {request.get('since')!r}"}
+            resolution = request.get("resolution", hunger_history.RESOLUTION_MINUTE)
+            if resolution not in HISTORY_RESOLUTIONS:
+                return {
+                    "ok": False,
+                    "error": f"Invalid request: resolution must be one of {', '.join(HISTORY_RESOLUTIONS)}"
+                }
+            return {
+                "ok": True,
+                "points": history.series(resolution, since),
+                "feeds": history.feed_times(since),
+                "drain_per_minute": history.drain_per_minute(),
+                "feeds_per_hour": history.feeds_per_hour(),
+            }
+
+        if cmd == "start":
+            task = request.get("task")
+            if task not in TASK_NAMES:
+                return {"ok": False, "error": f"Unknown task: {task}"}
+            error = self.runner.start(task)
+            return {"ok": False, "error": error} if error else {"ok": True}
+
+        if cmd == "stop":
+            task = request.get("task", STOP_ALL)
+            if task == TASK_CHOP:
+                state.chop_running = False
+                return {"ok": True}
+            if task != STOP_ALL:
+                return {"ok": False, "error": "Feed tasks can only be stopped with \"all\""}
+            # Wake every worker now; wait for them off the event loop
+            state.chop_running = False
+            state.stop_all_flag = True
+            await asyncio.get_running_loop().run_in_executor(None, self.runner.stop_all)
+            return {"ok": True}
+
+        if cmd in ("pause", "resume"):
+            state.user_paused = cmd == "pause"
+            return {"ok": True, "paused": state.user_paused}
+
+        return {"ok": False, "error": f"Unknown command: {cmd}"}
+
+
+def send_command(path: str, request: Dict[str, Any], timeout: float = 5.0) -> Dict[str, Any]:
+    """
+    Send one request to a control server and return its response.
+
+    A convenience for supervisor scripts; long-lived clients can keep the
+    connection open and send many lines instead.
+
+    Args:
+        path: Unix socket path of the instance
+        request: Request object, e.g. {"cmd": "status"}
+        timeout: Socket timeout in seconds
+
+    Returns:
+        dict: Decoded response
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    return json.loads(data)
+
+
+def main(argv=None) -> int:
+    """Send a command to a running instance and print the response."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("Usage: control_server.py SOCKET COMMAND [TASK]")
+        return 2
+    request: Dict[str, Any] = {"cmd": argv[1]}
+    if len(argv) > 2:
+        request["task"] = argv[2]
+    try:
+        response = send_command(argv[0], request)
+    except OSError as e:
+        print(f"Cannot reach {argv[0]}: {e}")
+        return 1
+    print(json.dumps(response, indent=2))
+    return 0 if response.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+AFK Auto-Help Module: CPU Governor
+
+Keeps background work within AppState.cpu_budget_percent of one core so
+the game keeps its frame rate. Every few seconds the governor compares
+the process's CPU use with the budget and adjusts a slowdown factor
+(1.0 = full speed, up to MAX_SLOWDOWN) that the workers apply to their
+optional work:
+
+- poll intervals: hunger monitor, anchor and chop target checks, watchdog
+- sampling density: the hunger bar sampling step grows with the square
+  root of the slowdown, since samples are taken in both directions
+- click guard: checked on every Nth chop click instead of every click
+
+Clicks and feeds themselves are never delayed; the chop click rate and
+feed timing stay as configured.
+
+Workers report CPU time per task through a TaskMeter (time.thread_time()
+of the worker thread), so report() shows where the time goes. The budget
+itself is compared with the whole process's CPU time (time.process_time()),
+which also covers the GUI and logging; detection worker processes are
+not included.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+CPU_WINDOW = 5.0
+"""Seconds of wall time between budget checks."""
+MAX_SLOWDOWN = 8.0
+"""Largest factor poll intervals are stretched by."""
+RELAX_HEADROOM = 0.6
+"""Usage below this fraction of the budget lets the slowdown shrink."""
+RELAX_FACTOR = 0.75
+"""Factor the slowdown shrinks by per window with headroom."""
+
+
+class TaskMeter:
+    """Charges one worker thread's CPU time to a task."""
+
+    def __init__(self, governor: "CpuGovernor", task: str):
+        self.governor = governor
+        self.task = task
+        self.last = time.thread_time()
+
+    def tick(self) -> None:
+        """
+        Charge the CPU time used since the last tick (call from the worker
+        thread that created the meter, e.g. once per loop iteration).
+        """
+        now = time.thread_time()
+        self.governor.charge(self.task, now - self.last)
+        self.last = now
+
+
+class CpuGovernor:
+    """Measures CPU use and scales optional work to a budget."""
+
+    def __init__(self, state):
+        """
+        Initialize the governor.
+
+        Args:
+            state: AppState whose cpu_budget_percent is applied (read at
+                   every check, so changes take effect within CPU_WINDOW)
+        """
+        self.state = state
+        self.slowdown = 1.0
+        """Current factor for intervals; 1.0 while within budget."""
+        self.usage: Optional[float] = None
+        """Process CPU use in percent of one core over the last window."""
+        self.task_cpu: Dict[str, float] = {}
+        """CPU seconds charged per task since start."""
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._cpu_start = time.process_time()
+
+    def meter(self, task: str) -> TaskMeter:
+        """Return a meter charging the calling thread's CPU time to a task."""
+        return TaskMeter(self, task)
+
+    def charge(self, task: str, seconds: float) -> None:
+        """Add CPU time to a task and re-check the budget if a window ended."""
+        with self._lock:
+            self.task_cpu[task] = self.task_cpu.get(task, 0.0) + seconds
+            now = time.monotonic()
+            elapsed = now - self._window_start
+            if elapsed < CPU_WINDOW:
+                return
+            cpu = time.process_time()
+            self.usage = (cpu - self._cpu_start) / elapsed * 100.0
+            self._window_start = now
+            self._cpu_start = cpu
+            self._adjust()
+
+    def _adjust(self) -> None:
+        """Move the slowdown towards keeping usage within the budget."""
+        budget = self.state.cpu_budget_percent
+        if not budget or budget <= 0:
+            self.slowdown = 1.0
+        elif self.usage > budget:
+            self.slowdown = min(self.slowdown * self.usage / budget, MAX_SLOWDOWN)
+        elif self.usage < budget * RELAX_HEADROOM:
+            self.slowdown = max(self.slowdown * RELAX_FACTOR, 1.0)
+
+    def interval(self, base: float) -> float:
+        """Return a poll interval stretched by the current slowdown."""
+        return base * self.slowdown
+
+    def sample_rate(self, base: int) -> int:
+        """Return a hunger bar sampling step (logical pixels) for the slowdown."""
+        return max(base, round(base * self.slowdown ** 0.5))
+
+    def stride(self) -> int:
+        """Return N for work done only on every Nth iteration (1 = always)."""
+        return int(self.slowdown)
+
+    def report(self) -> Dict[str, Any]:
+        """Return usage, slowdown and CPU seconds per task."""
+        with self._lock:
+            return {
+                "budget_percent": self.state.cpu_budget_percent,
+                "usage_percent": None if self.usage is None else round(self.usage, 1),
+                "slowdown": round(self.slowdown, 2),
+                "task_cpu": {task: round(seconds, 3) for task, seconds in self.task_cpu.items()},
+            }
+
+
+_governors: Dict[int, CpuGovernor] = {}
+_governors_lock = threading.Lock()
+
+
+def governor_for(state) -> CpuGovernor:
+    """
+    Return the governor of an AppState, creating it on first use.
+
+    Args:
+        state: AppState instance
+
+    Returns:
+        CpuGovernor: Shared by all workers of that state
+    """
+    key = id(state)
+    with _governors_lock:
+        governor = _governors.get(key)
+        if governor is None or governor.state is not state:
+            governor = CpuGovernor(state)
+            _governors[key] = governor
+        return governor
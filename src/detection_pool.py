@@ -0,0 +1,334 @@
+"""
+AFK Auto-Help Module: Detection Worker Pool
+
+Runs pixel-heavy detection (hunger bar classification, template search)
+in separate processes, so it never holds the GIL that the click and feed
+threads need to keep their timing.
+
+Frames are not pickled. The pool owns a fixed set of shared-memory frame
+slots; submitting a job copies the frame into a free slot and sends only
+the slot number, frame geometry and a few parameters to a worker, which
+reads the pixels straight out of shared memory. Results are compact (pixel
+counts, a match position). When every slot is busy, submit()
+blocks until one frees up, which bounds memory and applies backpressure.
+
+If no slot frees up within SLOT_WAIT_TIMEOUT, that one job runs inline on
+the calling thread and the pool is kept. If a worker process dies
+(BrokenProcessPool), the job is redone inline by the thread waiting on
+its result, never on the executor's callback thread, and the broken pool
+keeps detecting inline from then on.
+
+The pool is optional: set AppState.detection_workers to the number of
+worker processes (0, the default, keeps detection inline).
+"""
+
+import atexit
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+import hunger_detection
+import region_anchor
+
+
+DETECT_PIXEL_COUNT = "pixel_count"
+DETECT_TEMPLATE = "template"
+
+DEFAULT_SLOT_BYTES = 4 * 1024 * 1024
+"""Size of each shared-memory frame slot (a 1024x1024 RGB frame fits)."""
+
+SLOTS_PER_WORKER = 2
+"""Frame slots per worker process, so workers never wait for a slot."""
+
+SLOT_WAIT_TIMEOUT = 5.0
+"""Longest wait in seconds for a free frame slot before detecting inline."""
+
+
+class _WorkerDied(Exception):
+    """Marks a job whose worker died; the waiting thread redoes it inline."""
+
+logger = logging.getLogger("afk_auto_help.detection")
+
+
+# Worker process side
+
+_worker_slots: Dict[int, Any] = {}
+
+
+def _attach(name: str):
+    """Attach to an existing shared-memory block without taking ownership."""
+    from multiprocessing import shared_memory
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # No track flag before Python 3.13. Spawned workers share the
+        # parent's resource tracker, so this only repeats the parent's
+        # registration; the parent unlinks the block in close().
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(names: List[str]) -> None:
+    """Worker initializer: attach to every frame slot."""
+    for index, name in enumerate(names):
+        _worker_slots[index] = _attach(name)
+
+
+def _detect(data, width: int, height: int, kind: str, params: Dict[str, Any]):
+    """Run one detection job on raw frame bytes (in a worker or inline)."""
+    if kind == DETECT_PIXEL_COUNT:
+        count = hunger_detection.compile_classifier(params["thresholds"])
+        return count(data, width, height, params["step"])
+    if kind == DETECT_TEMPLATE:
+        return region_anchor.scan_for_template(
+            data, width, height, params["samples"],
+            params["template_width"], params["template_height"], params["limit"]
+        )
+    raise ValueError(f"Unknown detection kind: {kind}")
+
+
+def _run_job(slot: int, size: int, width: int, height: int, kind: str, params: Dict[str, Any]):
+    """Run one detection job on the frame in a shared-memory slot."""
+    view = _worker_slots[slot].buf[:size]
+    try:
+        return _detect(view, width, height, kind, params)
+    finally:
+        view.release()
+
+
+# Parent process side
+
+class _PoolFuture(Future):
+    """
+    Future of a pool job that is redone inline if its worker died.
+
+    The executor's callback thread only marks the job; result() then runs
+    the detection on the thread that waits for it.
+    """
+
+    def __init__(self, redo):
+        super().__init__()
+        self._redo = redo
+        self._redo_lock = threading.Lock()
+        self._redone: Optional[Future] = None
+
+    def result(self, timeout=None):
+        try:
+            return super().result(timeout)
+        except _WorkerDied:
+            with self._redo_lock:
+                if self._redone is None:
+                    self._redone = self._redo()
+            return self._redone.result()
+
+class DetectionPool:
+    """
+    A process pool with shared-memory frame slots.
+
+    Methods return concurrent.futures.Future objects; call .result() to wait
+    (waiting releases the GIL).
+    """
+
+    def __init__(self, workers: int, slot_bytes: int = DEFAULT_SLOT_BYTES):
+        """
+        Start the worker processes and allocate frame slots.
+
+        Args:
+            workers: Number of worker processes (at least 1)
+            slot_bytes: Size of each frame slot in bytes
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        workers = max(1, workers)
+        self.slot_bytes = slot_bytes
+        self._slots = [
+            shared_memory.SharedMemory(create=True, size=slot_bytes)
+            for _ in range(workers * SLOTS_PER_WORKER)
+        ]
+        self._free: "queue.Queue[int]" = queue.Queue()
+        for index in range(len(self._slots)):
+            self._free.put(index)
+        # spawn: forking a process that runs Tk and capture threads is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=([shm.name for shm in self._slots],),
+        )
+        self._closed = False
+        self.broken = False
+        """True once a worker process died; jobs then run inline."""
+
+    def _inline(self, data, width: int, height: int, kind: str, params: Dict[str, Any]) -> Future:
+        """Run a job on the calling thread and resolve a future with it."""
+        future = Future()
+        try:
+            future.set_result(_detect(data, width, height, kind, params))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _mark_broken(self, reason: str) -> None:
+        """Switch to inline detection for good, logging it once."""
+        if not self.broken:
+            self.broken = True
+            logger.warning(f"Detection workers unavailable ({reason}); detecting inline")
+
+    def submit(self, data, width: int, height: int, kind: str, params: Dict[str, Any]) -> Future:
+        """
+        Copy a frame into a free slot and queue a detection job on it.
+
+        Args:
+            data: Raw frame bytes (bytes, bytearray or memoryview)
+            width: Frame width in pixels
+            height: Frame height in pixels
+            kind: DETECT_PIXEL_COUNT or DETECT_TEMPLATE
+            params: Small, picklable job parameters
+
+        Returns:
+            Future: Resolves to the job's compact result
+
+        Raises:
+            ValueError: If the frame does not fit in a slot
+            RuntimeError: If the pool has been closed
+        """
+        from concurrent.futures.process import BrokenProcessPool
+
+        if self._closed:
+            raise RuntimeError("Detection pool is closed")
+        size = len(data)
+        if size > self.slot_bytes:
+            raise ValueError(f"Frame of {size} bytes exceeds the {self.slot_bytes}-byte slot size")
+        if self.broken:
+            return self._inline(data, width, height, kind, params)
+        try:
+            slot = self._free.get(timeout=SLOT_WAIT_TIMEOUT)
+        except queue.Empty:
+            # Slots are only busy (e.g. a slow frame); detect this one inline
+            logger.debug(f"No free frame slot after {SLOT_WAIT_TIMEOUT:.0f}s; detecting inline")
+            return self._inline(data, width, height, kind, params)
+        try:
+            self._slots[slot].buf[:size] = data
+            job = self._executor.submit(_run_job, slot, size, width, height, kind, params)
+        except BrokenProcessPool as e:
+            self._free.put(slot)
+            self._mark_broken(str(e) or "worker process died")
+            return self._inline(data, width, height, kind, params)
+        except Exception:
+            self._free.put(slot)
+            raise
+
+        # A worker dying mid-job fails the job; the waiting thread redoes it inline
+        result = _PoolFuture(lambda: self._inline(data, width, height, kind, params))
+
+        def _done(f: Future) -> None:
+            self._free.put(slot)
+            error = f.exception()
+            if isinstance(error, BrokenProcessPool):
+                self._mark_broken(str(error) or "worker process died")
+                result.set_exception(_WorkerDied())
+            elif error is not None:
+                result.set_exception(error)
+            else:
+                result.set_result(f.result())
+
+        job.add_done_callback(_done)
+        return result
+
+    def count_pixels(self, image, step: int, thresholds: Optional[Dict[str, Any]]) -> Future:
+        """
+        Count filled hunger bar pixels of an image in a worker.
+
+        Args:
+            image: PIL.Image (converted to RGB if needed)
+            step: Sampling step in physical pixels
+            thresholds: Classification thresholds, or None for the defaults
+
+        Returns:
+            Future: Resolves to (filled, total)
+        """
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        width, height = image.size
+        return self.submit(image.tobytes(), width, height, DETECT_PIXEL_COUNT,
+                           {"thresholds": thresholds, "step": step})
+
+    def match_template(self, area, width: int, height: int, samples: List[Tuple[int, int, int]],
+                       template_width: int, template_height: int, limit: float) -> Future:
+        """
+        Search a grayscale area for a template in a worker.
+
+        See region_anchor.scan_for_template for the arguments.
+
+        Returns:
+            Future: Resolves to the (x, y) offset of the match, or None
+        """
+        return self.submit(area, width, height, DETECT_TEMPLATE, {
+            "samples": samples, "template_width": template_width,
+            "template_height": template_height, "limit": limit,
+        })
+
+    def close(self) -> None:
+        """Stop the workers and release the shared memory."""
+        if self._closed:
+            return
+        self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for shm in self._slots:
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+_pool: Optional[DetectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool(workers: int) -> DetectionPool:
+    """
+    Return the process-wide detection pool, creating it on first use.
+
+    Args:
+        workers: Number of worker processes if the pool must be created
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DetectionPool(workers)
+            atexit.register(shutdown_pool)
+        return _pool
+
+
+def pool_for(state) -> Optional[DetectionPool]:
+    """
+    Return the detection pool configured for an AppState.
+
+    Args:
+        state: AppState instance
+
+    Returns:
+        DetectionPool: The shared pool, or None if detection_workers is 0
+                       or the pool cannot be started
+    """
+    if not state.detection_workers or state.detection_workers <= 0:
+        return None
+    try:
+        return get_pool(state.detection_workers)
+    except Exception as e:
+        logger.warning(f"Detection pool unavailable, detecting inline: {e}")
+        state.detection_workers = 0
+        return None
+
+
+def shutdown_pool() -> None:
+    """Close the process-wide pool if it was started."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
@@ -0,0 +1,210 @@
+"""
+AFK Auto-Help Module: Display Geometry
+
+Maps between the coordinate spaces involved in screen capture:
+
+- logical coordinates: what Tk mouse events report and what clicks use
+  (points on macOS)
+- physical pixels: what a screenshot actually contains; on Retina/HiDPI
+  displays each logical point covers scale x scale physical pixels
+
+Regions and points can also be stored in a resolution-independent form,
+(monitor index, fractions of that monitor's size), so saved settings
+survive resolution changes and monitor rearrangement.
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+
+
+NormalizedRegion = Tuple[int, float, float, float, float]
+"""(monitor index, x, y, width, height) as fractions of the monitor size."""
+
+NormalizedPoint = Tuple[int, float, float]
+"""(monitor index, x, y) as fractions of the monitor size."""
+
+
+class DisplayError(OSError):
+    """Raised when the connected monitors cannot be determined."""
+
+
+class Monitor(NamedTuple):
+    """A display in logical coordinates."""
+
+    index: int
+    x: int
+    y: int
+    width: int
+    height: int
+
+    def contains(self, x: float, y: float) -> bool:
+        """Return True if the logical point lies on this monitor."""
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+
+_monitors: Optional[List[Monitor]] = None
+
+
+def _enumerate_logical_bounds() -> List[Tuple[int, int, int, int]]:
+    """
+    List monitor bounds as (x, y, width, height).
+
+    Uses mss when installed (all monitors); otherwise reports the primary
+    screen size from pyautogui as a single monitor.
+    """
+    try:
+        import mss
+    except ImportError:
+        import pyautogui
+        width, height = pyautogui.size()
+        return [(0, 0, width, height)]
+    with mss.mss() as sct:
+        # sct.monitors[0] is the union of all monitors
+        return [(m["left"], m["top"], m["width"], m["height"]) for m in sct.monitors[1:]]
+
+
+def get_monitors(refresh: bool = False) -> List[Monitor]:
+    """
+    Return the connected monitors (cached after the first call).
+
+    Args:
+        refresh: Re-enumerate monitors
+
+    Returns:
+        list: Monitors; index 0 is the primary monitor
+
+    Raises:
+        DisplayError: If no monitor can be found
+    """
+    global _monitors
+    if _monitors is None or refresh:
+        try:
+            bounds = _enumerate_logical_bounds()
+        except Exception as e:
+            raise DisplayError(f"Cannot list monitors: {e}") from e
+        if not bounds:
+            raise DisplayError("No monitors found")
+        _monitors = [Monitor(i, x, y, w, h) for i, (x, y, w, h) in enumerate(bounds)]
+    return _monitors
+
+
+def monitor_for_point(x: float, y: float) -> Monitor:
+    """
+    Return the monitor containing a logical point (or the nearest one).
+
+    Args:
+        x: Logical X coordinate
+        y: Logical Y coordinate
+    """
+    monitors = get_monitors()
+    for monitor in monitors:
+        if monitor.contains(x, y):
+            return monitor
+
+    def distance_sq(m: Monitor) -> float:
+        dx = max(m.x - x, 0, x - (m.x + m.width))
+        dy = max(m.y - y, 0, y - (m.y + m.height))
+        return dx * dx + dy * dy
+
+    return min(monitors, key=distance_sq)
+
+
+def _monitor_by_index(index: int) -> Monitor:
+    """Return a monitor by index, falling back to the primary monitor."""
+    monitors = get_monitors()
+    return monitors[index] if 0 <= index < len(monitors) else monitors[0]
+
+
+def normalize_region(region: Tuple[int, int, int, int]) -> NormalizedRegion:
+    """
+    Convert a logical region to resolution-independent form.
+
+    Args:
+        region: Logical (x, y, width, height)
+
+    Returns:
+        tuple: (monitor index, fx, fy, fw, fh) relative to the monitor
+    """
+    x, y, width, height = region
+    m = monitor_for_point(x, y)
+    return (m.index, (x - m.x) / m.width, (y - m.y) / m.height,
+            width / m.width, height / m.height)
+
+
+def resolve_region(normalized: NormalizedRegion) -> Tuple[int, int, int, int]:
+    """
+    Convert a normalized region back to logical coordinates.
+
+    Args:
+        normalized: (monitor index, fx, fy, fw, fh)
+
+    Returns:
+        tuple: Logical (x, y, width, height) on the current displays
+    """
+    index, fx, fy, fw, fh = normalized
+    m = _monitor_by_index(int(index))
+    return (m.x + round(fx * m.width), m.y + round(fy * m.height),
+            max(1, round(fw * m.width)), max(1, round(fh * m.height)))
+
+
+def normalize_point(point: Tuple[int, int]) -> NormalizedPoint:
+    """Convert a logical (x, y) point to (monitor index, fx, fy)."""
+    x, y = point
+    m = monitor_for_point(x, y)
+    return (m.index, (x - m.x) / m.width, (y - m.y) / m.height)
+
+
+def resolve_point(normalized: NormalizedPoint) -> Tuple[int, int]:
+    """Convert (monitor index, fx, fy) back to a logical (x, y) point."""
+    index, fx, fy = normalized
+    m = _monitor_by_index(int(index))
+    return (m.x + round(fx * m.width), m.y + round(fy * m.height))
+
+
+def store_normalized(state) -> None:
+    """
+    Record resolution-independent copies of the state's regions and points.
+
+    Call after hunger_region, feed_trigger, chop_trigger, chop_target_region
+    or chop_plan change.
+
+    Args:
+        state: AppState instance
+    """
+    state.hunger_region_norm = normalize_region(state.hunger_region) if state.hunger_region else None
+    state.feed_trigger_norm = normalize_point(state.feed_trigger) if state.feed_trigger else None
+    state.chop_trigger_norm = normalize_point(state.chop_trigger) if state.chop_trigger else None
+    state.chop_target_region_norm = (
+        normalize_region(state.chop_target_region) if state.chop_target_region else None
+    )
+    for entry in state.chop_plan or []:
+        entry["point_norm"] = normalize_point(entry["point"])
+        region = entry.get("target_region")
+        entry["target_region_norm"] = normalize_region(region) if region else None
+
+
+def apply_normalized(state) -> None:
+    """
+    Recompute logical regions and points from their normalized copies.
+
+    Call after loading settings so coordinates match the current displays.
+    Fields without a normalized copy (older settings files) are left as-is.
+
+    Args:
+        state: AppState instance
+
+    Raises:
+        DisplayError: If the monitors cannot be determined
+    """
+    if state.hunger_region_norm:
+        state.hunger_region = resolve_region(state.hunger_region_norm)
+    if state.feed_trigger_norm:
+        state.feed_trigger = resolve_point(state.feed_trigger_norm)
+    if state.chop_trigger_norm:
+        state.chop_trigger = resolve_point(state.chop_trigger_norm)
+    if state.chop_target_region_norm:
+        state.chop_target_region = resolve_region(state.chop_target_region_norm)
+    for entry in state.chop_plan or []:
+        if entry.get("point_norm"):
+            entry["point"] = resolve_point(entry["point_norm"])
+        if entry.get("target_region_norm"):
+            entry["target_region"] = resolve_region(entry["target_region_norm"])
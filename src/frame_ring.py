@@ -0,0 +1,294 @@
+"""
+AFK Auto-Help Module: Shared-Memory Frame Ring
+
+Lets other processes see what the app captures without capturing again.
+When enabled (AppState.publish_frames), every frame grabbed by
+screen_capture is also written into a fixed-size ring of slots in a named
+multiprocessing.shared_memory block. Readers attach by name and get
+zero-copy memoryviews of the pixels.
+
+Layout (little-endian):
+    ring header (32 bytes):
+        magic b"AFKR", version (u8), pad, slot count (u16),
+        slot data size (u32), latest sequence number (u64), pad
+    per slot, SLOT_HEADER_SIZE bytes followed by slot data:
+        sequence (u64), capture time ns (u64, perf_counter_ns clock),
+        logical x, y, width, height (i32 each),
+        pixel width, height (u32 each), mode (4s, e.g. b"RGB\\0"),
+        data length (u32)
+
+Each slot's sequence number works as a seqlock: the writer sets it to 0
+before overwriting a slot and to the frame's sequence number afterwards.
+A reader that finds the same non-zero sequence before and after using the
+data (FrameRingReader.is_current) knows the frame was not overwritten.
+
+Watch a running app's frames, or remove a ring left behind by a crash:
+    python src/frame_ring.py [ring name]
+    python src/frame_ring.py --remove [ring name]
+"""
+
+import struct
+import sys
+import time
+from typing import NamedTuple, Optional, Tuple
+
+
+DEFAULT_RING_NAME = "afk_auto_help_frames"
+"""Shared-memory name used when none is given."""
+
+DEFAULT_SLOTS = 8
+DEFAULT_SLOT_BYTES = 2 * 1024 * 1024
+"""Largest frame that can be published (larger frames are skipped)."""
+
+RING_MAGIC = b"AFKR"
+RING_VERSION = 1
+
+_RING_HEADER = struct.Struct("<4sBxHIQ12x")
+_SLOT_HEADER = struct.Struct("<QQiiiiII4sI")
+RING_HEADER_SIZE = _RING_HEADER.size
+SLOT_HEADER_SIZE = _SLOT_HEADER.size
+
+_LATEST_OFFSET = 12
+"""Byte offset of the latest sequence number within the ring header."""
+
+
+class Frame(NamedTuple):
+    """A frame in the ring. `data` is a view into shared memory."""
+
+    seq: int
+    timestamp_ns: int
+    region: Tuple[int, int, int, int]
+    width: int
+    height: int
+    mode: str
+    data: memoryview
+
+
+def _slot_offset(index: int, slot_bytes: int) -> int:
+    """Return the byte offset of a slot's header."""
+    return RING_HEADER_SIZE + index * (SLOT_HEADER_SIZE + slot_bytes)
+
+
+class FrameRingWriter:
+    """Creates a frame ring and publishes frames into it."""
+
+    def __init__(self, name: str = DEFAULT_RING_NAME, slots: int = DEFAULT_SLOTS,
+                 slot_bytes: int = DEFAULT_SLOT_BYTES):
+        """
+        Create the shared-memory ring.
+
+        An existing ring of the same name is never replaced: it may belong
+        to another running instance whose readers would silently lose it.
+
+        Args:
+            name: Shared-memory name readers attach to
+            slots: Number of frames kept
+            slot_bytes: Largest frame size in bytes
+
+        Raises:
+            FileExistsError: If a ring with that name already exists
+        """
+        from multiprocessing import shared_memory
+
+        size = _slot_offset(slots, slot_bytes)
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            raise FileExistsError(
+                f"frame ring {name} already exists (another instance is publishing, or one "
+                f"did not shut down cleanly: python src/frame_ring.py --remove {name})"
+            ) from None
+        self.name = name
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.seq = 0
+        _RING_HEADER.pack_into(self.shm.buf, 0, RING_MAGIC, RING_VERSION, slots, slot_bytes, 0)
+
+    def publish(self, image, region: Tuple[int, int, int, int]) -> Optional[int]:
+        """
+        Write a captured frame into the next slot.
+
+        Args:
+            image: PIL.Image as returned by screen_capture.grab()
+            region: Logical (x, y, width, height) the image was captured from
+
+        Returns:
+            int: Sequence number of the frame, or None if it was too large
+        """
+        data = image.tobytes()
+        if len(data) > self.slot_bytes:
+            return None
+        self.seq += 1
+        seq = self.seq
+        buf = self.shm.buf
+        offset = _slot_offset((seq - 1) % self.slots, self.slot_bytes)
+
+        struct.pack_into("<Q", buf, offset, 0)  # mark as being written
+        start = offset + SLOT_HEADER_SIZE
+        buf[start:start + len(data)] = data
+        width, height = image.size
+        _SLOT_HEADER.pack_into(
+            buf, offset, seq, time.perf_counter_ns(), *region,
+            width, height, image.mode.encode("ascii"), len(data)
+        )
+        struct.pack_into("<Q", buf, _LATEST_OFFSET, seq)
+        return seq
+
+    def close(self) -> None:
+        """Remove the ring; attached readers keep their mapping until they close."""
+        self.shm.close()
+        try:
+            self.shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class FrameRingReader:
+    """Attaches to a frame ring created by another process."""
+
+    def __init__(self, name: str = DEFAULT_RING_NAME):
+        """
+        Attach to an existing ring.
+
+        Args:
+            name: Shared-memory name of the ring
+
+        Raises:
+            FileNotFoundError: If no ring with that name exists
+            ValueError: If the block is not a frame ring of this version
+        """
+        from multiprocessing import shared_memory
+
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            self.shm = shared_memory.SharedMemory(name=name)
+            # Before Python 3.13 attaching registers the block with this
+            # process's resource tracker, which would unlink it on exit
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+        magic, version, slots, slot_bytes, _ = _RING_HEADER.unpack_from(self.shm.buf, 0)
+        if magic != RING_MAGIC or version != RING_VERSION:
+            self.shm.close()
+            raise ValueError(f"{name} is not a version {RING_VERSION} frame ring")
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+
+    def latest_seq(self) -> int:
+        """Return the sequence number of the newest frame (0 if none)."""
+        return struct.unpack_from("<Q", self.shm.buf, _LATEST_OFFSET)[0]
+
+    def read(self, seq: int) -> Optional[Frame]:
+        """
+        Return a frame by sequence number without copying its pixels.
+
+        Args:
+            seq: Sequence number (the last `slots` frames are available)
+
+        Returns:
+            Frame: The frame, or None if it was overwritten or is being written
+        """
+        if seq <= 0:
+            return None
+        offset = _slot_offset((seq - 1) % self.slots, self.slot_bytes)
+        (slot_seq, timestamp_ns, x, y, w, h, width, height,
+         mode, length) = _SLOT_HEADER.unpack_from(self.shm.buf, offset)
+        if slot_seq != seq:
+            return None
+        start = offset + SLOT_HEADER_SIZE
+        return Frame(seq, timestamp_ns, (x, y, w, h), width, height,
+                     mode.rstrip(b"\0").decode("ascii"), self.shm.buf[start:start + length])
+
+    def latest(self) -> Optional[Frame]:
+        """Return the newest frame, or None if there is none yet."""
+        return self.read(self.latest_seq())
+
+    def is_current(self, frame: Frame) -> bool:
+        """
+        Check that a frame's slot has not been reused since it was read.
+
+        Call after processing frame.data; if False, discard the result.
+        """
+        offset = _slot_offset((frame.seq - 1) % self.slots, self.slot_bytes)
+        return struct.unpack_from("<Q", self.shm.buf, offset)[0] == frame.seq
+
+    def wait_next(self, after_seq: int, timeout: float = 1.0, poll: float = 0.005) -> Optional[Frame]:
+        """
+        Wait for a frame newer than after_seq.
+
+        Args:
+            after_seq: Last sequence number already seen
+            timeout: Seconds to wait
+            poll: Seconds between checks
+
+        Returns:
+            Frame: The newest frame, or None on timeout
+        """
+        end = time.perf_counter() + timeout
+        while time.perf_counter() < end:
+            if self.latest_seq() > after_seq:
+                frame = self.latest()
+                if frame is not None:
+                    return frame
+            time.sleep(poll)
+        return None
+
+    def close(self) -> None:
+        """Detach from the ring. Release any Frame.data views first."""
+        self.shm.close()
+
+
+def remove_ring(name: str = DEFAULT_RING_NAME) -> None:
+    """
+    Remove a ring left behind by a process that did not shut down cleanly.
+
+    Args:
+        name: Shared-memory name of the ring
+
+    Raises:
+        FileNotFoundError: If no ring with that name exists
+    """
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=name)
+    shm.close()
+    shm.unlink()
+
+
+def main(argv=None) -> int:
+    """Print frames published by a running app (a minimal debug viewer)."""
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "--remove":
+        name = argv[1] if len(argv) > 1 else DEFAULT_RING_NAME
+        try:
+            remove_ring(name)
+        except FileNotFoundError:
+            print(f"No frame ring {name}")
+            return 1
+        print(f"Removed frame ring {name}")
+        return 0
+    name = argv[0] if argv else DEFAULT_RING_NAME
+    try:
+        reader = FrameRingReader(name)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Cannot attach to frame ring {name}: {e}")
+        return 1
+    seq = reader.latest_seq()
+    try:
+        while True:
+            frame = reader.wait_next(seq)
+            if frame is None:
+                continue
+            seq = frame.seq
+            age_ms = (time.perf_counter_ns() - frame.timestamp_ns) / 1e6
+            print(f"#{frame.seq} region={frame.region} {frame.width}x{frame.height} "
+                  f"{frame.mode} age={age_ms:.1f}ms")
+            del frame
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
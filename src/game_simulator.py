@@ -0,0 +1,320 @@
+"""
+AFK Auto-Help Module: Game Simulator
+
+A stand-in for the game, so the real workers can be run end to end on a
+headless machine at many times real speed:
+
+- the hunger bar drains at a constant rate and rises a while after the
+  feed trigger is clicked (eating takes time, like in the game)
+- screen captures are rendered from the simulated state into synthetic
+  frames, so hunger detection runs unmodified on them
+- input goes to a stub backend that records clicks instead of moving the
+  real mouse
+
+Workers read time from AppState.clock; the simulator sets it to a
+VirtualClock (single task, as fast as possible) or a ScaledClock (several
+concurrent tasks, `speed` times real time). run_simulation() returns
+scheduling metrics such as captures per feed and wasted clicks.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import input_control
+import screen_capture
+from clock import Clock, ScaledClock, VirtualClock
+from status_sink import LoggingStatusSink
+from task_runner import TaskRunner
+
+
+BAR_COLOR = (200, 120, 40)
+"""Color of the filled part of the simulated hunger bar."""
+BACKGROUND_COLOR = (60, 50, 55)
+"""Color of everything else on the simulated screen."""
+
+DEFAULT_BAR_REGION = (100, 100, 200, 12)
+DEFAULT_FEED_POINT = (400, 300)
+DEFAULT_CHOP_POINT = (600, 300)
+
+HIT_RADIUS = 5
+"""Clicks within this many pixels of a target count as hitting it."""
+
+
+class SimulatedGame:
+    """Hunger, feeding and chopping driven by a clock."""
+
+    def __init__(self, clock: Clock,
+                 bar_region: Tuple[int, int, int, int] = DEFAULT_BAR_REGION,
+                 feed_point: Tuple[int, int] = DEFAULT_FEED_POINT,
+                 chop_point: Tuple[int, int] = DEFAULT_CHOP_POINT,
+                 drain_per_minute: float = 2.0,
+                 feed_amount: float = 25.0,
+                 eat_delay: float = 0.5,
+                 start_hunger: float = 100.0):
+        """
+        Initialize the simulated game.
+
+        Args:
+            clock: Time source shared with the workers
+            bar_region: Logical (x, y, width, height) of the hunger bar
+            feed_point: Where clicking eats the stew
+            chop_point: Where clicking chops
+            drain_per_minute: Hunger percentage points lost per minute
+            feed_amount: Hunger percentage points restored by one meal
+            eat_delay: Seconds between the feed click and the bar rising;
+                       feed clicks during this time are ignored
+            start_hunger: Initial hunger percentage
+        """
+        self.clock = clock
+        self.bar_region = bar_region
+        self.feed_point = feed_point
+        self.chop_point = chop_point
+        self.drain_per_second = drain_per_minute / 60.0
+        self.feed_amount = feed_amount
+        self.eat_delay = eat_delay
+
+        self._lock = threading.Lock()
+        self._hunger = start_hunger
+        self._updated = clock.now()
+        self._meal_at: Optional[float] = None
+        self.started = clock.now()
+
+        self.captures = 0
+        self.feeds = 0
+        """Meals actually eaten."""
+        self.overfeeds = 0
+        """Meals eaten while hunger was high enough that food was wasted."""
+        self.ignored_feed_clicks = 0
+        """Feed clicks while already eating."""
+        self.chops = 0
+        self.misclicks = 0
+        """Clicks that hit neither target."""
+        self.min_hunger = start_hunger
+        self.starving_seconds = 0.0
+        """Simulated time spent at 0% hunger."""
+
+    def _advance(self, now: float) -> None:
+        """Bring the hunger level up to `now`. Lock held."""
+        if self._meal_at is not None and self._meal_at <= now:
+            self._drain_until(self._meal_at)
+            if self._hunger > 100.0 - self.feed_amount:
+                self.overfeeds += 1
+            self._hunger = min(100.0, self._hunger + self.feed_amount)
+            self.feeds += 1
+            self._meal_at = None
+        self._drain_until(now)
+
+    def _drain_until(self, t: float) -> None:
+        """Drain hunger from the last update to t. Lock held."""
+        elapsed = t - self._updated
+        if elapsed <= 0:
+            return
+        drained = self._hunger - elapsed * self.drain_per_second
+        if drained < 0:
+            self.starving_seconds += -drained / self.drain_per_second if self.drain_per_second else 0
+            drained = 0.0
+        self._hunger = drained
+        self.min_hunger = min(self.min_hunger, drained)
+        self._updated = t
+
+    def hunger(self) -> float:
+        """Return the current hunger percentage."""
+        with self._lock:
+            self._advance(self.clock.now())
+            return self._hunger
+
+    def render(self, region: Tuple[int, int, int, int]):
+        """
+        Render a screen region as a synthetic frame.
+
+        Args:
+            region: Logical (x, y, width, height)
+
+        Returns:
+            PIL.Image: RGB image of the region (scale 1.0)
+        """
+        from PIL import Image
+
+        x, y, width, height = region
+        hunger = self.hunger()
+        self.captures += 1
+        image = Image.new("RGB", (width, height), BACKGROUND_COLOR)
+
+        bx, by, bw, bh = self.bar_region
+        fill_right = bx + round(bw * hunger / 100.0)
+        left, top = max(x, bx), max(y, by)
+        right, bottom = min(x + width, fill_right), min(y + height, by + bh)
+        if right > left and bottom > top:
+            image.paste(BAR_COLOR, (left - x, top - y, right - x, bottom - y))
+        return image
+
+    def click(self, x: int, y: int) -> None:
+        """Handle a click on the simulated screen."""
+        with self._lock:
+            now = self.clock.now()
+            self._advance(now)
+            if _near((x, y), self.feed_point):
+                if self._meal_at is not None:
+                    self.ignored_feed_clicks += 1
+                else:
+                    self._meal_at = now + self.eat_delay
+            elif _near((x, y), self.chop_point):
+                self.chops += 1
+            else:
+                self.misclicks += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return scheduling metrics for the run so far.
+
+        Returns:
+            dict: Simulated seconds, capture/feed/click counts and ratios
+        """
+        with self._lock:
+            self._advance(self.clock.now())
+            elapsed = self.clock.now() - self.started
+        return {
+            "simulated_seconds": round(elapsed, 1),
+            "captures": self.captures,
+            "feeds": self.feeds,
+            "captures_per_feed": round(self.captures / self.feeds, 1) if self.feeds else None,
+            "overfeeds": self.overfeeds,
+            "ignored_feed_clicks": self.ignored_feed_clicks,
+            "chops": self.chops,
+            "misclicks": self.misclicks,
+            "min_hunger": round(self.min_hunger, 1),
+            "starving_seconds": round(self.starving_seconds, 1),
+        }
+
+
+def _near(point: Tuple[int, int], target: Tuple[int, int]) -> bool:
+    """Return True if a click lands within HIT_RADIUS of a target."""
+    return abs(point[0] - target[0]) <= HIT_RADIUS and abs(point[1] - target[1]) <= HIT_RADIUS
+
+
+class _StubInput:
+    """Input backend that forwards clicks to the simulated game."""
+
+    def __init__(self, game: SimulatedGame):
+        self.game = game
+        self.pointer = (0, 0)
+
+    def click(self, x, y, _pause=True):
+        self.pointer = (x, y)
+        self.game.click(x, y)
+
+    def moveTo(self, x, y, _pause=True):
+        self.pointer = (x, y)
+
+    def mouseDown(self, x, y, button="left", _pause=True):
+        self.pointer = (x, y)
+
+    def mouseUp(self, x, y, button="left", _pause=True):
+        self.pointer = (x, y)
+        self.game.click(x, y)
+
+    def press(self, key, _pause=True):
+        pass
+
+    def keyDown(self, key, _pause=True):
+        pass
+
+    def keyUp(self, key, _pause=True):
+        pass
+
+    def position(self):
+        return self.pointer
+
+
+class installed:
+    """
+    Context manager routing screen capture and input to a simulated game.
+
+    Usage:
+        with game_simulator.installed(game):
+            ...  # workers now see and click the simulated game
+    """
+
+    def __init__(self, game: SimulatedGame):
+        self.game = game
+
+    def __enter__(self) -> SimulatedGame:
+        self._saved = (screen_capture._grab_backend, input_control._pyautogui)
+        screen_capture._grab_backend = self.game.render
+        input_control._pyautogui = _StubInput(self.game)
+        return self.game
+
+    def __exit__(self, *exc) -> None:
+        screen_capture._grab_backend, input_control._pyautogui = self._saved
+
+
+def configure_state(state, game: SimulatedGame) -> None:
+    """
+    Point an AppState's regions and triggers at the simulated game.
+
+    Args:
+        state: AppState instance (other settings are left as they are)
+        game: The simulated game
+    """
+    state.hunger_region = game.bar_region
+    state.feed_trigger = game.feed_point
+    state.chop_trigger = game.chop_point
+    state.anchor_mode = "NONE"
+    # The simulated game never loses focus or freezes
+    state.watchdog_enabled = False
+    # Simulations run flat out; keep the measured intervals as configured
+    state.cpu_budget_percent = 0
+
+
+def run_simulation(state, tasks: List[str], seconds: float, speed: Optional[float] = None,
+                   game_kwargs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Run tasks against a simulated game and report scheduling metrics.
+
+    Args:
+        state: AppState with the settings under test; its regions and
+               triggers are pointed at the simulated game and its clock is
+               replaced for the duration of the run
+        tasks: Task names for task_runner (e.g. ["monitor"])
+        seconds: Simulated seconds to run
+        speed: Simulated seconds per real second; None runs a single task
+               on a VirtualClock as fast as possible
+        game_kwargs: Extra SimulatedGame arguments (drain rate, etc.)
+
+    Returns:
+        dict: SimulatedGame.stats() plus the real time the run took
+    """
+    if speed is None and len(tasks) > 1:
+        raise ValueError("Concurrent tasks need a speed (ScaledClock)")
+    clock = VirtualClock() if speed is None else ScaledClock(speed)
+    game = SimulatedGame(clock, **(game_kwargs or {}))
+    configure_state(state, game)
+
+    logger = logging.getLogger("afk_auto_help.simulation")
+    logger.propagate = False
+    saved_clock = state.clock
+    state.clock = clock
+    runner = TaskRunner(state, LoggingStatusSink(state, logger))
+    real_start = time.perf_counter()
+    end = clock.now() + seconds
+    if isinstance(clock, VirtualClock):
+        def _finish():
+            state.stop_all_flag = True
+        clock.stop_at(end, _finish)
+    try:
+        with installed(game):
+            for task in tasks:
+                error = runner.start(task)
+                if error is not None:
+                    raise ValueError(f"Cannot start {task}: {error}")
+            while clock.now() < end and not runner.is_idle():
+                time.sleep(0.005)
+            runner.stop_all()
+    finally:
+        state.clock = saved_clock
+
+    stats = game.stats()
+    stats["real_seconds"] = round(time.perf_counter() - real_start, 2)
+    return stats
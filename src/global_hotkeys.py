@@ -0,0 +1,192 @@
+"""
+AFK Auto-Help Module: Global Hotkeys
+
+System-wide hotkeys that work while the game is fullscreen and the app
+window is out of reach:
+
+- stop:  STOP ALL (default Ctrl+Shift+X)
+- pause: pause/resume all tasks (default Ctrl+Shift+P)
+
+Handlers only set state: stop sets AppState.stop_event, which every
+worker wait (scheduler deadlines, sleeps, pauses) wakes up on at once, so
+clicking ends within milliseconds even at high click rates. Nothing is
+joined on the listener thread.
+
+Backends:
+- pynput (optional; pip install pynput), imported when the listener starts
+- StubHotkeyBackend: fires hotkeys on demand, for tests and simulations
+"""
+
+from typing import Callable, Dict, Optional
+
+
+ACTION_STOP = "stop"
+ACTION_PAUSE = "pause"
+
+DEFAULT_HOTKEYS = {
+    ACTION_STOP: "<ctrl>+<shift>+x",
+    ACTION_PAUSE: "<ctrl>+<shift>+p",
+}
+"""Hotkey per action, in pynput's GlobalHotKeys syntax."""
+
+
+def request_stop(state) -> None:
+    """
+    Stop all tasks without waiting for them (safe from any thread).
+
+    Args:
+        state: AppState instance
+    """
+    state.chop_running = False
+    state.user_paused = False
+    state.stop_all_flag = True
+
+
+def toggle_pause(state) -> bool:
+    """
+    Pause or resume all tasks (safe from any thread).
+
+    Args:
+        state: AppState instance
+
+    Returns:
+        bool: True if tasks are now paused
+    """
+    state.user_paused = not state.user_paused
+    return state.user_paused
+
+
+class PynputHotkeyBackend:
+    """Listens for hotkeys system-wide with pynput."""
+
+    def __init__(self):
+        """
+        Raises:
+            ImportError: If pynput is not installed
+        """
+        from pynput import keyboard
+        self._keyboard = keyboard
+        self._listener = None
+
+    def start(self, bindings: Dict[str, Callable[[], None]]) -> None:
+        """Start listening; bindings map hotkey strings to handlers."""
+        self._listener = self._keyboard.GlobalHotKeys(bindings)
+        self._listener.daemon = True
+        self._listener.start()
+
+    def stop(self) -> None:
+        """Stop listening."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+
+class StubHotkeyBackend:
+    """Backend whose hotkeys are fired by calling press()."""
+
+    def __init__(self):
+        self.bindings: Dict[str, Callable[[], None]] = {}
+
+    def start(self, bindings: Dict[str, Callable[[], None]]) -> None:
+        self.bindings = dict(bindings)
+
+    def stop(self) -> None:
+        self.bindings = {}
+
+    def press(self, hotkey: str) -> bool:
+        """
+        Fire a hotkey as if it had been pressed.
+
+        Returns:
+            bool: True if the hotkey is bound
+        """
+        handler = self.bindings.get(hotkey)
+        if handler is None:
+            return False
+        handler()
+        return True
+
+
+class HotkeyListener:
+    """Connects global hotkeys to an AppState."""
+
+    def __init__(self, state, sink, hotkeys: Optional[Dict[str, str]] = None, backend=None,
+                 handlers: Optional[Dict[str, Callable[[], None]]] = None):
+        """
+        Initialize the listener.
+
+        Args:
+            state: AppState instance the actions apply to
+            sink: StatusSink for feedback messages
+            hotkeys: Action -> hotkey overrides (default: state.global_hotkeys)
+            backend: Hotkey backend (default: pynput when started)
+            handlers: Action -> handler overrides, e.g. to stop several
+                      sessions at once (default: act on state)
+        """
+        self.state = state
+        self.sink = sink
+        self.hotkeys = dict(DEFAULT_HOTKEYS)
+        self.hotkeys.update(hotkeys if hotkeys is not None else (state.global_hotkeys or {}))
+        self.backend = backend
+        self.handlers = {ACTION_STOP: self._on_stop, ACTION_PAUSE: self._on_pause}
+        self.handlers.update(handlers or {})
+
+    def _on_stop(self) -> None:
+        request_stop(self.state)
+        self.sink.safe_status_update("STOP ALL (hotkey)")
+
+    def _on_pause(self) -> None:
+        if toggle_pause(self.state):
+            self.sink.safe_status_update("Paused (hotkey) - press again to resume")
+        else:
+            self.sink.safe_status_update("Resumed (hotkey)")
+
+    def start(self) -> Optional[str]:
+        """
+        Start listening.
+
+        Returns:
+            str: Error message if no backend is available, or None on success
+        """
+        if self.backend is None:
+            try:
+                self.backend = PynputHotkeyBackend()
+            except ImportError:
+                return "Global hotkeys unavailable (pip install pynput)"
+        bindings = {self.hotkeys[action]: handler for action, handler in self.handlers.items()
+                    if self.hotkeys.get(action)}
+        try:
+            self.backend.start(bindings)
+        except Exception as e:
+            return f"Global hotkeys unavailable: {e}"
+        return None
+
+    def stop(self) -> None:
+        """Stop listening."""
+        if self.backend is not None:
+            self.backend.stop()
+
+
+def start_listener(state, sink,
+                   handlers: Optional[Dict[str, Callable[[], None]]] = None) -> Optional[HotkeyListener]:
+    """
+    Start global hotkeys for an AppState if enabled in its settings.
+
+    Problems (no pynput, no permission) are reported through the sink.
+
+    Args:
+        state: AppState instance
+        sink: StatusSink for feedback messages
+        handlers: Action -> handler overrides (see HotkeyListener)
+
+    Returns:
+        HotkeyListener, or None if disabled or unavailable
+    """
+    if not state.global_hotkeys_enabled:
+        return None
+    listener = HotkeyListener(state, sink, handlers=handlers)
+    error = listener.start()
+    if error is not None:
+        sink.safe_status_update(error)
+        return None
+    return listener
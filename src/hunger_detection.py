@@ -5,14 +5,27 @@ This module implements the screenshot-based hunger bar detection algorithm.
 It analyzes screen regions to determine the current hunger percentage using
 color-based pixel classification.
 
+Classification thresholds are plain dicts (see default_thresholds()) so
+they can be stored per settings profile. Two forms are supported:
+- RATIO:   the original brightness + red-dominance heuristics
+- CLUSTER: a bar color and radius learned by calibrate_thresholds() from
+           captures of a full and a near-empty bar
+compile_classifier() turns a threshold dict into a counting function that
+works directly on the captured image bytes with the thresholds bound as
+locals, which is much faster than calling classify_pixel() per pixel.
+
 NOTE:
 This file contains the initial scaffolding for Phase 0.
 Full implementation will be completed in Phase 3 (Hunger Bar Detection Engine).
 """
 
-from typing import Optional, Tuple
-import pyautogui
-from PIL import Image
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import screen_capture
+from clock import REAL_CLOCK
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 # Configurable detection thresholds
@@ -24,6 +37,23 @@ GREEN_RATIO_THRESHOLD = 0.9
 """Minimum ratio of red to green for bar color detection."""
 PIXEL_SAMPLE_RATE = 2
 """Sample every Nth pixel for performance (2 = every other pixel)."""
+BURST_INTERVAL = 0.05
+"""Seconds between captures while watching for a hunger rise after feeding."""
+
+MODE_RATIO = "RATIO"
+MODE_CLUSTER = "CLUSTER"
+
+CALIBRATION_DIFF_MIN = 60
+"""Minimum summed RGB difference for a pixel to count as changed between
+the full and near-empty calibration captures."""
+CALIBRATION_MIN_PIXELS = 20
+"""Minimum number of changed pixels needed to fit thresholds."""
+CALIBRATION_MAX_ERROR = 0.01
+"""Largest fill error (0.0-1.0) accepted when choosing a coarser sample rate."""
+CALIBRATION_MIN_COLUMNS = 50
+"""Minimum number of sampled columns across the bar."""
+MAX_SAMPLE_RATE = 8
+"""Largest sample rate considered by calibration."""
 
 
 def classify_pixel(r: int, g: int, b: int) -> bool:
@@ -56,7 +86,157 @@ def classify_pixel(r: int, g: int, b: int) -> bool:
     return False
 
 
-def read_hunger_percentage(region: Optional[Tuple[int, int, int, int]]) -> float:
+def default_thresholds() -> Dict[str, Any]:
+    """
+    Return the built-in RATIO thresholds.
+    
+    Returns:
+        dict: Threshold dict usable with compile_classifier()
+    """
+    return {
+        "mode": MODE_RATIO,
+        "brightness": BRIGHTNESS_THRESHOLD,
+        "red_dominance": RED_DOMINANCE_FACTOR,
+        "green_ratio": GREEN_RATIO_THRESHOLD,
+        "sample_rate": PIXEL_SAMPLE_RATE,
+    }
+
+
+def make_pixel_classifier(thresholds: Optional[Dict[str, Any]] = None) -> Callable[[int, int, int], bool]:
+    """
+    Return a per-pixel classifier for a threshold dict.
+    
+    Args:
+        thresholds: Threshold dict, or None for the defaults
+        
+    Returns:
+        callable: Function (r, g, b) -> bool, True for filled bar pixels
+    """
+    t = thresholds or default_thresholds()
+    if t["mode"] == MODE_CLUSTER:
+        cr, cg, cb = t["color"]
+        radius_sq = t["radius"] ** 2
+        
+        def classify(r: int, g: int, b: int) -> bool:
+            return (r - cr) ** 2 + (g - cg) ** 2 + (b - cb) ** 2 <= radius_sq
+        return classify
+    
+    min_sum = t["brightness"] * 3
+    green_ratio = t["green_ratio"]
+    red_dominance = t["red_dominance"]
+    
+    def classify(r: int, g: int, b: int) -> bool:
+        return r + g + b >= min_sum and r > g * green_ratio and r > b * red_dominance
+    return classify
+
+
+_compiled_cache: Dict[tuple, Callable] = {}
+
+
+def compile_classifier(thresholds: Optional[Dict[str, Any]] = None) -> Callable[[bytes, int, int, int], Tuple[int, int]]:
+    """
+    Compile a threshold dict into a fast pixel-counting function.
+    
+    The returned function takes raw RGB bytes (Image.tobytes()), the image
+    width and height, and a sampling step, and returns (filled, total)
+    over every step-th pixel of every step-th row. Compiled functions are
+    cached per threshold values.
+    
+    Args:
+        thresholds: Threshold dict, or None for the defaults
+        
+    Returns:
+        callable: count(data, width, height, step) -> (filled, total)
+    """
+    t = thresholds or default_thresholds()
+    key = tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in t.items()))
+    compiled = _compiled_cache.get(key)
+    if compiled is not None:
+        return compiled
+    
+    if t["mode"] == MODE_CLUSTER:
+        cr, cg, cb = t["color"]
+        radius_sq = t["radius"] ** 2
+        
+        def count(data: bytes, width: int, height: int, step: int) -> Tuple[int, int]:
+            row_bytes = width * 3
+            stride = step * 3
+            filled = 0
+            total = 0
+            for py in range(0, height, step):
+                row = data[py * row_bytes:(py + 1) * row_bytes]
+                for i in range(0, row_bytes, stride):
+                    dr = row[i] - cr
+                    dg = row[i + 1] - cg
+                    db = row[i + 2] - cb
+                    if dr * dr + dg * dg + db * db <= radius_sq:
+                        filled += 1
+                    total += 1
+            return filled, total
+    else:
+        min_sum = t["brightness"] * 3
+        green_ratio = t["green_ratio"]
+        red_dominance = t["red_dominance"]
+        
+        def count(data: bytes, width: int, height: int, step: int) -> Tuple[int, int]:
+            row_bytes = width * 3
+            stride = step * 3
+            filled = 0
+            total = 0
+            for py in range(0, height, step):
+                row = data[py * row_bytes:(py + 1) * row_bytes]
+                for i in range(0, row_bytes, stride):
+                    r = row[i]
+                    g = row[i + 1]
+                    b = row[i + 2]
+                    if r + g + b >= min_sum and r > g * green_ratio and r > b * red_dominance:
+                        filled += 1
+                    total += 1
+            return filled, total
+    
+    _compiled_cache[key] = count
+    return count
+
+
+def fill_of_image(image, logical_width: int, thresholds: Optional[Dict[str, Any]] = None,
+                  sample_rate: Optional[int] = None, pool=None) -> float:
+    """
+    Compute the filled fraction of a captured hunger bar image.
+    
+    Args:
+        image: PIL.Image of the region (physical resolution)
+        logical_width: Width of the region in logical coordinates
+        thresholds: Threshold dict, or None for the defaults
+        sample_rate: Override the thresholds' sample rate (logical pixels)
+        pool: Optional detection_pool.DetectionPool to count pixels in
+        
+    Returns:
+        float: Fill level from 0.0 to 1.0
+    """
+    t = thresholds or default_thresholds()
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    
+    # The image has physical resolution (2x the region on Retina);
+    # scale the sampling step so the same points are classified
+    image_width, image_height = image.size
+    scale = image_width / logical_width
+    rate = sample_rate if sample_rate is not None else t.get("sample_rate", PIXEL_SAMPLE_RATE)
+    step = max(1, round(rate * scale))
+    
+    if pool is not None:
+        filled, total = pool.count_pixels(image, step, thresholds).result()
+    else:
+        filled, total = compile_classifier(t)(image.tobytes(), image_width, image_height, step)
+    if total == 0:
+        return 0.0
+    return max(0.0, min(1.0, filled / total))  # Clamp to [0.0, 1.0]
+
+
+def read_hunger_percentage(region: Optional[Tuple[int, int, int, int]],
+                           thresholds: Optional[Dict[str, Any]] = None,
+                           pool=None, sample_rate: Optional[int] = None,
+                           capture: Optional[Callable[[Tuple[int, int, int, int]], Any]] = None) -> float:
     """
     Read the current hunger bar fill percentage from a screen region.
     
@@ -64,8 +244,17 @@ def read_hunger_percentage(region: Optional[Tuple[int, int, int, int]]) -> float
     to determine what percentage of the bar is filled (orange/red).
     
     Args:
-        region: Tuple (x, y, width, height) of the hunger bar region.
-                If None or invalid, returns 0.0.
+        region: Tuple (x, y, width, height) of the hunger bar region in
+                logical coordinates. If None or invalid, returns 0.0.
+        thresholds: Classification thresholds (e.g. AppState.hunger_thresholds),
+                or None for the built-in defaults
+        pool: Optional detection_pool.DetectionPool to classify pixels in,
+              keeping the calling thread's GIL use minimal
+        sample_rate: Override the thresholds' sample rate (logical pixels),
+                     e.g. a sparser one from the CPU governor
+        capture: Function returning the image of a region (e.g. a
+                 multi_session.CaptureBus shared by several sessions), or
+                 None to capture it directly
         
     Returns:
         float: Hunger fill level as a value from 0.0 to 1.0 (0% to 100%).
@@ -83,37 +272,152 @@ def read_hunger_percentage(region: Optional[Tuple[int, int, int, int]]) -> float
             return 0.0
         
         # Capture screenshot of the region
-        screenshot = pyautogui.screenshot(region=(x, y, width, height))
-        
-        # Convert to RGB if needed
-        if screenshot.mode != 'RGB':
-            screenshot = screenshot.convert('RGB')
-        
-        # Count filled vs. total pixels
-        filled_pixels = 0
-        total_pixels = 0
-        
-        # Sample pixels for performance (scan every Nth pixel)
-        for py in range(0, height, PIXEL_SAMPLE_RATE):
-            for px in range(0, width, PIXEL_SAMPLE_RATE):
-                r, g, b = screenshot.getpixel((px, py))
-                
-                if classify_pixel(r, g, b):
-                    filled_pixels += 1
-                total_pixels += 1
-        
-        # Calculate percentage
-        if total_pixels == 0:
-            return 0.0
+        screenshot = (capture or screen_capture.capture_region)((x, y, width, height))
         
-        percentage = filled_pixels / total_pixels
-        return max(0.0, min(1.0, percentage))  # Clamp to [0.0, 1.0]
+        return fill_of_image(screenshot, width, thresholds, sample_rate, pool=pool)
         
     except Exception as e:
         # Return 0.0 on any error
         return 0.0
 
 
+def watch_for_rise(region: Optional[Tuple[int, int, int, int]],
+                   baseline: float,
+                   min_rise: float,
+                   window: float,
+                   should_stop: Optional[Callable[[], bool]] = None,
+                   interval: float = BURST_INTERVAL,
+                   thresholds: Optional[Dict[str, Any]] = None,
+                   pool=None,
+                   clock=None,
+                   sample_rate: Optional[int] = None,
+                   capture: Optional[Callable[[Tuple[int, int, int, int]], Any]] = None) -> Optional[float]:
+    """
+    Capture the hunger bar in a short high-rate burst until it rises.
+    
+    Used after a feed click to confirm that food was actually eaten.
+    Returns as soon as a rise is seen, so a successful feed is confirmed
+    within one or two captures of the bar updating.
+    
+    Args:
+        region: Tuple (x, y, width, height) of the hunger bar region
+        baseline: Hunger fill (0.0-1.0) read before the feed click
+        min_rise: Minimum increase over baseline (0.0-1.0) that counts as fed
+        window: Seconds to keep watching before giving up
+        should_stop: Called between captures; returning True ends the burst
+        interval: Target seconds between captures
+        thresholds: Classification thresholds, or None for the defaults
+        pool: Optional detection_pool.DetectionPool for classification
+        clock: Time source (clock.Clock); defaults to real time
+        sample_rate: Sampling step override, as for read_hunger_percentage()
+        capture: Capture function, as for read_hunger_percentage()
+        
+    Returns:
+        float: The first reading at or above baseline + min_rise, or None if
+               no rise was seen within the window
+    """
+    clock = clock or REAL_CLOCK
+    target = baseline + min_rise
+    deadline = clock.now() + window
+    next_capture = clock.now()
+    while True:
+        if should_stop is not None and should_stop():
+            return None
+        reading = read_hunger_percentage(region, thresholds, pool, sample_rate, capture)
+        if reading >= target:
+            return reading
+        next_capture += interval
+        now = clock.now()
+        if next_capture >= deadline:
+            return None
+        if next_capture > now:
+            clock.sleep(next_capture - now)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Return the value at a fraction (0.0-1.0) of a sorted list."""
+    index = min(len(sorted_values) - 1, max(0, int(fraction * len(sorted_values))))
+    return sorted_values[index]
+
+
+def calibrate_thresholds(full_image, empty_image, logical_width: int) -> Dict[str, Any]:
+    """
+    Fit CLUSTER thresholds from captures of a full and a near-empty bar.
+    
+    Pixels that change between the two captures are where the bar emptied:
+    in the full capture they show the bar color, in the near-empty capture
+    the background. The bar color is the per-channel median of the former;
+    the radius is placed midway between the bar pixels (98th percentile
+    distance) and the background pixels (2nd percentile distance), or, if
+    those overlap, at the distance that classifies the most pixels
+    correctly. Finally the coarsest sample rate whose fill estimate stays
+    within CALIBRATION_MAX_ERROR of a full scan is chosen.
+    
+    Args:
+        full_image: PIL.Image of the hunger region with the bar full
+        empty_image: PIL.Image of the same region with the bar nearly empty
+        logical_width: Width of the region in logical coordinates
+        
+    Returns:
+        dict: CLUSTER thresholds, plus "accuracy" (0.0-1.0) on the
+              calibration pixels for display
+        
+    Raises:
+        ValueError: If the images differ in size or too few pixels changed
+    """
+    full_image = full_image.convert('RGB')
+    empty_image = empty_image.convert('RGB')
+    if full_image.size != empty_image.size:
+        raise ValueError("Calibration captures have different sizes")
+    
+    bar_pixels = []
+    background_pixels = []
+    for full_px, empty_px in zip(full_image.getdata(), empty_image.getdata()):
+        if sum(abs(a - b) for a, b in zip(full_px, empty_px)) >= CALIBRATION_DIFF_MIN:
+            bar_pixels.append(full_px)
+            background_pixels.append(empty_px)
+    if len(bar_pixels) < CALIBRATION_MIN_PIXELS:
+        raise ValueError("The bar barely changed between captures - "
+                         "capture it once full and once nearly empty")
+    
+    color = [sorted(px[c] for px in bar_pixels)[len(bar_pixels) // 2] for c in range(3)]
+    
+    def distance(px) -> float:
+        return ((px[0] - color[0]) ** 2 + (px[1] - color[1]) ** 2 + (px[2] - color[2]) ** 2) ** 0.5
+    
+    bar_dist = sorted(distance(px) for px in bar_pixels)
+    bg_dist = sorted(distance(px) for px in background_pixels)
+    inner = _percentile(bar_dist, 0.98)
+    outer = _percentile(bg_dist, 0.02)
+    if inner < outer:
+        radius = (inner + outer) / 2.0
+    else:
+        # Overlapping clusters: pick the radius with the fewest errors
+        best_errors = None
+        radius = inner
+        for candidate in bar_dist[::max(1, len(bar_dist) // 200)]:
+            errors = (len(bar_dist) - sum(1 for d in bar_dist if d <= candidate)
+                      + sum(1 for d in bg_dist if d <= candidate))
+            if best_errors is None or errors < best_errors:
+                best_errors, radius = errors, candidate
+    
+    thresholds = {"mode": MODE_CLUSTER, "color": color, "radius": round(radius, 2), "sample_rate": 1}
+    correct = (sum(1 for d in bar_dist if d <= radius) + sum(1 for d in bg_dist if d > radius))
+    
+    # Coarsest sample rate that keeps the fill estimate accurate
+    reference = [fill_of_image(img, logical_width, thresholds, 1) for img in (full_image, empty_image)]
+    for rate in range(MAX_SAMPLE_RATE, 1, -1):
+        if logical_width / rate < CALIBRATION_MIN_COLUMNS:
+            continue
+        estimates = [fill_of_image(img, logical_width, thresholds, rate) for img in (full_image, empty_image)]
+        if all(abs(e - r) <= CALIBRATION_MAX_ERROR for e, r in zip(estimates, reference)):
+            thresholds["sample_rate"] = rate
+            break
+    
+    thresholds["accuracy"] = round(correct / (len(bar_dist) + len(bg_dist)), 4)
+    return thresholds
+
+
 def detect_hunger_level(region: Optional[Tuple[int, int, int, int]]) -> Optional[float]:
     """
     Detect the current hunger level from a screen region.
@@ -134,7 +438,7 @@ def detect_hunger_level(region: Optional[Tuple[int, int, int, int]]) -> Optional
     return percentage * 100.0
 
 
-def capture_region_screenshot(region: Optional[Tuple[int, int, int, int]]) -> Optional[Image.Image]:
+def capture_region_screenshot(region: Optional[Tuple[int, int, int, int]]) -> "Optional[Image.Image]":
     """
     Capture a screenshot of the specified screen region.
     
@@ -144,15 +448,7 @@ def capture_region_screenshot(region: Optional[Tuple[int, int, int, int]]) -> Op
     Returns:
         PIL.Image: Screenshot image of the region, or None on error
     """
-    if region is None:
-        return None
-    
     try:
-        x, y, width, height = region
-        if width <= 0 or height <= 0:
-            return None
-        
-        screenshot = pyautogui.screenshot(region=(x, y, width, height))
-        return screenshot
+        return screen_capture.capture_region(region)
     except Exception:
         return None
@@ -0,0 +1,366 @@
+"""
+AFK Auto-Help Module: Hunger History
+
+Keeps hunger readings and feeds in fixed-size, array-backed rings so a
+multi-day session uses constant memory:
+
+- raw:    every reading (RAW_CAPACITY, about an hour at monitor rate)
+- minute: per-minute mean/min/max (MINUTE_CAPACITY, two days)
+- hour:   per-hour mean/min/max (HOUR_CAPACITY, sixty days)
+- feeds:  time of each feed (FEED_CAPACITY)
+
+Each resolution is filled as readings arrive (a bucket is written when the
+first reading of the next bucket comes in), so nothing is recomputed from
+raw data. drain_per_minute() and feeds_per_hour() summarize the data for
+drain-rate and feed-efficiency checks.
+
+The history is saved to a small binary file (DEFAULT_HISTORY_PATH) every
+few minutes while recording and when the app stops, and loaded on start.
+Workers record into AppState.hunger_history when it is set; its times come
+from the state's clock (Clock.wall()), and the workers start autosaves
+(save_due()) on a background thread so recording never waits for the disk.
+"""
+
+import logging
+import os
+import struct
+import threading
+import time
+from array import array
+from typing import Callable, List, Optional, Tuple
+
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.expanduser("~"), ".afk_auto_help_history.bin")
+"""Default location of the saved history file."""
+
+RAW_CAPACITY = 4096
+MINUTE_CAPACITY = 2 * 24 * 60
+HOUR_CAPACITY = 60 * 24
+FEED_CAPACITY = 2048
+
+SAVE_INTERVAL = 300.0
+"""Seconds between automatic saves while recording."""
+
+RESOLUTION_RAW = "raw"
+RESOLUTION_MINUTE = "minute"
+RESOLUTION_HOUR = "hour"
+
+_FILE_MAGIC = b"AFKH"
+_FILE_VERSION = 1
+_FILE_HEADER = struct.Struct("<4sB3x")
+_RING_HEADER = struct.Struct("<III")
+
+logger = logging.getLogger("afk_auto_help.history")
+
+
+class _Ring:
+    """Fixed-capacity ring of timestamped float columns."""
+
+    def __init__(self, capacity: int, columns: int):
+        self.capacity = capacity
+        self.times = array("d", bytes(8 * capacity))
+        self.columns = [array("f", bytes(4 * capacity)) for _ in range(columns)]
+        self.head = 0
+        """Index of the next slot to write."""
+        self.count = 0
+
+    def append(self, t: float, *values: float) -> None:
+        """Store one row, overwriting the oldest when full."""
+        i = self.head
+        self.times[i] = t
+        for column, value in zip(self.columns, values):
+            column[i] = value
+        self.head = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def copy(self) -> "_Ring":
+        """Return an independent copy of the ring."""
+        ring = _Ring(self.capacity, 0)
+        ring.times = array("d", self.times)
+        ring.columns = [array("f", column) for column in self.columns]
+        ring.head = self.head
+        ring.count = self.count
+        return ring
+
+    def _indices(self) -> range:
+        """Positions of the stored rows, oldest first (before wrapping)."""
+        return range(self.head - self.count, self.head)
+
+    def rows(self, since: float = 0.0) -> List[Tuple[float, ...]]:
+        """Return (t, *values) rows with t >= since, oldest first."""
+        rows = []
+        times, columns, capacity = self.times, self.columns, self.capacity
+        for k in self._indices():
+            i = k % capacity
+            if times[i] >= since:
+                rows.append((times[i],) + tuple(column[i] for column in columns))
+        return rows
+
+    def write(self, f) -> None:
+        """Write the ring to a binary file."""
+        f.write(_RING_HEADER.pack(self.capacity, self.count, self.head))
+        self.times.tofile(f)
+        for column in self.columns:
+            column.tofile(f)
+
+    def read(self, f) -> None:
+        """Fill an empty ring from one written by write(); a different capacity is resampled."""
+        capacity, count, head = _RING_HEADER.unpack(f.read(_RING_HEADER.size))
+        times = array("d")
+        times.fromfile(f, capacity)
+        columns = []
+        for _ in self.columns:
+            column = array("f")
+            column.fromfile(f, capacity)
+            columns.append(column)
+        self.head = 0
+        self.count = 0
+        for k in range(head - count, head):
+            i = k % capacity
+            self.append(times[i], *(column[i] for column in columns))
+
+
+class _Downsampler:
+    """Accumulates readings into fixed-length buckets of a ring."""
+
+    def __init__(self, span: float, capacity: int):
+        self.span = span
+        self.ring = _Ring(capacity, 3)  # mean, min, max
+        self.bucket: Optional[float] = None
+        self.total = 0.0
+        self.n = 0
+        self.low = 0.0
+        self.high = 0.0
+
+    def add(self, t: float, value: float) -> None:
+        """Add a reading, writing out the previous bucket if it is complete."""
+        bucket = t - t % self.span
+        if bucket != self.bucket:
+            self.flush()
+            self.bucket = bucket
+            self.total, self.n, self.low, self.high = 0.0, 0, value, value
+        self.total += value
+        self.n += 1
+        self.low = min(self.low, value)
+        self.high = max(self.high, value)
+
+    def flush(self) -> None:
+        """Write the current bucket (if any) to the ring."""
+        if self.bucket is not None and self.n:
+            self.ring.append(self.bucket, self.total / self.n, self.low, self.high)
+        self.bucket = None
+        self.n = 0
+
+    def rows(self, since: float = 0.0) -> List[Tuple[float, ...]]:
+        """Return completed buckets plus the bucket in progress."""
+        rows = self.ring.rows(since)
+        if self.bucket is not None and self.n and self.bucket >= since:
+            rows.append((self.bucket, self.total / self.n, self.low, self.high))
+        return rows
+
+
+class HungerHistory:
+    """Multi-resolution history of hunger readings and feeds."""
+
+    def __init__(self, path: Optional[str] = None,
+                 time_source: Callable[[], float] = time.time):
+        """
+        Initialize an empty history.
+
+        Args:
+            path: File used by save() and autosave, or None to keep the
+                  history in memory only
+            time_source: Returns the current time in seconds (wall clock
+                         by default, so saved histories line up across runs)
+        """
+        self.path = path
+        self.time_source = time_source
+        self.raw = _Ring(RAW_CAPACITY, 1)
+        self.minutes = _Downsampler(60.0, MINUTE_CAPACITY)
+        self.hours = _Downsampler(3600.0, HOUR_CAPACITY)
+        self.feeds = _Ring(FEED_CAPACITY, 0)
+        self.version = 0
+        """Incremented on every change; lets charts skip redraws."""
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._last_save = time_source()
+
+    def record(self, percent: float, t: Optional[float] = None) -> None:
+        """
+        Store a hunger reading.
+
+        Args:
+            percent: Hunger level 0.0-100.0
+            t: Time of the reading (default: now)
+        """
+        t = self.time_source() if t is None else t
+        with self._lock:
+            self.raw.append(t, percent)
+            self.minutes.add(t, percent)
+            self.hours.add(t, percent)
+            self.version += 1
+
+    def record_feed(self, t: Optional[float] = None) -> None:
+        """Store the time of a feed (default: now)."""
+        with self._lock:
+            self.feeds.append(self.time_source() if t is None else t)
+            self.version += 1
+
+    def save_due(self) -> bool:
+        """
+        Claim the next autosave.
+
+        Returns:
+            bool: True at most once per SAVE_INTERVAL (and never without a
+                  path); the caller should then save(), e.g. off its thread
+        """
+        if self.path is None:
+            return False
+        with self._lock:
+            now = self.time_source()
+            if now - self._last_save < SAVE_INTERVAL:
+                return False
+            self._last_save = now
+            return True
+
+    def series(self, resolution: str = RESOLUTION_RAW,
+               since: float = 0.0) -> List[Tuple[float, float]]:
+        """
+        Return (time, hunger) points at a resolution.
+
+        Args:
+            resolution: RESOLUTION_RAW, RESOLUTION_MINUTE or RESOLUTION_HOUR
+                        (downsampled resolutions give bucket means)
+            since: Oldest time to include
+
+        Returns:
+            list: Points, oldest first
+        """
+        with self._lock:
+            if resolution == RESOLUTION_RAW:
+                rows = self.raw.rows(since)
+            elif resolution == RESOLUTION_MINUTE:
+                rows = self.minutes.rows(since)
+            elif resolution == RESOLUTION_HOUR:
+                rows = self.hours.rows(since)
+            else:
+                raise ValueError(f"Unknown resolution: {resolution}")
+        return [(row[0], row[1]) for row in rows]
+
+    def feed_times(self, since: float = 0.0) -> List[float]:
+        """Return the times of feeds since a time, oldest first."""
+        with self._lock:
+            return [row[0] for row in self.feeds.rows(since)]
+
+    def drain_per_minute(self, window: float = 3600.0) -> Optional[float]:
+        """
+        Estimate how fast hunger drains, ignoring rises from feeding.
+
+        Args:
+            window: Seconds of raw readings to use
+
+        Returns:
+            float: Percentage points lost per minute, or None without data
+        """
+        points = self.series(RESOLUTION_RAW, self.time_source() - window)
+        dropped = 0.0
+        elapsed = 0.0
+        for (t0, v0), (t1, v1) in zip(points, points[1:]):
+            if v1 <= v0:
+                dropped += v0 - v1
+                elapsed += t1 - t0
+        return dropped / elapsed * 60.0 if elapsed > 0 else None
+
+    def feeds_per_hour(self, window: float = 6 * 3600.0) -> float:
+        """Return the average number of feeds per hour over a window."""
+        return len(self.feed_times(self.time_source() - window)) / (window / 3600.0)
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write the history to a binary file.
+
+        Args:
+            path: Destination (default: the history's path)
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        path = path or self.path
+        with self._lock:
+            # Buckets in progress are saved as if complete; they continue
+            # as new buckets after loading
+            minutes = _Ring(MINUTE_CAPACITY, 3)
+            hours = _Ring(HOUR_CAPACITY, 3)
+            for source, target in ((self.minutes, minutes), (self.hours, hours)):
+                for row in source.rows():
+                    target.append(*row)
+            raw = self.raw.copy()
+            feeds = self.feeds.copy()
+            self._last_save = self.time_source()
+        # Write the snapshot without holding up recording
+        with self._save_lock:
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION))
+                for ring in (raw, minutes, hours, feeds):
+                    ring.write(f)
+            os.replace(tmp_path, path)
+
+    def load(self, path: Optional[str] = None) -> None:
+        """
+        Replace the history with one saved by save().
+
+        The file is read completely before anything is replaced, so the
+        history is unchanged if loading fails.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If it is not a history file of this version
+        """
+        path = path or self.path
+        raw = _Ring(RAW_CAPACITY, 1)
+        minutes = _Ring(MINUTE_CAPACITY, 3)
+        hours = _Ring(HOUR_CAPACITY, 3)
+        feeds = _Ring(FEED_CAPACITY, 0)
+        with open(path, "rb") as f:
+            try:
+                magic, version = _FILE_HEADER.unpack(f.read(_FILE_HEADER.size))
+                if magic != _FILE_MAGIC or version != _FILE_VERSION:
+                    raise ValueError(f"{path} is not a version {_FILE_VERSION} hunger history")
+                for ring in (raw, minutes, hours, feeds):
+                    ring.read(f)
+            except (EOFError, struct.error) as e:
+                raise ValueError(f"{path} is truncated: {e}")
+        with self._lock:
+            self.raw = raw
+            self.minutes.ring = minutes
+            self.minutes.bucket = None
+            self.hours.ring = hours
+            self.hours.bucket = None
+            self.feeds = feeds
+            self.version += 1
+
+
+def open_history(state, path: str = DEFAULT_HISTORY_PATH) -> HungerHistory:
+    """
+    Load (or start) the saved history and attach it to an AppState.
+
+    Times are taken from the state's clock (in wall-clock seconds), so
+    simulated runs record simulated time.
+
+    Args:
+        state: AppState instance; its hunger_history is set
+        path: History file
+
+    Returns:
+        HungerHistory: The attached history (empty if the file could not
+                       be loaded)
+    """
+    history = HungerHistory(path, time_source=lambda: state.clock.wall())
+    if os.path.exists(path):
+        try:
+            history.load()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Starting a new hunger history: {e}")
+    state.hunger_history = history
+    return history
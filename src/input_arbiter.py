@@ -0,0 +1,483 @@
+"""
+AFK Auto-Help Module: Input Arbiter
+
+Owns the mouse and keyboard. Features never drive input directly; they
+submit requests to an InputArbiter, whose single thread executes them one
+at a time. This keeps concurrent features (or several game sessions) from
+interleaving their clicks.
+
+Each request comes from a source (a feature such as "feed" or "chop") in a
+session, has a priority, and runs in order relative to other requests from
+the same source. When choosing the next action among the sources' oldest
+requests, the arbiter picks:
+
+1. the highest priority (lowest number), so feeding preempts chopping
+2. the session that currently has focus, so windows are switched only when
+   that session has nothing left to do (or has had MAX_FOCUSED_RUN actions
+   in a row while others were waiting)
+3. the position closest to the pointer, to minimize mouse travel
+
+A move queued behind another pending move from the same source replaces
+it, and a pending move followed by a click from the same source is dropped
+(the click moves the pointer anyway).
+
+A request that has not started yet can be withdrawn with cancel(), e.g.
+by a worker whose wait timed out, so a click the worker already gave up
+on does not run later. Requests submitted with a stop_event are dropped
+unexecuted once it is set (AppState.stop_event: STOP ALL).
+
+A transaction (transaction()) is a short sequence of steps, e.g. press the
+item hotkey, check the screen, click, that runs as one request: nothing
+else is interleaved, and steps are separated only by their own small
+delays instead of the input backend's default pause.
+
+Single-window workers share one process-wide arbiter via get_arbiter().
+Workers look theirs up with arbiter_for(state), which returns
+AppState.input when set: a SessionInput that tags every action with one
+session of a shared multi-session arbiter (see multi_session).
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import input_control
+
+logger = logging.getLogger("afk_auto_help.input")
+
+
+ACTION_CLICK = "click"
+ACTION_MOVE = "move"
+ACTION_PRESS = "press"
+ACTION_CHECK = "check"
+"""Transaction step that calls a function; False aborts the transaction."""
+ACTION_BATCH = "batch"
+"""Request kind of a transaction."""
+ACTION_KINDS = (ACTION_CLICK, ACTION_MOVE, ACTION_PRESS)
+
+FOCUS_SETTLE_DELAY = 0.05
+"""Seconds to wait after switching windows before sending input."""
+
+PRIORITY_FEED = 0
+"""Priority of feeding actions (runs before everything else)."""
+PRIORITY_NORMAL = 5
+"""Default priority."""
+PRIORITY_CHOP = 10
+"""Priority of chop clicks (yield to everything else)."""
+
+MAX_FOCUSED_RUN = 8
+"""Consecutive actions for the focused session before waiting sessions get a turn."""
+
+
+class Step(NamedTuple):
+    """One step of a transaction."""
+
+    kind: str
+    """ACTION_CLICK, ACTION_MOVE, ACTION_PRESS or ACTION_CHECK."""
+    x: int = 0
+    y: int = 0
+    key: str = ""
+    delay: float = 0.0
+    """Seconds to wait after the step."""
+    check: Optional[Callable[[], bool]] = None
+    """Function called by ACTION_CHECK steps."""
+
+
+class InputRequest:
+    """A single queued input action and its completion state."""
+
+    __slots__ = ("session", "source", "priority", "kind", "x", "y", "key", "steps", "done", "ok",
+                 "error", "stop_event")
+
+    def __init__(self, session: str, kind: str, x: int = 0, y: int = 0, key: str = "",
+                 source: str = "", priority: int = PRIORITY_NORMAL,
+                 stop_event: Optional[threading.Event] = None):
+        self.session = session
+        self.source = source
+        self.priority = priority
+        self.kind = kind
+        self.x = x
+        self.y = y
+        self.key = key
+        self.steps: Sequence[Step] = ()
+        """Steps of a transaction (ACTION_BATCH only)."""
+        self.done = threading.Event()
+        """Set once the action has been executed (or dropped)."""
+        self.ok = False
+        """True if the action was executed successfully."""
+        self.error: Optional[str] = None
+        """Why the action failed, if the input backend raised."""
+        self.stop_event = stop_event
+        """Drops the request unexecuted once set."""
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the action to run.
+
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            bool: True if the action ran successfully within the timeout
+        """
+        return self.done.wait(timeout) and self.ok
+
+
+class InputArbiter:
+    """
+    Serializes input from all features through one worker thread.
+
+    Call start() once; submit() may then be called from any thread.
+    """
+
+    def __init__(self, focus: Optional[Callable[[str], None]] = None):
+        """
+        Initialize the arbiter.
+
+        Args:
+            focus: Called with a session name to bring that session's game
+                   window to the front before its input runs; None when
+                   all input goes to one window
+        """
+        self.focus = focus
+        self._queues: Dict[Tuple[str, str], Deque[InputRequest]] = {}
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._focused: Optional[str] = None
+        self._focused_run = 0
+        self._pointer: Optional[Tuple[int, int]] = None
+        self.coalesced = 0
+        """Number of moves merged into a later move or click."""
+        self.executed = 0
+        """Number of actions executed."""
+        self.focus_switches = 0
+        """Number of times focus moved to a different session."""
+
+    def start(self) -> None:
+        """Start the arbiter thread (no-op if already running)."""
+        with self._cond:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="input-arbiter", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop the arbiter thread. Pending requests are dropped (their
+        done events are set with ok=False).
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, kind: str, x: int = 0, y: int = 0, key: str = "",
+               session: str = "", source: str = "",
+               priority: int = PRIORITY_NORMAL,
+               stop_event: Optional[threading.Event] = None) -> InputRequest:
+        """
+        Queue an input action.
+
+        Args:
+            kind: ACTION_CLICK, ACTION_MOVE or ACTION_PRESS
+            x: Logical X coordinate (click/move)
+            y: Logical Y coordinate (click/move)
+            key: Key name (press)
+            session: Name of the session the action belongs to
+            source: Feature submitting the action; actions from one source
+                    run in submission order
+            priority: PRIORITY_FEED, PRIORITY_NORMAL, PRIORITY_CHOP or any
+                      int (lower runs first)
+            stop_event: Drop the action unexecuted if this is set before it
+                        runs (e.g. AppState.stop_event)
+
+        Returns:
+            InputRequest: Handle to wait on (for a coalesced move, the
+                          earlier request it was merged into)
+        """
+        if kind not in ACTION_KINDS:
+            raise ValueError(f"Unknown input action: {kind}")
+        with self._cond:
+            queue = self._queues.setdefault((session, source), deque())
+            tail = queue[-1] if queue else None
+            if tail is not None and tail.kind == ACTION_MOVE:
+                if kind == ACTION_MOVE:
+                    tail.x, tail.y = x, y
+                    self.coalesced += 1
+                    return tail
+                if kind == ACTION_CLICK:
+                    queue.pop()
+                    self._pending -= 1
+                    self.coalesced += 1
+                    tail.ok = True
+                    tail.done.set()
+            request = InputRequest(session, kind, x, y, key, source, priority, stop_event)
+            queue.append(request)
+            self._pending += 1
+            self._cond.notify()
+        return request
+
+    def click(self, x: int, y: int, session: str = "", source: str = "",
+              priority: int = PRIORITY_NORMAL,
+              stop_event: Optional[threading.Event] = None) -> InputRequest:
+        """Queue a left click at (x, y)."""
+        return self.submit(ACTION_CLICK, x, y, session=session, source=source, priority=priority,
+                           stop_event=stop_event)
+
+    def transaction(self, steps: Sequence[Step], session: str = "", source: str = "",
+                    priority: int = PRIORITY_NORMAL,
+                    stop_event: Optional[threading.Event] = None) -> InputRequest:
+        """
+        Queue a sequence of steps that runs without interruption.
+
+        The transaction is scheduled like a single action at its first
+        pointer position. A failed step or an ACTION_CHECK step returning
+        False ends it; the request's ok is then False.
+
+        Args:
+            steps: Steps to run in order
+            session: Name of the session the steps belong to
+            source: Feature submitting the steps
+            priority: Priority as for submit()
+            stop_event: Stop event as for submit()
+
+        Returns:
+            InputRequest: Handle to wait on
+        """
+        for step in steps:
+            if step.kind not in ACTION_KINDS and step.kind != ACTION_CHECK:
+                raise ValueError(f"Unknown input action: {step.kind}")
+        pointer = next((step for step in steps if step.kind in (ACTION_CLICK, ACTION_MOVE)), None)
+        request = InputRequest(session, ACTION_BATCH, pointer.x if pointer else 0,
+                               pointer.y if pointer else 0, source=source, priority=priority,
+                               stop_event=stop_event)
+        request.steps = tuple(steps)
+        with self._cond:
+            self._queues.setdefault((session, source), deque()).append(request)
+            self._pending += 1
+            self._cond.notify()
+        return request
+
+    def cancel(self, request: InputRequest) -> bool:
+        """
+        Withdraw a request that has not started yet.
+
+        Args:
+            request: Handle returned by submit(), click() or transaction()
+
+        Returns:
+            bool: True if the request was removed (it will never run; its
+                  done event is set with ok=False), False if it is already
+                  running or finished
+        """
+        with self._cond:
+            queue = self._queues.get((request.session, request.source))
+            if not queue or request not in queue:
+                return False
+            queue.remove(request)
+            self._pending -= 1
+        request.done.set()
+        return True
+
+    @property
+    def pointer(self) -> Optional[Tuple[int, int]]:
+        """Last pointer position set by the arbiter, or None before any move."""
+        return self._pointer
+
+    def pending_count(self) -> int:
+        """Return the number of queued actions."""
+        with self._cond:
+            return self._pending
+
+    def _distance_sq(self, request: InputRequest) -> int:
+        """Squared pointer travel needed for a request (0 for key presses)."""
+        if self._pointer is None or request.kind == ACTION_PRESS or (
+                request.kind == ACTION_BATCH and not any(
+                    step.kind in (ACTION_CLICK, ACTION_MOVE) for step in request.steps)):
+            return 0
+        dx = request.x - self._pointer[0]
+        dy = request.y - self._pointer[1]
+        return dx * dx + dy * dy
+
+    def _drop_stopped(self) -> List[InputRequest]:
+        """Remove requests whose stop event is set and return them. Lock held."""
+        dropped = []
+        for queue in self._queues.values():
+            if any(r.stop_event is not None and r.stop_event.is_set() for r in queue):
+                kept = [r for r in queue if r.stop_event is None or not r.stop_event.is_set()]
+                dropped.extend(r for r in queue if r not in kept)
+                queue.clear()
+                queue.extend(kept)
+        self._pending -= len(dropped)
+        return dropped
+
+    def _take_next(self) -> InputRequest:
+        """Pop the next request by priority, focus and travel. Lock held."""
+        heads = [queue[0] for queue in self._queues.values() if queue]
+        best = min(request.priority for request in heads)
+        candidates = [request for request in heads if request.priority == best]
+        if self._focused_run < MAX_FOCUSED_RUN or len({r.session for r in candidates}) == 1:
+            focused = [request for request in candidates if request.session == self._focused]
+        else:
+            focused = [request for request in candidates if request.session != self._focused]
+        request = min(focused or candidates, key=self._distance_sq)
+
+        self._queues[(request.session, request.source)].popleft()
+        self._pending -= 1
+        self._focused_run = self._focused_run + 1 if request.session == self._focused else 1
+        return request
+
+    def _run(self) -> None:
+        """Arbiter thread: execute requests one at a time."""
+        while True:
+            request = None
+            with self._cond:
+                while not self._pending and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    dropped = [request for queue in self._queues.values() for request in queue]
+                    self._queues.clear()
+                    self._pending = 0
+                    break
+                dropped = self._drop_stopped()
+                if self._pending:
+                    request = self._take_next()
+            for stopped in dropped:
+                stopped.done.set()
+            if request is not None:
+                self._execute(request)
+
+        for request in dropped:
+            request.done.set()
+
+    def _execute(self, request: InputRequest) -> None:
+        """Switch focus if needed and perform one action."""
+        try:
+            if request.session != self._focused:
+                if self.focus is not None:
+                    self.focus(request.session)
+                    time.sleep(FOCUS_SETTLE_DELAY)
+                if self._focused is not None:
+                    self.focus_switches += 1
+                self._focused = request.session
+
+            if request.kind == ACTION_BATCH:
+                request.ok = self._run_steps(request.steps)
+            else:
+                self._perform(request.kind, request.x, request.y, request.key)
+                request.ok = True
+            self.executed += 1
+        except Exception as e:
+            request.error = f"{type(e).__name__}: {e}"
+            logger.error(f"Error executing {request.kind} from {request.source or 'unknown'}: {e}")
+        finally:
+            request.done.set()
+
+    def _perform(self, kind: str, x: int, y: int, key: str) -> None:
+        """Drive the input backend for one action."""
+        if kind == ACTION_CLICK:
+            input_control.click(x, y, pause=False)
+            self._pointer = (x, y)
+        elif kind == ACTION_MOVE:
+            input_control.move_to(x, y, pause=False)
+            self._pointer = (x, y)
+        else:
+            input_control.press(key, pause=False)
+
+    def _run_steps(self, steps: Sequence[Step]) -> bool:
+        """Run a transaction's steps; return False if one fails or a check rejects."""
+        for step in steps:
+            if step.kind == ACTION_CHECK:
+                if not step.check():
+                    return False
+            else:
+                self._perform(step.kind, step.x, step.y, step.key)
+            if step.delay > 0:
+                time.sleep(step.delay)
+        return True
+
+
+class SessionInput:
+    """An InputArbiter as seen by one session: every action is tagged with it."""
+
+    def __init__(self, arbiter: InputArbiter, session: str):
+        """
+        Initialize the view.
+
+        Args:
+            arbiter: Arbiter shared by all sessions
+            session: Name of the session the actions belong to
+        """
+        self.arbiter = arbiter
+        self.session = session
+
+    def submit(self, kind: str, x: int = 0, y: int = 0, key: str = "", source: str = "",
+               priority: int = PRIORITY_NORMAL,
+               stop_event: Optional[threading.Event] = None) -> InputRequest:
+        """Queue an input action for the session (see InputArbiter.submit)."""
+        return self.arbiter.submit(kind, x, y, key, session=self.session, source=source,
+                                   priority=priority, stop_event=stop_event)
+
+    def click(self, x: int, y: int, source: str = "",
+              priority: int = PRIORITY_NORMAL,
+              stop_event: Optional[threading.Event] = None) -> InputRequest:
+        """Queue a left click at (x, y) for the session."""
+        return self.submit(ACTION_CLICK, x, y, source=source, priority=priority,
+                           stop_event=stop_event)
+
+    def transaction(self, steps: Sequence[Step], source: str = "",
+                    priority: int = PRIORITY_NORMAL,
+                    stop_event: Optional[threading.Event] = None) -> InputRequest:
+        """Queue a transaction for the session (see InputArbiter.transaction)."""
+        return self.arbiter.transaction(steps, session=self.session, source=source,
+                                        priority=priority, stop_event=stop_event)
+
+    def cancel(self, request: InputRequest) -> bool:
+        """Withdraw a request that has not started yet (see InputArbiter.cancel)."""
+        return self.arbiter.cancel(request)
+
+    @property
+    def pointer(self) -> Optional[Tuple[int, int]]:
+        """Last pointer position set by the shared arbiter."""
+        return self.arbiter.pointer
+
+
+_shared: Optional[InputArbiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_arbiter() -> InputArbiter:
+    """
+    Return the process-wide arbiter for single-window automation, starting
+    it on first use.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = InputArbiter()
+        _shared.start()
+        return _shared
+
+
+def arbiter_for(state):
+    """
+    Return the input a worker of an AppState should use.
+
+    Args:
+        state: AppState instance
+
+    Returns:
+        InputArbiter or SessionInput: AppState.input if set, otherwise the
+                                      process-wide arbiter
+    """
+    return state.input if state.input is not None else get_arbiter()
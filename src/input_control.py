@@ -0,0 +1,114 @@
+"""
+AFK Auto-Help Module: Input Control Layer
+
+All synthetic mouse and keyboard input goes through this module. The
+input backend (pyautogui) is imported lazily on first use so that the GUI
+can appear before the heavy platform modules load.
+"""
+
+from typing import Tuple
+
+
+_pyautogui = None
+
+
+def _backend():
+    """
+    Return the pyautogui module, importing it on first use.
+
+    Returns:
+        module: The pyautogui module
+    """
+    global _pyautogui
+    if _pyautogui is None:
+        import pyautogui
+        _pyautogui = pyautogui
+    return _pyautogui
+
+
+def is_backend_loaded() -> bool:
+    """Return True if the input backend has already been imported."""
+    return _pyautogui is not None
+
+
+def click(x: int, y: int, pause: bool = True) -> None:
+    """
+    Click the left mouse button at a screen coordinate.
+
+    Args:
+        x (int): X coordinate
+        y (int): Y coordinate
+        pause (bool): Apply pyautogui's post-action pause (pyautogui.PAUSE).
+                      Timed playback passes False and does its own scheduling.
+    """
+    _backend().click(x, y, _pause=pause)
+
+
+def move_to(x: int, y: int, pause: bool = True) -> None:
+    """
+    Move the mouse pointer to a screen coordinate without clicking.
+
+    Args:
+        x (int): X coordinate
+        y (int): Y coordinate
+        pause (bool): Apply pyautogui's post-action pause
+    """
+    _backend().moveTo(x, y, _pause=pause)
+
+
+def mouse_down(x: int, y: int, button: str = "left", pause: bool = True) -> None:
+    """
+    Press a mouse button at a screen coordinate and keep it held.
+
+    Args:
+        x (int): X coordinate
+        y (int): Y coordinate
+        button (str): "left", "right" or "middle"
+        pause (bool): Apply pyautogui's post-action pause
+    """
+    _backend().mouseDown(x, y, button=button, _pause=pause)
+
+
+def mouse_up(x: int, y: int, button: str = "left", pause: bool = True) -> None:
+    """
+    Release a mouse button at a screen coordinate.
+
+    Args:
+        x (int): X coordinate
+        y (int): Y coordinate
+        button (str): "left", "right" or "middle"
+        pause (bool): Apply pyautogui's post-action pause
+    """
+    _backend().mouseUp(x, y, button=button, _pause=pause)
+
+
+def press(key: str, pause: bool = True) -> None:
+    """
+    Press and release a keyboard key.
+
+    Args:
+        key (str): Key name as understood by pyautogui (e.g. "3", "e", "space")
+        pause (bool): Apply pyautogui's post-action pause
+    """
+    _backend().press(key, _pause=pause)
+
+
+def key_down(key: str, pause: bool = True) -> None:
+    """Hold a keyboard key down."""
+    _backend().keyDown(key, _pause=pause)
+
+
+def key_up(key: str, pause: bool = True) -> None:
+    """Release a held keyboard key."""
+    _backend().keyUp(key, _pause=pause)
+
+
+def position() -> Tuple[int, int]:
+    """
+    Return the current mouse pointer position.
+
+    Returns:
+        tuple: (x, y) screen coordinate
+    """
+    x, y = _backend().position()
+    return (x, y)
@@ -0,0 +1,336 @@
+"""
+AFK Auto-Help Module: Binary Macro Format
+
+A compact, versioned file format for recorded macros (extension .afkm),
+designed for long routes with dense mouse-move samples.
+
+Layout:
+    header:  b"AFKM", version (1 byte), time unit in ns (varint)
+    records: kind byte, time delta (varint, in time units), then
+             - mouse events: x and y deltas from the previous mouse
+               position (zigzag varints)
+             - key/button events: string index (varint); an index equal to
+               the number of strings seen so far introduces a new string,
+               followed by its UTF-8 length (varint) and bytes
+             Key events set KIND_HAS_POSITION in the kind byte when they
+             carry a non-zero position, which is then written as for mouse
+             events. This keeps JSON <-> binary conversion lossless.
+
+A typical mouse move is 3-5 bytes instead of ~30 in JSON. Files are read
+in fixed-size chunks and decoded as a stream, so playback can start
+immediately and memory use does not grow with the length of the route.
+"""
+
+from typing import BinaryIO, Iterable, Iterator, List
+
+from macros import (
+    EVENT_KINDS, KEY_DOWN, KEY_UP, MOVE, MacroEvent, load_macro_json, save_macro_json,
+)
+
+
+MAGIC = b"AFKM"
+FORMAT_VERSION = 1
+"""Binary format version written by this module."""
+
+BINARY_EXTENSION = ".afkm"
+
+DEFAULT_TIME_UNIT_NS = 1000
+"""Timestamps are stored in microseconds unless that would lose precision."""
+
+READ_CHUNK_SIZE = 64 * 1024
+"""Bytes read from disk at a time by the streaming reader."""
+
+KIND_HAS_POSITION = 0x80
+"""Kind-byte flag: a key event carries an explicit position."""
+
+_KIND_CODES = {kind: code for code, kind in enumerate(EVENT_KINDS)}
+_KEY_KINDS = (KEY_DOWN, KEY_UP)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned LEB128 varint to a buffer."""
+    if value < 0:
+        raise ValueError("varint value must be non-negative")
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    """Map a signed integer to an unsigned one (0, -1, 1, -2 -> 0, 1, 2, 3)."""
+    return (value << 1) if value >= 0 else ((-value << 1) - 1)
+
+
+def _unzigzag(value: int) -> int:
+    """Inverse of _zigzag."""
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+
+def choose_time_unit(events: Iterable[MacroEvent]) -> int:
+    """
+    Pick the coarsest time unit that stores every timestamp exactly.
+
+    Args:
+        events: MacroEvents to be written
+
+    Returns:
+        int: DEFAULT_TIME_UNIT_NS, or 1 if any timestamp needs nanoseconds
+    """
+    for event in events:
+        if event.t_ns % DEFAULT_TIME_UNIT_NS:
+            return 1
+    return DEFAULT_TIME_UNIT_NS
+
+
+class BinaryMacroWriter:
+    """
+    Encodes MacroEvents to a binary stream one at a time.
+
+    Events must be written in time order.
+    """
+
+    def __init__(self, stream: BinaryIO, time_unit_ns: int = DEFAULT_TIME_UNIT_NS):
+        """
+        Write the file header and prepare for events.
+
+        Args:
+            stream: Writable binary stream
+            time_unit_ns: Resolution of stored timestamps in nanoseconds
+        """
+        if time_unit_ns <= 0:
+            raise ValueError("time unit must be positive")
+        self.stream = stream
+        self.time_unit_ns = time_unit_ns
+        self._last_t = 0
+        self._last_x = 0
+        self._last_y = 0
+        self._strings = {}
+        header = bytearray(MAGIC)
+        header.append(FORMAT_VERSION)
+        _write_varint(header, time_unit_ns)
+        stream.write(header)
+
+    def write(self, event: MacroEvent) -> None:
+        """
+        Encode and write a single event.
+
+        Raises:
+            ValueError: If the event is out of order, has an unknown kind,
+                        or its timestamp does not fit the time unit
+        """
+        if event.kind not in _KIND_CODES:
+            raise ValueError(f"Unknown macro event kind: {event.kind}")
+        if event.t_ns % self.time_unit_ns:
+            raise ValueError(f"Timestamp {event.t_ns} is not a multiple of the time unit")
+        t = event.t_ns // self.time_unit_ns
+        if t < self._last_t:
+            raise ValueError("Macro events must be in time order")
+
+        is_key = event.kind in _KEY_KINDS
+        has_position = not is_key or event.x != 0 or event.y != 0
+        code = _KIND_CODES[event.kind]
+        if is_key and has_position:
+            code |= KIND_HAS_POSITION
+
+        out = bytearray((code,))
+        _write_varint(out, t - self._last_t)
+        self._last_t = t
+
+        if has_position:
+            _write_varint(out, _zigzag(event.x - self._last_x))
+            _write_varint(out, _zigzag(event.y - self._last_y))
+            self._last_x, self._last_y = event.x, event.y
+
+        if event.kind != MOVE:
+            index = self._strings.get(event.data)
+            if index is None:
+                index = len(self._strings)
+                self._strings[event.data] = index
+                encoded = event.data.encode("utf-8")
+                _write_varint(out, index)
+                _write_varint(out, len(encoded))
+                out += encoded
+            else:
+                _write_varint(out, index)
+
+        self.stream.write(out)
+
+
+class _ChunkReader:
+    """Reads bytes and varints from a stream through a fixed-size buffer."""
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = READ_CHUNK_SIZE):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buf = b""
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        """Load the next chunk. Returns False at end of stream."""
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def byte(self) -> int:
+        """Return the next byte, or -1 at a clean end of stream."""
+        if self.pos >= len(self.buf) and not self._fill():
+            return -1
+        value = self.buf[self.pos]
+        self.pos += 1
+        return value
+
+    def varint(self) -> int:
+        """Decode the next unsigned varint."""
+        result = 0
+        shift = 0
+        while True:
+            b = self.byte()
+            if b < 0:
+                raise ValueError("Truncated macro file")
+            result |= (b & 0x7F) << shift
+            if not b & 0x80:
+                return result
+            shift += 7
+
+    def read(self, n: int) -> bytes:
+        """Return exactly n bytes."""
+        while len(self.buf) - self.pos < n:
+            if not self._fill():
+                raise ValueError("Truncated macro file")
+        data = self.buf[self.pos:self.pos + n]
+        self.pos += n
+        return data
+
+
+def iter_binary_stream(stream: BinaryIO) -> Iterator[MacroEvent]:
+    """
+    Decode MacroEvents from a binary stream as they are read.
+
+    Args:
+        stream: Readable binary stream positioned at the header
+
+    Yields:
+        MacroEvent: Events in time order
+
+    Raises:
+        ValueError: If the header or data is invalid
+    """
+    reader = _ChunkReader(stream)
+    if reader.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Not a binary macro file")
+    version = reader.byte()
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary macro version: {version}")
+    time_unit_ns = reader.varint()
+
+    t = 0
+    x = 0
+    y = 0
+    strings: List[str] = []
+    while True:
+        code = reader.byte()
+        if code < 0:
+            return
+        kind_index = code & ~KIND_HAS_POSITION
+        if kind_index >= len(EVENT_KINDS):
+            raise ValueError(f"Unknown macro event code: {code}")
+        kind = EVENT_KINDS[kind_index]
+        t += reader.varint()
+
+        is_key = kind in _KEY_KINDS
+        if not is_key or code & KIND_HAS_POSITION:
+            x += _unzigzag(reader.varint())
+            y += _unzigzag(reader.varint())
+            ex, ey = x, y
+        else:
+            ex, ey = 0, 0
+
+        data = ""
+        if kind != MOVE:
+            index = reader.varint()
+            if index == len(strings):
+                strings.append(reader.read(reader.varint()).decode("utf-8"))
+            elif index > len(strings):
+                raise ValueError("Invalid string index in macro file")
+            data = strings[index]
+
+        yield MacroEvent(t * time_unit_ns, kind, ex, ey, data)
+
+
+def iter_binary_events(path: str) -> Iterator[MacroEvent]:
+    """
+    Stream MacroEvents from a binary macro file.
+
+    Args:
+        path: .afkm file path
+
+    Yields:
+        MacroEvent: Events in time order
+    """
+    with open(path, "rb") as f:
+        yield from iter_binary_stream(f)
+
+
+def save_macro_binary(path: str, events: List[MacroEvent]) -> None:
+    """
+    Save events to a binary macro file.
+
+    Args:
+        path: Destination .afkm path
+        events: MacroEvents in time order
+    """
+    with open(path, "wb") as f:
+        writer = BinaryMacroWriter(f, choose_time_unit(events))
+        for event in events:
+            writer.write(event)
+
+
+def is_binary_macro(path: str) -> bool:
+    """Return True if the file starts with the binary macro magic bytes."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def iter_macro_file(path: str) -> Iterator[MacroEvent]:
+    """
+    Iterate the events of a macro file in either format.
+
+    Binary files are streamed; JSON files are loaded whole.
+
+    Args:
+        path: .afkm or .json macro file path
+
+    Yields:
+        MacroEvent: Events in time order
+    """
+    if is_binary_macro(path):
+        return iter_binary_events(path)
+    return iter(load_macro_json(path))
+
+
+def json_to_binary(json_path: str, binary_path: str) -> int:
+    """
+    Convert a JSON macro file to the binary format.
+
+    Returns:
+        int: Number of events converted
+    """
+    events = load_macro_json(json_path)
+    save_macro_binary(binary_path, events)
+    return len(events)
+
+
+def binary_to_json(binary_path: str, json_path: str) -> int:
+    """
+    Convert a binary macro file to JSON for editing.
+
+    Returns:
+        int: Number of events converted
+    """
+    events = list(iter_binary_events(binary_path))
+    save_macro_json(json_path, events)
+    return len(events)
@@ -0,0 +1,673 @@
+"""
+AFK Auto-Help Module: Macro Recording and Replay
+
+Records sequences of keypresses, mouse moves and mouse button presses with
+high-resolution timestamps, and replays them for waypoint routes such as
+profiles/99nights_crockpot_route.json.
+
+Mouse paths are simplified while recording: runs of move samples are
+reduced with a time-synchronized Ramer-Douglas-Peucker pass, keeping only
+the points needed to stay within a pixel tolerance of the recorded
+pointer position at every moment. Replay can then either issue the kept
+points as recorded or interpolate between them at a fixed event rate.
+
+Replay first compiles the event list into a timeline: every event becomes
+an (offset, action, args) step with the input function already resolved,
+so the playback loop only waits for the next deadline and calls it.
+Deadlines are absolute offsets from the start of playback, so timing error
+never accumulates across a long route, and the measured cost of each
+action type is subtracted from its deadline so the input lands on time.
+
+Recording uses pynput (optional dependency: pip install pynput).
+Macros are saved as JSON or, for long routes, in the compact binary
+format from macro_format (.afkm), which is streamed during playback.
+
+Usage:
+    python src/macros.py record profiles/99nights_crockpot_route.json
+    python src/macros.py play profiles/99nights_crockpot_route.json
+    python src/macros.py convert route.json route.afkm
+"""
+
+import argparse
+import json
+import threading
+import time
+from array import array
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import input_control
+from scheduler import DeadlineScheduler
+
+
+# Event kinds
+MOVE = "move"
+MOUSE_DOWN = "mouse_down"
+MOUSE_UP = "mouse_up"
+KEY_DOWN = "key_down"
+KEY_UP = "key_up"
+EVENT_KINDS = (MOVE, MOUSE_DOWN, MOUSE_UP, KEY_DOWN, KEY_UP)
+
+MACRO_FORMAT_VERSION = 1
+"""Version number written to JSON macro files."""
+
+DEFAULT_STOP_KEY = "f8"
+"""Key that ends a recording (not itself recorded)."""
+
+DEFAULT_SIMPLIFY_TOLERANCE_PX = 1.5
+"""Maximum pointer deviation in pixels allowed when simplifying paths."""
+
+SIMPLIFY_BUFFER_SIZE = 2048
+"""Move samples buffered during recording before a run is simplified."""
+
+DEFAULT_MOVE_RATE_HZ = 60.0
+"""Event rate used when replay interpolates between kept path points."""
+
+MAX_MOVE_LATENESS_MS = 8.0
+"""Mouse moves later than this are skipped during replay to catch up.
+Button and key events are never skipped."""
+
+LATENCY_SMOOTHING = 0.2
+"""Weight of the newest sample in the per-action latency estimate."""
+
+
+class MacroEvent(NamedTuple):
+    """A single recorded input event."""
+
+    t_ns: int
+    """Time since the start of the recording, in nanoseconds."""
+    kind: str
+    """One of EVENT_KINDS."""
+    x: int = 0
+    """Pointer X coordinate (mouse events)."""
+    y: int = 0
+    """Pointer Y coordinate (mouse events)."""
+    data: str = ""
+    """Key name (key events) or mouse button (button events)."""
+
+
+# Path simplification
+
+def simplify_path(moves: List[MacroEvent], tolerance: float) -> List[MacroEvent]:
+    """
+    Reduce a run of MOVE events with a time-synchronized RDP pass.
+
+    A sample is dropped only if linear interpolation between the kept
+    neighbours, evaluated at the sample's own timestamp, places the pointer
+    within `tolerance` pixels of it. Comparing at the same moment (rather
+    than against the nearest point of the segment) preserves the speed of
+    the movement as well as its shape.
+
+    Args:
+        moves: Consecutive MOVE events in time order
+        tolerance: Maximum allowed deviation in pixels (<= 0 disables)
+
+    Returns:
+        list: The retained events; the first and last are always kept
+    """
+    n = len(moves)
+    if n <= 2 or tolerance <= 0:
+        return list(moves)
+
+    keep = bytearray(n)
+    keep[0] = keep[n - 1] = 1
+    tolerance_sq = tolerance * tolerance
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        a = moves[first]
+        b = moves[last]
+        span = b.t_ns - a.t_ns
+        dx = b.x - a.x
+        dy = b.y - a.y
+        worst_sq = tolerance_sq
+        worst = -1
+        for i in range(first + 1, last):
+            p = moves[i]
+            f = (p.t_ns - a.t_ns) / span if span > 0 else 0.0
+            ex = p.x - (a.x + dx * f)
+            ey = p.y - (a.y + dy * f)
+            d_sq = ex * ex + ey * ey
+            if d_sq > worst_sq:
+                worst_sq = d_sq
+                worst = i
+        if worst >= 0:
+            keep[worst] = 1
+            stack.append((first, worst))
+            stack.append((worst, last))
+
+    return [move for move, kept in zip(moves, keep) if kept]
+
+
+def simplify_events(events: Iterable[MacroEvent],
+                    tolerance: float = DEFAULT_SIMPLIFY_TOLERANCE_PX) -> List[MacroEvent]:
+    """
+    Simplify every run of MOVE events in an event list.
+
+    Non-move events are kept unchanged and in place.
+
+    Args:
+        events: MacroEvents in time order
+        tolerance: Maximum allowed deviation in pixels
+
+    Returns:
+        list: Simplified events in time order
+    """
+    result: List[MacroEvent] = []
+    run: List[MacroEvent] = []
+    for event in events:
+        if event.kind == MOVE:
+            run.append(event)
+            continue
+        result.extend(simplify_path(run, tolerance))
+        run = []
+        result.append(event)
+    result.extend(simplify_path(run, tolerance))
+    return result
+
+
+# Recording
+
+def _key_name(key) -> str:
+    """
+    Convert a pynput key object to a pyautogui key name.
+
+    Args:
+        key: pynput.keyboard.Key or KeyCode
+
+    Returns:
+        str: Key name such as "w", "space" or "shift", or "" if unknown
+    """
+    char = getattr(key, "char", None)
+    if char:
+        return char.lower()
+    name = getattr(key, "name", None) or ""
+    # pynput distinguishes sides ("shift_l"); pyautogui's generic names don't
+    for suffix in ("_l", "_r", "_gr"):
+        if name.endswith(suffix):
+            return name[: -len(suffix)]
+    return name
+
+
+class MacroRecorder:
+    """
+    Records global mouse and keyboard input into a list of MacroEvents.
+
+    Events can also be added programmatically with add_event(), which is
+    what the pynput listener callbacks use. Mouse moves are buffered and
+    simplified with simplify_path() before they reach `events`.
+    """
+
+    def __init__(self, stop_key: str = DEFAULT_STOP_KEY,
+                 simplify_tolerance: float = DEFAULT_SIMPLIFY_TOLERANCE_PX):
+        """
+        Initialize the recorder.
+
+        Args:
+            stop_key: Key name that ends the recording when pressed
+            simplify_tolerance: Path simplification tolerance in pixels
+                                (0 records every move sample)
+        """
+        self.stop_key = stop_key
+        self.simplify_tolerance = simplify_tolerance
+        self.events: List[MacroEvent] = []
+        self.moves_seen = 0
+        self.finished = threading.Event()
+        self._lock = threading.Lock()
+        self._start_ns = time.perf_counter_ns()
+        self._pending_moves: List[MacroEvent] = []
+        self._held_keys = set()
+        self._listeners = []
+
+    def _flush_moves(self, keep_last: bool) -> None:
+        """
+        Simplify buffered moves into `events`. Caller holds the lock.
+
+        Args:
+            keep_last: Keep the last sample buffered as the start of the
+                       next run (used when the buffer fills mid-movement)
+        """
+        pending = self._pending_moves
+        if not pending:
+            return
+        simplified = simplify_path(pending, self.simplify_tolerance)
+        if keep_last:
+            self.events.extend(simplified[:-1])
+            self._pending_moves = [pending[-1]]
+        else:
+            self.events.extend(simplified)
+            self._pending_moves = []
+
+    def add_event(self, kind: str, x: int = 0, y: int = 0, data: str = "") -> None:
+        """
+        Append an event timestamped relative to the start of the recording.
+
+        Args:
+            kind: One of EVENT_KINDS
+            x: Pointer X coordinate
+            y: Pointer Y coordinate
+            data: Key name or mouse button
+        """
+        t_ns = time.perf_counter_ns() - self._start_ns
+        event = MacroEvent(t_ns, kind, int(x), int(y), data)
+        with self._lock:
+            if kind == MOVE:
+                self.moves_seen += 1
+                self._pending_moves.append(event)
+                if len(self._pending_moves) >= SIMPLIFY_BUFFER_SIZE:
+                    self._flush_moves(keep_last=True)
+                return
+            self._flush_moves(keep_last=False)
+            self.events.append(event)
+
+    def start(self) -> None:
+        """
+        Start listening to global input.
+
+        Raises:
+            RuntimeError: If pynput is not installed
+        """
+        try:
+            from pynput import keyboard, mouse
+        except ImportError:
+            raise RuntimeError("Macro recording requires pynput (pip install pynput)")
+
+        def on_move(x, y):
+            self.add_event(MOVE, x, y)
+
+        def on_click(x, y, button, pressed):
+            self.add_event(MOUSE_DOWN if pressed else MOUSE_UP, x, y, button.name)
+
+        def on_press(key):
+            name = _key_name(key)
+            if name == self.stop_key:
+                self.finished.set()
+                return False
+            # Ignore OS auto-repeat while a key is held
+            if name and name not in self._held_keys:
+                self._held_keys.add(name)
+                self.add_event(KEY_DOWN, data=name)
+
+        def on_release(key):
+            name = _key_name(key)
+            if name in self._held_keys:
+                self._held_keys.discard(name)
+                self.add_event(KEY_UP, data=name)
+
+        self._start_ns = time.perf_counter_ns()
+        self._listeners = [
+            mouse.Listener(on_move=on_move, on_click=on_click),
+            keyboard.Listener(on_press=on_press, on_release=on_release),
+        ]
+        for listener in self._listeners:
+            listener.start()
+
+    def stop(self) -> List[MacroEvent]:
+        """
+        Stop listening and return the recorded events.
+
+        Keys still held when recording stops get a matching KEY_UP so the
+        macro never leaves a key pressed.
+
+        Returns:
+            list: Recorded MacroEvents in time order
+        """
+        for listener in self._listeners:
+            listener.stop()
+        self._listeners = []
+        for name in sorted(self._held_keys):
+            self.add_event(KEY_UP, data=name)
+        self._held_keys.clear()
+        with self._lock:
+            self._flush_moves(keep_last=False)
+            return list(self.events)
+
+
+# Compilation
+
+def _resolve_action(event: MacroEvent) -> Tuple[Callable, tuple]:
+    """
+    Map an event to the input function and arguments that replay it.
+
+    Args:
+        event: MacroEvent to replay
+
+    Returns:
+        tuple: (function, args) with pyautogui's post-action pause disabled
+
+    Raises:
+        ValueError: If the event kind is unknown
+    """
+    if event.kind == MOVE:
+        return input_control.move_to, (event.x, event.y, False)
+    if event.kind == MOUSE_DOWN:
+        return input_control.mouse_down, (event.x, event.y, event.data or "left", False)
+    if event.kind == MOUSE_UP:
+        return input_control.mouse_up, (event.x, event.y, event.data or "left", False)
+    if event.kind == KEY_DOWN:
+        return input_control.key_down, (event.data, False)
+    if event.kind == KEY_UP:
+        return input_control.key_up, (event.data, False)
+    raise ValueError(f"Unknown macro event kind: {event.kind}")
+
+
+class CompiledStep(NamedTuple):
+    """One precomputed step of a replay timeline."""
+
+    offset_ns: int
+    """Deadline relative to the start of playback."""
+    kind: str
+    """Event kind (used for latency tracking and move skipping)."""
+    action: Callable
+    """Input function to call."""
+    args: tuple
+    """Arguments for the input function."""
+
+
+def _interpolate_moves(a: MacroEvent, b: MacroEvent, period_ns: int) -> Iterator[MacroEvent]:
+    """
+    Yield evenly spaced MOVE events strictly between two moves.
+
+    Points that round to the same pixel as the previous one are skipped.
+    """
+    span = b.t_ns - a.t_ns
+    last_x, last_y = a.x, a.y
+    t = a.t_ns + period_ns
+    while t < b.t_ns:
+        f = (t - a.t_ns) / span
+        x = round(a.x + (b.x - a.x) * f)
+        y = round(a.y + (b.y - a.y) * f)
+        if x != last_x or y != last_y:
+            yield MacroEvent(t, MOVE, x, y)
+            last_x, last_y = x, y
+        t += period_ns
+
+
+def iter_compiled(events: Iterable[MacroEvent], speed: float = 1.0,
+                  move_rate_hz: Optional[float] = None) -> Iterator[CompiledStep]:
+    """
+    Compile events into timeline steps one at a time.
+
+    Works on any iterable, so a long macro can be compiled while it is
+    being read and played.
+
+    Args:
+        events: MacroEvents in time order
+        speed: Playback speed multiplier (2.0 = twice as fast)
+        move_rate_hz: If set, consecutive mouse moves are joined by moves
+                      interpolated at this rate (in recorded time), giving
+                      smooth motion from a simplified path
+
+    Yields:
+        CompiledStep: Steps with offsets relative to the first event
+    """
+    if speed <= 0:
+        raise ValueError("Playback speed must be positive")
+    period_ns = int(1e9 / move_rate_hz) if move_rate_hz else 0
+    first_ns = None
+    previous = None
+    for event in events:
+        if first_ns is None:
+            first_ns = event.t_ns
+        if period_ns and event.kind == MOVE and previous is not None and previous.kind == MOVE:
+            for step in _interpolate_moves(previous, event, period_ns):
+                yield CompiledStep(int((step.t_ns - first_ns) / speed), MOVE,
+                                   input_control.move_to, (step.x, step.y, False))
+        previous = event
+        action, args = _resolve_action(event)
+        yield CompiledStep(int((event.t_ns - first_ns) / speed), event.kind, action, args)
+
+
+class CompiledMacro:
+    """
+    A fully precomputed replay timeline.
+
+    Offsets are kept in a flat array('q') so the timeline stays compact
+    even for long routes.
+    """
+
+    def __init__(self, steps: Iterable[CompiledStep]):
+        """
+        Build the timeline from compiled steps.
+
+        Args:
+            steps: CompiledSteps in time order
+        """
+        self.offsets = array("q")
+        self.kinds: List[str] = []
+        self.calls: List[Tuple[Callable, tuple]] = []
+        for step in steps:
+            self.offsets.append(step.offset_ns)
+            self.kinds.append(step.kind)
+            self.calls.append((step.action, step.args))
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __iter__(self) -> Iterator[CompiledStep]:
+        for offset, kind, (action, args) in zip(self.offsets, self.kinds, self.calls):
+            yield CompiledStep(offset, kind, action, args)
+
+    def duration_s(self) -> float:
+        """Return the length of the timeline in seconds."""
+        return self.offsets[-1] / 1e9 if self.offsets else 0.0
+
+
+def compile_macro(events: Iterable[MacroEvent], speed: float = 1.0,
+                  move_rate_hz: Optional[float] = None) -> CompiledMacro:
+    """
+    Compile a list of events into a precomputed replay timeline.
+
+    Args:
+        events: MacroEvents in time order
+        speed: Playback speed multiplier
+        move_rate_hz: Interpolate between mouse moves at this rate (None
+                      replays moves exactly as stored)
+
+    Returns:
+        CompiledMacro: Timeline ready for MacroPlayer.play()
+    """
+    return CompiledMacro(iter_compiled(events, speed, move_rate_hz))
+
+
+# Replay
+
+class MacroPlayer:
+    """
+    Executes a compiled timeline with a deadline-based scheduler.
+
+    Each action is issued early by the running average of how long that
+    kind of action takes, so the input lands on its deadline. Mouse moves
+    that are already too late are dropped (the next move supersedes them);
+    button and key events always run.
+    """
+
+    def __init__(self, should_stop: Optional[Callable[[], bool]] = None,
+                 max_move_lateness_ms: float = MAX_MOVE_LATENESS_MS):
+        """
+        Initialize the player.
+
+        Args:
+            should_stop: Called while waiting; playback ends when it returns True
+            max_move_lateness_ms: Lateness beyond which mouse moves are skipped
+        """
+        self.scheduler = DeadlineScheduler(should_stop)
+        self.max_move_lateness_ns = int(max_move_lateness_ms * 1e6)
+        self.latency_ns = {kind: 0 for kind in EVENT_KINDS}
+        self.steps_run = 0
+        self.moves_skipped = 0
+
+    def play(self, steps: Iterable[CompiledStep]) -> bool:
+        """
+        Replay a timeline.
+
+        Keys and mouse buttons still held when playback ends (normally or
+        because it was stopped) are released.
+
+        Args:
+            steps: CompiledMacro or any iterable of CompiledSteps
+
+        Returns:
+            bool: True if the whole timeline ran, False if stopped early
+        """
+        held_keys = set()
+        held_buttons = {}
+        now_ns = self.scheduler.now_ns
+        latency_ns = self.latency_ns
+        start_ns = now_ns()
+        try:
+            for offset_ns, kind, action, args in steps:
+                deadline = start_ns + offset_ns
+                if kind == MOVE and now_ns() - deadline > self.max_move_lateness_ns:
+                    self.moves_skipped += 1
+                    continue
+                if not self.scheduler.wait_until(deadline - latency_ns[kind]):
+                    return False
+
+                t0 = now_ns()
+                action(*args)
+                elapsed = now_ns() - t0
+                latency_ns[kind] += int(LATENCY_SMOOTHING * (elapsed - latency_ns[kind]))
+                self.steps_run += 1
+
+                if kind == KEY_DOWN:
+                    held_keys.add(args[0])
+                elif kind == KEY_UP:
+                    held_keys.discard(args[0])
+                elif kind == MOUSE_DOWN:
+                    held_buttons[args[2]] = (args[0], args[1])
+                elif kind == MOUSE_UP:
+                    held_buttons.pop(args[2], None)
+            return True
+        finally:
+            for key in held_keys:
+                input_control.key_up(key, False)
+            for button, (x, y) in held_buttons.items():
+                input_control.mouse_up(x, y, button, False)
+
+
+# JSON files
+
+def save_macro_json(path: str, events: Iterable[MacroEvent]) -> None:
+    """
+    Save events as a JSON macro file.
+
+    Each event is stored as a compact [t_ns, kind, x, y, data] list.
+
+    Args:
+        path: Destination file path
+        events: MacroEvents to save
+    """
+    data = {
+        "version": MACRO_FORMAT_VERSION,
+        "events": [list(event) for event in events],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+
+
+def load_macro_json(path: str) -> List[MacroEvent]:
+    """
+    Load events from a JSON macro file.
+
+    Args:
+        path: Macro file path
+
+    Returns:
+        list: MacroEvents in time order
+
+    Raises:
+        ValueError: If the file version is unsupported or an event is invalid
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != MACRO_FORMAT_VERSION:
+        raise ValueError(f"Unsupported macro version: {data.get('version')}")
+    events = []
+    for item in data["events"]:
+        event = MacroEvent(int(item[0]), item[1], int(item[2]), int(item[3]), item[4])
+        if event.kind not in EVENT_KINDS:
+            raise ValueError(f"Unknown macro event kind: {event.kind}")
+        events.append(event)
+    return events
+
+
+# Command line
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Record or play a macro from the command line."""
+    parser = argparse.ArgumentParser(description="Record and replay input macros.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Record a macro until the stop key is pressed")
+    rec.add_argument("path")
+    rec.add_argument("--stop-key", default=DEFAULT_STOP_KEY)
+    rec.add_argument("--tolerance", type=float, default=DEFAULT_SIMPLIFY_TOLERANCE_PX,
+                     help="Mouse path simplification tolerance in pixels (0 = keep all samples)")
+
+    play = sub.add_parser("play", help="Replay a recorded macro")
+    play.add_argument("path")
+    play.add_argument("--speed", type=float, default=1.0)
+    play.add_argument("--delay", type=float, default=3.0,
+                      help="Seconds to wait before playback starts")
+    play.add_argument("--move-rate", type=float, default=None,
+                      help=f"Interpolate mouse moves at this many events/sec (e.g. {DEFAULT_MOVE_RATE_HZ:.0f})")
+
+    convert = sub.add_parser("convert", help="Convert between JSON and binary (.afkm) macros")
+    convert.add_argument("source")
+    convert.add_argument("dest")
+    convert.add_argument("--simplify", type=float, default=0.0, metavar="TOLERANCE",
+                         help="Also simplify mouse paths with this pixel tolerance")
+
+    args = parser.parse_args(argv)
+
+    # Imported here: macro_format itself imports this module
+    import macro_format
+
+    if args.command == "record":
+        recorder = MacroRecorder(stop_key=args.stop_key, simplify_tolerance=args.tolerance)
+        recorder.start()
+        print(f"Recording... press {args.stop_key.upper()} to stop")
+        try:
+            recorder.finished.wait()
+        except KeyboardInterrupt:
+            pass
+        events = recorder.stop()
+        if args.path.endswith(macro_format.BINARY_EXTENSION):
+            macro_format.save_macro_binary(args.path, events)
+        else:
+            save_macro_json(args.path, events)
+        print(f"Saved {len(events)} events to {args.path} "
+              f"({recorder.moves_seen} mouse samples recorded)")
+        return 0
+
+    if args.command == "convert":
+        # The source format is detected from its contents, the output
+        # format from the destination extension
+        events = macro_format.iter_macro_file(args.source)
+        if args.simplify > 0:
+            events = simplify_events(events, args.simplify)
+        else:
+            events = list(events)
+        if args.dest.endswith(macro_format.BINARY_EXTENSION):
+            macro_format.save_macro_binary(args.dest, events)
+        else:
+            save_macro_json(args.dest, events)
+        count = len(events)
+        print(f"Converted {count} events to {args.dest}")
+        return 0
+
+    # Steps are compiled and played as the file is read
+    steps = iter_compiled(macro_format.iter_macro_file(args.path), speed=args.speed,
+                          move_rate_hz=args.move_rate)
+    print(f"Playing {args.path} in {args.delay:.0f}s...")
+    time.sleep(args.delay)
+    player = MacroPlayer()
+    player.play(steps)
+    print(f"Done: {player.steps_run} events, {player.moves_skipped} moves skipped, "
+          f"mean lateness {player.scheduler.mean_lateness_ms():.2f} ms, "
+          f"max {player.scheduler.max_lateness_ns / 1e6:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,454 @@
+"""
+AFK Auto-Help Module: Multi-Session Runner
+
+Drives several game sessions (e.g. one window per account) from a single
+process. Each session has its own settings file and AppState and runs the
+same workers as a single-window run (see task_runner), so feed
+confirmation, click guard, stew hotkey, watchdog, anchors, chop plans,
+the CPU budget and hunger history all work per session. Shared between
+the sessions are:
+
+- one CaptureBus: monitor workers read their hunger bar through it; a
+  poll grabs the merged region of nearby sessions once, and the other
+  sessions' next polls are sliced from that frame while it is fresh
+- one InputArbiter: each session clicks through its own SessionInput
+  (AppState.input), so clicks are grouped by session and game windows are
+  switched as rarely as possible
+
+Sessions file (JSON):
+
+    {
+      "sessions": [
+        {"name": "main", "config": "main.json", "window_title": "Roblox", "tasks": ["feed", "chop"],
+         "history": "main_history.bin"},
+        {"name": "alt",  "config": "alt.json",  "window_title": "Roblox - alt", "tasks": ["feed"]}
+      ]
+    }
+
+Config and history paths are relative to the sessions file; sessions
+without "history" keep no hunger history. The global hotkeys (configured
+in the first session's settings) stop or pause all sessions. Run with:
+    python src/afk_headless.py --sessions sessions.json
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+import display_geometry
+import global_hotkeys
+import hunger_history
+import screen_capture
+from clock import REAL_CLOCK, Clock
+from input_arbiter import InputArbiter, SessionInput
+from state import AppState, load_settings
+from status_sink import LoggingStatusSink
+from task_runner import TASK_MONITOR, TASK_NAMES, TASK_TIMER, TaskRunner, resolve_task, validate_task
+
+
+MERGE_AREA_FACTOR = 4.0
+"""Regions on one monitor are captured together while their bounding box
+is at most this many times the sum of their areas."""
+
+CAPTURE_MAX_AGE = 1.0
+"""Seconds a shared capture may be reused for other sessions' polls."""
+
+RUN_POLL_INTERVAL = 0.5
+"""Seconds between checks for stop requests and finished sessions."""
+
+
+def activate_window(title: str) -> None:
+    """
+    Bring the first window whose title contains `title` to the front.
+
+    Uses pygetwindow on Windows and AppKit on macOS, where `title` is
+    matched against application names; elsewhere this is a no-op and the
+    click itself focuses the game window.
+
+    Args:
+        title: Window title substring
+    """
+    if not title:
+        return
+    try:
+        import pygetwindow
+        windows = pygetwindow.getWindowsWithTitle(title)
+        if windows:
+            windows[0].activate()
+            return
+    except Exception:
+        pass
+    if sys.platform != "darwin":
+        return
+    try:
+        from AppKit import NSApplicationActivateIgnoringOtherApps, NSWorkspace
+        for app in NSWorkspace.sharedWorkspace().runningApplications():
+            name = app.localizedName()
+            if name and title.lower() in name.lower():
+                app.activateWithOptions_(NSApplicationActivateIgnoringOtherApps)
+                return
+    except Exception:
+        pass
+
+
+class Session:
+    """One game session: its configuration, tasks and workers."""
+
+    def __init__(self, name: str, state: AppState, window_title: str = "",
+                 tasks: Tuple[str, ...] = ("feed",)):
+        """
+        Initialize a session.
+
+        Args:
+            name: Unique session name (used in logs and for input grouping)
+            state: The session's AppState
+            window_title: Title substring of the session's game window
+            tasks: Task names from task_runner.TASK_NAMES
+        """
+        self.name = name
+        self.state = state
+        self.window_title = window_title
+        self.tasks = tuple(resolve_task(state, task) for task in tasks)
+        self.sink = LoggingStatusSink(state, logging.getLogger(f"afk_auto_help.{name}"))
+        self.runner = TaskRunner(state, self.sink)
+
+    def validate(self) -> Optional[str]:
+        """Return an error message if any task cannot run, else None."""
+        if TASK_TIMER in self.tasks and TASK_MONITOR in self.tasks:
+            return f"{self.name}: only one feed task (timer or monitor) can run"
+        for task in self.tasks:
+            error = validate_task(self.state, task)
+            if error is not None:
+                return f"{self.name}: {error}"
+        return None
+
+
+def load_sessions(path: str) -> List[Session]:
+    """
+    Load a sessions file and each session's settings.
+
+    Args:
+        path: Path of the sessions JSON file
+
+    Returns:
+        list: Sessions in file order
+
+    Raises:
+        OSError: If a file cannot be read
+        ValueError: If the file is malformed or names are not unique
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    entries = data.get("sessions") if isinstance(data, dict) else None
+    if not entries:
+        raise ValueError("Sessions file must contain a non-empty \"sessions\" list")
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    sessions = []
+    for i, entry in enumerate(entries):
+        name = entry.get("name") or f"session{i + 1}"
+        if any(s.name == name for s in sessions):
+            raise ValueError(f"Duplicate session name: {name}")
+        config = os.path.join(base_dir, os.path.expanduser(entry["config"]))
+        state = load_settings(config)
+        display_geometry.apply_normalized(state)
+        tasks = tuple(entry.get("tasks") or ["feed"])
+        for task in tasks:
+            if task not in TASK_NAMES:
+                raise ValueError(f"{name}: unknown task {task}")
+        if entry.get("history"):
+            hunger_history.open_history(
+                state, os.path.join(base_dir, os.path.expanduser(entry["history"]))
+            )
+        sessions.append(Session(name, state, entry.get("window_title", ""), tasks))
+    return sessions
+
+
+class _CaptureGroup:
+    """Sessions whose hunger regions are captured together."""
+
+    def __init__(self, bounds: Tuple[int, int, int, int], members: List[str]):
+        self.bounds = bounds
+        self.members = members
+        self.lock = threading.Lock()
+        self.image = None
+        self.taken_at = 0.0
+        self.served: Set[str] = set()
+        """Sessions that already read the current image."""
+
+
+class CaptureBus:
+    """
+    Captures the hunger regions of many sessions with as few grabs as possible.
+    """
+
+    def __init__(self, sessions: List[Session], clock: Clock = REAL_CLOCK):
+        """
+        Group the sessions' hunger regions into shared captures.
+
+        Args:
+            sessions: Sessions whose hunger_region should be captured
+            clock: Time source for CAPTURE_MAX_AGE
+        """
+        self.clock = clock
+        self.groups: List[_CaptureGroup] = []
+        self._group_of: Dict[str, _CaptureGroup] = {}
+        self.grabs = 0
+        """Screen captures taken."""
+        self.reads = 0
+        """Hunger regions served."""
+        self._build_groups([s for s in sessions if s.state.hunger_region])
+
+    def _build_groups(self, sessions: List[Session]) -> None:
+        """Greedily merge regions on the same monitor while it stays cheap."""
+        pending = sorted(sessions, key=lambda s: (s.state.hunger_region[1], s.state.hunger_region[0]))
+        regions = {s.name: tuple(s.state.hunger_region) for s in pending}
+        try:
+            monitor_of = {
+                s.name: display_geometry.monitor_for_point(*s.state.hunger_region[:2]).index
+                for s in pending
+            }
+        except display_geometry.DisplayError:
+            # Without monitor information, treat everything as one display
+            monitor_of = {s.name: 0 for s in pending}
+        for session in pending:
+            region = regions[session.name]
+            for group in self.groups:
+                if monitor_of[group.members[0]] != monitor_of[session.name]:
+                    continue
+                union = _union(group.bounds, region)
+                areas = sum(regions[m][2] * regions[m][3] for m in group.members)
+                areas += region[2] * region[3]
+                if union[2] * union[3] <= MERGE_AREA_FACTOR * areas:
+                    group.bounds = union
+                    group.members.append(session.name)
+                    break
+            else:
+                self.groups.append(_CaptureGroup(region, [session.name]))
+        for group in self.groups:
+            for name in group.members:
+                self._group_of[name] = group
+
+    def grab(self, name: str, region: Tuple[int, int, int, int]):
+        """
+        Return the image of a session's hunger region.
+
+        The session's group is grabbed anew when its last image is older
+        than CAPTURE_MAX_AGE or was already read by this session (a new
+        poll); otherwise the region is sliced from the shared image. A
+        region moved outside its group (e.g. by an anchor) is captured
+        on its own.
+
+        Args:
+            name: Session name
+            region: Logical (x, y, width, height) of its hunger region
+
+        Returns:
+            PIL.Image: Image of the region
+
+        Raises:
+            Exception: Capture backend errors are propagated to the caller
+        """
+        group = self._group_of.get(name)
+        if group is None or not _contains(group.bounds, region):
+            self.grabs += 1
+            self.reads += 1
+            return screen_capture.capture_region(region)
+        with group.lock:
+            now = self.clock.now()
+            if group.image is None or name in group.served or now - group.taken_at > CAPTURE_MAX_AGE:
+                group.image = screen_capture.grab(group.bounds)
+                group.taken_at = now
+                group.served = set()
+                self.grabs += 1
+            group.served.add(name)
+            image = group.image
+            self.reads += 1
+        bounds = group.bounds
+        scale = image.size[0] / bounds[2]
+        x, y, w, h = region
+        left = round((x - bounds[0]) * scale)
+        top = round((y - bounds[1]) * scale)
+        return image.crop((left, top, left + round(w * scale), top + round(h * scale)))
+
+    def capture_for(self, name: str):
+        """Return a capture function for a session's monitor worker."""
+        return lambda region: self.grab(name, region)
+
+
+def _union(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+    """Return the bounding box of two (x, y, width, height) regions."""
+    x = min(a[0], b[0])
+    y = min(a[1], b[1])
+    right = max(a[0] + a[2], b[0] + b[2])
+    bottom = max(a[1] + a[3], b[1] + b[3])
+    return (x, y, right - x, bottom - y)
+
+
+def _contains(outer: Tuple[int, int, int, int], inner: Tuple[int, int, int, int]) -> bool:
+    """Return True if region `inner` lies completely within `outer`."""
+    return (outer[0] <= inner[0] and outer[1] <= inner[1]
+            and inner[0] + inner[2] <= outer[0] + outer[2]
+            and inner[1] + inner[3] <= outer[1] + outer[3])
+
+
+class SessionManager:
+    """
+    Runs every session's workers with a shared capture bus and input arbiter.
+    """
+
+    def __init__(self, sessions: List[Session], arbiter: Optional[InputArbiter] = None):
+        """
+        Initialize the manager and attach the shared services to the sessions.
+
+        Args:
+            sessions: Sessions to drive
+            arbiter: Shared input arbiter (one is created if not given)
+        """
+        self.sessions = sessions
+        by_name = {s.name: s for s in sessions}
+        self.arbiter = arbiter or InputArbiter(
+            focus=lambda name: activate_window(by_name[name].window_title) if name in by_name else None
+        )
+        self.bus = CaptureBus([s for s in sessions if TASK_MONITOR in s.tasks])
+        for session in sessions:
+            session.state.input = SessionInput(self.arbiter, session.name)
+            if TASK_MONITOR in session.tasks:
+                session.state.hunger_capture = self.bus.capture_for(session.name)
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Ask every session's workers and the run loop to stop."""
+        self._stop.set()
+        for session in self.sessions:
+            session.state.chop_running = False
+            session.state.stop_all_flag = True
+
+    def toggle_pause(self) -> bool:
+        """
+        Pause every session, or resume them all if all are paused.
+
+        Returns:
+            bool: True if the sessions are now paused
+        """
+        paused = not all(s.state.user_paused for s in self.sessions)
+        for session in self.sessions:
+            session.state.user_paused = paused
+        return paused
+
+    def _start_sessions(self) -> None:
+        """Start each session's tasks on its TaskRunner."""
+        for session in self.sessions:
+            started = []
+            for task in session.tasks:
+                error = session.runner.start(task)
+                if error is not None:
+                    session.sink.safe_status_update(f"Cannot start {task}: {error}")
+                else:
+                    started.append(task)
+            if started:
+                session.sink.safe_status_update(f"Session started: {', '.join(started)}")
+
+    def _has_work(self) -> bool:
+        """Return True while any session has a worker running."""
+        return any(not s.runner.is_idle() for s in self.sessions)
+
+    def run(self, duration: Optional[float] = None) -> None:
+        """
+        Drive all sessions until stopped, the duration elapses, or every
+        session's workers have finished (e.g. auto-chop ran out or a
+        session was stopped through its AppState).
+
+        Args:
+            duration: Seconds to run, or None for no limit
+        """
+        self.arbiter.start()
+        self._start_sessions()
+        end = REAL_CLOCK.now() + duration if duration is not None else None
+        try:
+            while self._has_work():
+                timeout = RUN_POLL_INTERVAL
+                if end is not None:
+                    timeout = min(timeout, end - REAL_CLOCK.now())
+                    if timeout <= 0:
+                        break
+                if self._stop.wait(timeout):
+                    break
+        finally:
+            for session in self.sessions:
+                session.runner.stop_all()
+                if session.state.hunger_history is not None:
+                    try:
+                        session.state.hunger_history.save()
+                    except OSError as e:
+                        session.sink.safe_status_update(f"Could not save hunger history: {e}")
+                session.sink.safe_status_update("Session stopped")
+            self.arbiter.stop()
+
+
+def run_sessions_file(path: str, duration: Optional[float] = None,
+                      stop_event: Optional[threading.Event] = None,
+                      logger: Optional[logging.Logger] = None) -> int:
+    """
+    Load a sessions file and run it until stopped.
+
+    Args:
+        path: Sessions JSON file
+        duration: Seconds to run, or None for no limit
+        stop_event: Event that stops the run when set (e.g. from a signal)
+        logger: Logger for errors
+
+    Returns:
+        int: Process exit code (0 on clean shutdown, 2 on configuration errors)
+    """
+    logger = logger or logging.getLogger("afk_auto_help")
+    try:
+        sessions = load_sessions(path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"Could not load sessions from {path}: {e}")
+        return 2
+    for session in sessions:
+        error = session.validate()
+        if error is not None:
+            logger.error(f"Cannot start session {error}")
+            return 2
+
+    if any(s.state.publish_frames for s in sessions):
+        logger.warning("publish_frames is not supported with several sessions; frames are not published")
+
+    manager = SessionManager(sessions)
+    if stop_event is not None:
+        threading.Thread(
+            target=lambda: (stop_event.wait(), manager.stop()), name="session-stop", daemon=True
+        ).start()
+
+    def _on_hotkey_stop() -> None:
+        logger.info("STOP ALL (hotkey)")
+        manager.stop()
+
+    def _on_hotkey_pause() -> None:
+        if manager.toggle_pause():
+            logger.info("Paused all sessions (hotkey) - press again to resume")
+        else:
+            logger.info("Resumed all sessions (hotkey)")
+
+    # Hotkey settings come from the first session's settings file
+    first = sessions[0]
+    hotkeys = global_hotkeys.start_listener(first.state, first.sink, handlers={
+        global_hotkeys.ACTION_STOP: _on_hotkey_stop,
+        global_hotkeys.ACTION_PAUSE: _on_hotkey_pause,
+    })
+    try:
+        manager.run(duration)
+    finally:
+        if hotkeys is not None:
+            hotkeys.stop()
+    logger.info(
+        f"Sessions stopped ({manager.arbiter.executed} actions, "
+        f"{manager.arbiter.focus_switches} window switches, "
+        f"{manager.bus.grabs} captures for {manager.bus.reads} hunger readings)"
+    )
+    return 0
@@ -0,0 +1,385 @@
+"""
+AFK Auto-Help Module: Region Anchoring
+
+Keeps the hunger region and trigger points attached to the game when its
+window moves or resizes. All of them are expressed relative to an anchor:
+
+- WINDOW:   the game window's bounds, looked up by title (no capture needed)
+- TEMPLATE: a small distinctive patch of the game UI recorded by the user
+
+A periodic re-anchoring pass finds the anchor again and, if it moved,
+transforms every stored coordinate in place. Template anchors are searched
+for only in a small neighbourhood of their last known position (growing
+the radius only after a miss), so a check costs one small capture instead
+of a full-screen search.
+"""
+
+import base64
+import threading
+from typing import Dict, Optional, Tuple
+
+import screen_capture
+from clock import REAL_CLOCK
+
+
+ANCHOR_NONE = "NONE"
+ANCHOR_WINDOW = "WINDOW"
+ANCHOR_TEMPLATE = "TEMPLATE"
+
+ANCHOR_CHECK_INTERVAL = 5.0
+"""Seconds between re-anchoring passes."""
+ANCHOR_SEARCH_RADIUS = 32
+"""Initial search radius (logical px) around the template's last position."""
+ANCHOR_MAX_SEARCH_RADIUS = 256
+"""Largest search radius; the radius doubles after each miss up to this."""
+ANCHOR_MATCH_THRESHOLD = 12.0
+"""Maximum mean absolute gray-level difference accepted as a match."""
+ANCHOR_SAMPLE_POINTS = 64
+"""Approximate number of template pixels compared per candidate position."""
+
+
+def find_window_bounds(title: str) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Find an on-screen window whose title or owner contains `title`.
+
+    Uses pygetwindow on Windows and Quartz on macOS (both installed with
+    pyautogui on those platforms).
+
+    Args:
+        title: Case-insensitive substring of the window title or app name
+
+    Returns:
+        tuple: Window bounds (x, y, width, height) in logical coordinates,
+               or None if no matching window was found
+    """
+    needle = title.lower()
+    try:
+        import pygetwindow
+        for window in pygetwindow.getWindowsWithTitle(title):
+            if window.width > 0 and window.height > 0:
+                return (window.left, window.top, window.width, window.height)
+    except Exception:
+        pass
+
+    try:
+        import Quartz
+    except ImportError:
+        return None
+    options = Quartz.kCGWindowListOptionOnScreenOnly | Quartz.kCGWindowListExcludeDesktopElements
+    for info in Quartz.CGWindowListCopyWindowInfo(options, Quartz.kCGNullWindowID) or []:
+        name = f"{info.get('kCGWindowOwnerName', '')} {info.get('kCGWindowName', '')}".lower()
+        if needle in name:
+            b = info["kCGWindowBounds"]
+            if b["Width"] > 0 and b["Height"] > 0:
+                return (int(b["X"]), int(b["Y"]), int(b["Width"]), int(b["Height"]))
+    return None
+
+
+def capture_gray(region: Tuple[int, int, int, int]) -> bytes:
+    """
+    Capture a region as 8-bit grayscale at logical resolution.
+
+    Args:
+        region: Logical (x, y, width, height)
+
+    Returns:
+        bytes: width * height gray levels, row-major
+    """
+    x, y, width, height = region
+    image = screen_capture.grab(region, publish=False)
+    if image.size != (width, height):
+        image = image.resize((width, height))
+    return image.convert("L").tobytes()
+
+
+def record_template_anchor(state, region: Tuple[int, int, int, int]) -> None:
+    """
+    Record a small screen patch as the anchor for all stored coordinates.
+
+    Args:
+        state: AppState instance
+        region: Logical (x, y, width, height) of a distinctive, static part
+                of the game UI (e.g. an icon next to the hunger bar)
+    """
+    state.anchor_template = base64.b64encode(capture_gray(region)).decode("ascii")
+    state.anchor_region = tuple(region)
+    state.anchor_mode = ANCHOR_TEMPLATE
+
+
+def record_window_anchor(state, title: str) -> bool:
+    """
+    Anchor stored coordinates to the game window's current bounds.
+
+    Args:
+        state: AppState instance
+        title: Substring of the game window title (e.g. "Roblox")
+
+    Returns:
+        bool: True if the window was found and the anchor recorded
+    """
+    bounds = find_window_bounds(title)
+    if bounds is None:
+        return False
+    state.anchor_window_title = title
+    state.anchor_region = bounds
+    state.anchor_mode = ANCHOR_WINDOW
+    return True
+
+
+def _sample_offsets(width: int, height: int):
+    """Choose an evenly spaced grid of (dx, dy) template sample points."""
+    step = max(1, int((width * height / ANCHOR_SAMPLE_POINTS) ** 0.5))
+    return [(dx, dy) for dy in range(step // 2, height, step) for dx in range(step // 2, width, step)]
+
+
+def scan_for_template(area, width: int, height: int, samples, template_width: int,
+                      template_height: int, limit: float) -> Optional[Tuple[int, int]]:
+    """
+    Find the best template position in a grayscale search area.
+
+    Every position is scanned, abandoning each as soon as its partial
+    difference exceeds the best (or acceptable) score so far. Most
+    non-matching positions are rejected after a handful of samples.
+
+    Args:
+        area: width * height gray levels (bytes or memoryview)
+        width: Search area width
+        height: Search area height
+        samples: (dx, dy, value) template sample points
+        template_width: Template width
+        template_height: Template height
+        limit: Largest summed difference accepted as a match
+
+    Returns:
+        tuple: (x, y) offset of the best match within the area, or None
+    """
+    best_score = limit
+    best = None
+    for oy in range(0, height - template_height + 1):
+        for ox in range(0, width - template_width + 1):
+            total = 0
+            for dx, dy, value in samples:
+                total += abs(area[(oy + dy) * width + ox + dx] - value)
+                if total > best_score:
+                    break
+            else:
+                best_score, best = total, (ox, oy)
+    return best
+
+
+def locate_template(state, radius: int, pool=None) -> Optional[Tuple[int, int]]:
+    """
+    Search for the template anchor near its last known position.
+
+    Args:
+        state: AppState with a TEMPLATE anchor
+        radius: Search radius in logical pixels
+        pool: Optional detection_pool.DetectionPool to run the scan in
+
+    Returns:
+        tuple: New (x, y) of the template, or None if not found
+    """
+    ax, ay, tw, th = state.anchor_region
+    template = base64.b64decode(state.anchor_template)
+    samples = [(dx, dy, template[dy * tw + dx]) for dx, dy in _sample_offsets(tw, th)]
+    limit = ANCHOR_MATCH_THRESHOLD * len(samples)
+
+    # Common case: the anchor has not moved. Check it with a capture of
+    # just the template area before searching.
+    here = capture_gray(state.anchor_region)
+    if sum(abs(here[dy * tw + dx] - value) for dx, dy, value in samples) <= limit:
+        return (ax, ay)
+
+    # One capture covering every candidate position
+    sx = max(0, ax - radius)
+    sy = max(0, ay - radius)
+    sw = tw + (ax - sx) + radius
+    sh = th + (ay - sy) + radius
+    area = capture_gray((sx, sy, sw, sh))
+
+    if pool is not None:
+        best = pool.match_template(area, sw, sh, samples, tw, th, limit).result()
+    else:
+        best = scan_for_template(area, sw, sh, samples, tw, th, limit)
+    if best is None:
+        return None
+    return (sx + best[0], sy + best[1])
+
+
+def move_point(point: Tuple[int, int], old_bounds: Tuple[int, int, int, int],
+               new_bounds: Tuple[int, int, int, int]) -> Tuple[int, int]:
+    """
+    Move a point from one anchor position to another.
+
+    The point keeps its position relative to the anchor origin, scaled by
+    the change in anchor size (a template anchor keeps its size, so this is
+    a pure translation).
+
+    Args:
+        point: Logical (x, y) recorded relative to old_bounds
+        old_bounds: Anchor (x, y, width, height) the point was recorded at
+        new_bounds: Current anchor (x, y, width, height)
+
+    Returns:
+        tuple: The moved (x, y)
+    """
+    ox, oy, ow, oh = old_bounds
+    nx, ny, nw, nh = new_bounds
+    sx = nw / ow if ow else 1.0
+    sy = nh / oh if oh else 1.0
+    x, y = point
+    return (round(nx + (x - ox) * sx), round(ny + (y - oy) * sy))
+
+
+def move_region(region: Tuple[int, int, int, int], old_bounds: Tuple[int, int, int, int],
+                new_bounds: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+    """Move a region (x, y, width, height) like move_point(), scaling its size."""
+    x, y, w, h = region
+    ow, oh = old_bounds[2:]
+    nw, nh = new_bounds[2:]
+    sx = nw / ow if ow else 1.0
+    sy = nh / oh if oh else 1.0
+    px, py = move_point((x, y), old_bounds, new_bounds)
+    return (px, py, max(1, round(w * sx)), max(1, round(h * sy)))
+
+
+def apply_anchor_move(state, new_bounds: Tuple[int, int, int, int]) -> None:
+    """
+    Move and scale all stored coordinates from the old anchor to a new one.
+
+    Workers holding copies of coordinates can follow with move_point() and
+    move_region() from the anchor_region they copied them at.
+
+    Args:
+        state: AppState instance; anchor_region is updated to new_bounds
+        new_bounds: New anchor (x, y, width, height)
+    """
+    old = state.anchor_region
+    if state.hunger_region is not None:
+        state.hunger_region = move_region(state.hunger_region, old, new_bounds)
+    if state.chop_target_region is not None:
+        state.chop_target_region = move_region(state.chop_target_region, old, new_bounds)
+    for entry in state.chop_plan or []:
+        entry["point"] = move_point(entry["point"], old, new_bounds)
+        if entry.get("target_region"):
+            entry["target_region"] = move_region(entry["target_region"], old, new_bounds)
+    if state.feed_trigger is not None:
+        state.feed_trigger = move_point(state.feed_trigger, old, new_bounds)
+    if state.chop_trigger is not None:
+        state.chop_trigger = move_point(state.chop_trigger, old, new_bounds)
+    if state.watchdog_sentinels:
+        state.watchdog_sentinels = tuple(
+            move_region(region, old, new_bounds) for region in state.watchdog_sentinels
+        )
+    if state.watchdog_live_region is not None:
+        state.watchdog_live_region = move_region(state.watchdog_live_region, old, new_bounds)
+    state.anchor_region = tuple(new_bounds)
+
+
+class AnchorTracker:
+    """
+    Periodically re-locates the anchor and updates coordinates in place.
+
+    Call maybe_update() from a worker loop; it does nothing until the
+    check interval has elapsed. Workers of one AppState share a tracker
+    (see tracker_for()) so a move is applied exactly once.
+    """
+
+    def __init__(self, state, interval: float = ANCHOR_CHECK_INTERVAL, pool=None, clock=None):
+        """
+        Initialize the tracker.
+
+        Args:
+            state: AppState instance
+            interval: Seconds between re-anchoring passes
+            pool: Optional detection_pool.DetectionPool for template search
+            clock: Time source (clock.Clock); defaults to real time
+        """
+        self.state = state
+        self.pool = pool
+        self.clock = clock or REAL_CLOCK
+        self.interval = interval
+        self.radius = ANCHOR_SEARCH_RADIUS
+        self.next_check = self.clock.now() + interval
+        self.lost = False
+        """True when the last pass could not find the anchor."""
+        self._lock = threading.Lock()
+
+    def maybe_update(self) -> bool:
+        """
+        Run a re-anchoring pass if one is due.
+
+        Returns:
+            bool: True if the anchor moved and coordinates were updated
+                  (False if another worker is running the pass)
+        """
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            return self._update()
+        finally:
+            self._lock.release()
+
+    def _update(self) -> bool:
+        """Body of maybe_update(), run under the tracker's lock."""
+        state = self.state
+        if state.anchor_mode == ANCHOR_NONE:
+            return False
+        now = self.clock.now()
+        if now < self.next_check:
+            return False
+        self.next_check = now + self.interval
+        if state.anchor_mode == ANCHOR_WINDOW and state.anchor_region is None:
+            # Configured by title only: coordinates are relative to where
+            # the window is first found
+            record_window_anchor(state, state.anchor_window_title)
+            return False
+        if state.anchor_region is None:
+            return False
+
+        if state.anchor_mode == ANCHOR_WINDOW:
+            bounds = find_window_bounds(state.anchor_window_title)
+        else:
+            try:
+                position = locate_template(state, self.radius, self.pool)
+            except Exception:
+                position = None
+            if position is None:
+                # Widen the search for the next pass rather than scanning
+                # the whole screen now
+                self.radius = min(self.radius * 2, ANCHOR_MAX_SEARCH_RADIUS)
+                bounds = None
+            else:
+                self.radius = ANCHOR_SEARCH_RADIUS
+                bounds = (position[0], position[1]) + tuple(state.anchor_region[2:])
+
+        self.lost = bounds is None
+        if bounds is None or tuple(bounds) == tuple(state.anchor_region):
+            return False
+        apply_anchor_move(state, bounds)
+        return True
+
+
+_trackers: Dict[int, AnchorTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def tracker_for(state, pool=None) -> AnchorTracker:
+    """
+    Return the anchor tracker shared by an AppState's workers.
+
+    Args:
+        state: AppState instance
+        pool: Optional detection_pool.DetectionPool for template search,
+              used when the tracker is created
+
+    Returns:
+        AnchorTracker: Created on first use with the state's clock
+    """
+    key = id(state)
+    with _trackers_lock:
+        tracker = _trackers.get(key)
+        if tracker is None or tracker.state is not state:
+            tracker = AnchorTracker(state, pool=pool, clock=state.clock)
+            _trackers[key] = tracker
+        return tracker
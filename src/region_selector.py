@@ -5,6 +5,14 @@ This module provides a transparent fullscreen overlay for selecting
 screen regions (e.g., hunger bar area) and capturing click coordinates
 for trigger points (feed trigger, chop trigger).
 
+The overlay creates its canvas items once and only moves them with
+`coords` as the mouse moves; redraws are coalesced to at most one per
+display frame. A snapshot of the monitor taken before the overlay opens
+feeds a magnifier loupe and, for the hunger region, a live preview of
+which pixels the hunger detector classifies as filled. Both are shown in
+small opaque windows above the overlay, so the overlay's transparency
+does not wash them out.
+
 NOTE:
 This file contains the initial scaffolding for Phase 0.
 Full implementation will be completed in Phase 2 (Screen Region & Click Recording).
@@ -13,11 +21,198 @@ Full implementation will be completed in Phase 2 (Screen Region & Click Recordin
 import tkinter as tk
 from typing import Optional, Callable, Tuple
 
-# TODO: Phase 4+ - pyautogui will be needed for automation actions
-import pyautogui
+import click_guard
+import screen_capture
+
+
+REFRESH_INTERVAL_MS = 16
+"""Minimum time between overlay redraws (~60 Hz display refresh)."""
+LOUPE_SOURCE_SIZE = 21
+"""Logical pixels around the cursor shown in the magnifier loupe."""
+LOUPE_ZOOM = 8
+"""Magnification factor of the loupe."""
+LOUPE_OFFSET = 24
+"""Distance in pixels between the cursor and the loupe."""
+PREVIEW_MAX_PIXELS = 8000
+"""Largest number of pixels classified per preview redraw."""
+PREVIEW_FILLED_COLOR = (0, 255, 255)
+PREVIEW_EMPTY_COLOR = (40, 40, 40)
+
+
+class _FrameThrottle:
+    """Coalesces redraw requests into at most one render per frame."""
+    
+    def __init__(self, widget, render: Callable[[], None], interval_ms: int = REFRESH_INTERVAL_MS):
+        self.widget = widget
+        self.render = render
+        self.interval_ms = interval_ms
+        self.pending = False
+    
+    def request(self) -> None:
+        """Schedule a render unless one is already scheduled."""
+        if not self.pending:
+            self.pending = True
+            self.widget.after(self.interval_ms, self._run)
+    
+    def _run(self) -> None:
+        self.pending = False
+        try:
+            self.render()
+        except tk.TclError:
+            pass  # Overlay was destroyed before the frame ran
+
+
+def _overlay_bounds(widget) -> Tuple[int, int, int, int]:
+    """
+    Return the logical (x, y, width, height) of the monitor the overlay
+    opens on: the one under the pointer.
+    
+    Falls back to Tk's primary screen if monitors cannot be listed.
+    """
+    px, py = widget.winfo_pointerxy()
+    try:
+        import display_geometry
+        monitor = display_geometry.monitor_for_point(px, py)
+        return (monitor.x, monitor.y, monitor.width, monitor.height)
+    except Exception:
+        return (0, 0, widget.winfo_screenwidth(), widget.winfo_screenheight())
+
+
+def _take_snapshot(bounds: Tuple[int, int, int, int]):
+    """
+    Capture the monitor under the overlay before it is shown.
+    
+    The snapshot is not published to the frame ring (see screen_capture).
+    
+    Args:
+        bounds: Logical (x, y, width, height) of the overlay's monitor
+    
+    Returns:
+        PIL.Image or None if capture (or Pillow's Tk support) is unavailable
+    """
+    try:
+        from PIL import ImageTk  # noqa: F401
+        return screen_capture.grab(bounds, publish=False)
+    except Exception:
+        return None
+
+
+class _Popup:
+    """Small opaque window that floats above the translucent overlay."""
+    
+    def __init__(self, overlay, width: int = 1, height: int = 1):
+        self.overlay = overlay
+        self.window = tk.Toplevel(overlay)  # Destroyed together with the overlay
+        self.window.withdraw()
+        self.window.overrideredirect(True)
+        self.window.attributes('-topmost', True)
+        self.canvas = tk.Canvas(self.window, width=width, height=height, bg='black', highlightthickness=0)
+        self.canvas.pack()
+        self.shown = False
+    
+    def show_at(self, x: int, y: int) -> None:
+        """Move the window's top-left corner to screen point (x, y)."""
+        self.window.geometry(f'+{x}+{y}')
+        if not self.shown:
+            self.shown = True
+            self.window.deiconify()
+            self.overlay.focus_force()  # Keep ESC working on the overlay
+        self.window.lift()
+
+
+class _Loupe:
+    """Magnified view of the snapshot around the cursor."""
+    
+    def __init__(self, overlay, snapshot, bounds: Tuple[int, int, int, int]):
+        self.overlay = overlay
+        self.snapshot = snapshot
+        self.origin = bounds[:2]
+        self.scale = snapshot.size[0] / bounds[2]
+        self.size = LOUPE_SOURCE_SIZE * LOUPE_ZOOM
+        self.photo = None
+        self.popup = _Popup(overlay, self.size, self.size)
+        canvas = self.popup.canvas
+        self.image_id = canvas.create_image(0, 0, anchor=tk.NW)
+        canvas.create_rectangle(0, 0, self.size - 1, self.size - 1, outline='white', width=1)
+        center = self.size // 2
+        canvas.create_rectangle(
+            center - LOUPE_ZOOM // 2, center - LOUPE_ZOOM // 2,
+            center + LOUPE_ZOOM // 2, center + LOUPE_ZOOM // 2,
+            outline='red', width=1
+        )
+    
+    def update(self, x: int, y: int, root_x: int, root_y: int) -> None:
+        """Show the area around screen point (root_x, root_y) near overlay point (x, y)."""
+        from PIL import Image, ImageTk
+        half = LOUPE_SOURCE_SIZE // 2
+        s = self.scale
+        sx = root_x - self.origin[0]
+        sy = root_y - self.origin[1]
+        box = (
+            round((sx - half) * s), round((sy - half) * s),
+            round((sx + half + 1) * s), round((sy + half + 1) * s)
+        )
+        zoomed = self.snapshot.crop(box).resize((self.size, self.size), Image.NEAREST)
+        self.photo = ImageTk.PhotoImage(zoomed)
+        
+        # Keep the loupe on screen: flip to the other side near edges
+        lx = x + LOUPE_OFFSET
+        ly = y + LOUPE_OFFSET
+        if lx + self.size > self.overlay.winfo_width():
+            lx = x - LOUPE_OFFSET - self.size
+        if ly + self.size > self.overlay.winfo_height():
+            ly = y - LOUPE_OFFSET - self.size
+        
+        self.popup.canvas.itemconfig(self.image_id, image=self.photo)
+        self.popup.show_at(self.origin[0] + lx, self.origin[1] + ly)
 
 
-def select_region(callback: Callable[[Tuple[int, int, int, int]], None]) -> None:
+def _classified_preview(snapshot, scale: float, region: Tuple[int, int, int, int],
+                        classifier: Callable[[int, int, int], bool],
+                        origin: Tuple[int, int] = (0, 0)):
+    """
+    Classify the pixels of a region of the snapshot.
+    
+    Args:
+        snapshot: Screen snapshot (PIL.Image)
+        scale: Snapshot pixels per logical unit
+        region: Logical (x, y, width, height)
+        classifier: Function (r, g, b) -> bool marking filled pixels
+        origin: Logical (x, y) of the snapshot's top-left corner
+        
+    Returns:
+        tuple: (preview PIL.Image at logical size, filled fraction 0.0-1.0)
+    """
+    from PIL import Image
+    x, y, width, height = region
+    x -= origin[0]
+    y -= origin[1]
+    crop = snapshot.crop((
+        round(x * scale), round(y * scale),
+        round((x + width) * scale), round((y + height) * scale)
+    ))
+    
+    # Classify a downscaled copy so large selections stay cheap
+    factor = max(1.0, (width * height / PREVIEW_MAX_PIXELS) ** 0.5)
+    sample_size = (max(1, int(width / factor)), max(1, int(height / factor)))
+    sample = crop.resize(sample_size, Image.NEAREST)
+    
+    filled = 0
+    out = []
+    for r, g, b in sample.getdata():
+        if classifier(r, g, b):
+            filled += 1
+            out.append(PREVIEW_FILLED_COLOR)
+        else:
+            out.append(PREVIEW_EMPTY_COLOR)
+    preview = Image.new("RGB", sample_size)
+    preview.putdata(out)
+    preview = preview.resize((width, height), Image.NEAREST)
+    return preview, filled / len(out)
+
+
+def select_region(callback: Callable[[Tuple[int, int, int, int]], None],
+                  preview_classifier: Optional[Callable[[int, int, int], bool]] = None) -> None:
     """
     Display a fullscreen overlay for selecting a screen region.
     
@@ -28,20 +223,29 @@ def select_region(callback: Callable[[Tuple[int, int, int, int]], None]) -> None
     Args:
         callback: Function to call with (x, y, width, height) tuple when
                  region is selected, or None if cancelled
+        preview_classifier: Optional function (r, g, b) -> bool. When given,
+                 the selection shows which pixels it classifies as filled
+                 (e.g. hunger_detection.classify_pixel) and the fill level.
     """
     # Create fullscreen overlay window (without using -fullscreen to avoid macOS fullscreen API)
     overlay = tk.Toplevel()
+    overlay.withdraw()  # Keep hidden until the screen snapshot is taken
+    
+    # Cover the monitor under the pointer; get its bounds BEFORE setting geometry
+    bounds = _overlay_bounds(overlay)
+    screen_x, screen_y, screen_width, screen_height = bounds
+    
+    # Snapshot the screen before the overlay covers it
+    snapshot = _take_snapshot(bounds)
+    
     overlay.overrideredirect(True)  # Remove window decorations first
     overlay.attributes('-topmost', True)
     overlay.attributes('-alpha', 0.3)  # Semi-transparent background
     overlay.configure(bg='black')
+    overlay.deiconify()
     
-    # Get screen dimensions BEFORE setting geometry
-    screen_width = overlay.winfo_screenwidth()
-    screen_height = overlay.winfo_screenheight()
-    
-    # Manually set window to cover entire screen (avoid -fullscreen attribute)
-    overlay.geometry(f'{screen_width}x{screen_height}+0+0')
+    # Manually set window to cover the monitor (avoid -fullscreen attribute)
+    overlay.geometry(f'{screen_width}x{screen_height}+{screen_x}+{screen_y}')
     
     # Create canvas for drawing selection rectangle
     canvas = tk.Canvas(
@@ -52,44 +256,73 @@ def select_region(callback: Callable[[Tuple[int, int, int, int]], None]) -> None
     )
     canvas.pack(fill=tk.BOTH, expand=True)
     
+    # Canvas items are created once (hidden) and moved with coords()
+    rect_id = canvas.create_rectangle(
+        0, 0, 0, 0, outline='cyan', width=2, fill='', stipple='gray50', state=tk.HIDDEN
+    )
+    loupe = _Loupe(overlay, snapshot, bounds) if snapshot is not None else None
+    scale = snapshot.size[0] / screen_width if snapshot is not None else 1.0
+    preview_photo = None
+    preview = None
+    if preview_classifier is not None and snapshot is not None:
+        preview = _Popup(overlay)
+        preview_id = preview.canvas.create_image(0, 0, anchor=tk.NW)
+        fill_text_id = preview.canvas.create_text(0, 0, anchor=tk.NW, fill='white', font=('Arial', 12))
+    
     # Selection state
     start_x = None
     start_y = None
     start_canvas_x = None
     start_canvas_y = None
-    rect_id = None
+    last_event = None
+    
+    def render():
+        """Draw the latest mouse state (called at most once per frame)."""
+        nonlocal preview_photo
+        if last_event is None:
+            return
+        event = last_event
+        if loupe is not None:
+            loupe.update(event.x, event.y, event.x_root, event.y_root)
+        if start_canvas_x is None:
+            return
+        
+        canvas.coords(rect_id, start_canvas_x, start_canvas_y, event.x, event.y)
+        canvas.itemconfig(rect_id, state=tk.NORMAL)
+        
+        x = min(start_x, event.x_root)
+        y = min(start_y, event.y_root)
+        width = abs(event.x_root - start_x)
+        height = abs(event.y_root - start_y)
+        if preview is not None and width > 0 and height > 0:
+            from PIL import ImageTk
+            image, fill = _classified_preview(snapshot, scale, (x, y, width, height),
+                                              preview_classifier, bounds[:2])
+            preview_photo = ImageTk.PhotoImage(image)
+            preview.canvas.itemconfig(preview_id, image=preview_photo)
+            preview.canvas.itemconfig(fill_text_id, text=f"Filled: {fill * 100:.1f}%")
+            preview.canvas.coords(fill_text_id, 0, height + 4)
+            preview.canvas.config(width=max(width, 120), height=height + 24)
+            preview.show_at(x, y + height + 4)
+    
+    throttle = _FrameThrottle(overlay, render)
     
     def on_button_press(event):
         """Handle mouse button press - start selection."""
-        nonlocal start_x, start_y, start_canvas_x, start_canvas_y, rect_id
+        nonlocal start_x, start_y, start_canvas_x, start_canvas_y, last_event
         # Store both root (for final calculation) and canvas (for drawing) coordinates
         start_x = event.x_root  # Screen coordinates for final calculation
         start_y = event.y_root
         start_canvas_x = event.x  # Canvas coordinates for drawing
         start_canvas_y = event.y
-        # Clear any existing rectangle
-        if rect_id is not None:
-            canvas.delete(rect_id)
+        last_event = event
+        throttle.request()
     
     def on_motion(event):
-        """Handle mouse motion - update selection rectangle."""
-        nonlocal rect_id, start_canvas_x, start_canvas_y
-        if start_canvas_x is not None and start_canvas_y is not None:
-            # Clear previous rectangle
-            if rect_id is not None:
-                canvas.delete(rect_id)
-            
-            # Draw new rectangle using canvas coordinates (relative to canvas widget)
-            canvas_x1 = start_canvas_x
-            canvas_y1 = start_canvas_y
-            canvas_x2 = event.x
-            canvas_y2 = event.y
-            
-            # Use canvas coordinates for drawing
-            rect_id = canvas.create_rectangle(
-                canvas_x1, canvas_y1, canvas_x2, canvas_y2,
-                outline='cyan', width=2, fill='', stipple='gray50'
-            )
+        """Handle mouse motion - remember position and schedule a redraw."""
+        nonlocal last_event
+        last_event = event
+        throttle.request()
     
     def on_button_release(event):
         """Handle mouse button release - finalize selection."""
@@ -130,6 +363,7 @@ def select_region(callback: Callable[[Tuple[int, int, int, int]], None]) -> None
     
     # Bind events
     canvas.bind('<Button-1>', on_button_press)
+    canvas.bind('<Motion>', on_motion)
     canvas.bind('<B1-Motion>', on_motion)
     canvas.bind('<ButtonRelease-1>', on_button_release)
     overlay.bind('<Escape>', on_escape)
@@ -149,7 +383,8 @@ def select_region(callback: Callable[[Tuple[int, int, int, int]], None]) -> None
     overlay.focus_force()
 
 
-def select_point(callback: Callable[[Optional[Tuple[int, int]]], None]) -> None:
+def select_point(callback: Callable[[Optional[Tuple[int, int]]], None],
+                 on_signature: Optional[Callable[[Optional[list]], None]] = None) -> None:
     """
     Display a fullscreen overlay that captures a single click coordinate.
     
@@ -159,20 +394,29 @@ def select_point(callback: Callable[[Optional[Tuple[int, int]]], None]) -> None:
     Args:
         callback: Function to call with (x, y) tuple when point is clicked,
                  or None if cancelled
+        on_signature: Optional function called before callback with the
+                 click_guard signature of the pixels around the point, read
+                 from the screen snapshot (None if no snapshot is available)
     """
     # Create fullscreen overlay window (without using -fullscreen to avoid macOS fullscreen API)
     overlay = tk.Toplevel()
+    overlay.withdraw()  # Keep hidden until the screen snapshot is taken
+    
+    # Cover the monitor under the pointer; get its bounds BEFORE setting geometry
+    bounds = _overlay_bounds(overlay)
+    screen_x, screen_y, screen_width, screen_height = bounds
+    
+    # Snapshot the screen before the overlay covers it
+    snapshot = _take_snapshot(bounds)
+    
     overlay.overrideredirect(True)  # Remove window decorations first
     overlay.attributes('-topmost', True)
     overlay.attributes('-alpha', 0.2)  # Semi-transparent background
     overlay.configure(bg='black')
+    overlay.deiconify()
     
-    # Get screen dimensions BEFORE setting geometry
-    screen_width = overlay.winfo_screenwidth()
-    screen_height = overlay.winfo_screenheight()
-    
-    # Manually set window to cover entire screen (avoid -fullscreen attribute)
-    overlay.geometry(f'{screen_width}x{screen_height}+0+0')
+    # Manually set window to cover the monitor (avoid -fullscreen attribute)
+    overlay.geometry(f'{screen_width}x{screen_height}+{screen_x}+{screen_y}')
     
     # Create canvas
     canvas = tk.Canvas(
@@ -183,35 +427,44 @@ def select_point(callback: Callable[[Optional[Tuple[int, int]]], None]) -> None:
     )
     canvas.pack(fill=tk.BOTH, expand=True)
     
-    # Track mouse position for visual feedback
-    crosshair_h = None
-    crosshair_v = None
+    # Crosshair lines are created once (hidden) and moved with coords()
+    crosshair_h = canvas.create_line(0, 0, 0, 0, fill='cyan', width=2, state=tk.HIDDEN)
+    crosshair_v = canvas.create_line(0, 0, 0, 0, fill='cyan', width=2, state=tk.HIDDEN)
+    loupe = _Loupe(overlay, snapshot, bounds) if snapshot is not None else None
+    last_event = None
+    
+    def render():
+        """Draw the crosshair and loupe at the latest mouse position."""
+        if last_event is None:
+            return
+        x = last_event.x
+        y = last_event.y
+        canvas.coords(crosshair_h, x - 20, y, x + 20, y)
+        canvas.coords(crosshair_v, x, y - 20, x, y + 20)
+        canvas.itemconfig(crosshair_h, state=tk.NORMAL)
+        canvas.itemconfig(crosshair_v, state=tk.NORMAL)
+        if loupe is not None:
+            loupe.update(x, y, last_event.x_root, last_event.y_root)
+    
+    throttle = _FrameThrottle(overlay, render)
     
     def on_motion(event):
-        """Handle mouse motion - update crosshair."""
-        nonlocal crosshair_h, crosshair_v
-        # Clear previous crosshair
-        if crosshair_h is not None:
-            canvas.delete(crosshair_h)
-            canvas.delete(crosshair_v)
-        
-        # Draw crosshair at mouse position (use canvas coordinates)
-        x = event.x
-        y = event.y
-        crosshair_h = canvas.create_line(
-            x - 20, y, x + 20, y,
-            fill='cyan', width=2
-        )
-        crosshair_v = canvas.create_line(
-            x, y - 20, x, y + 20,
-            fill='cyan', width=2
-        )
+        """Handle mouse motion - remember position and schedule a redraw."""
+        nonlocal last_event
+        last_event = event
+        throttle.request()
     
     def on_click(event):
         """Handle mouse click - capture coordinate."""
         x = event.x_root
         y = event.y_root
         overlay.destroy()
+        if on_signature is not None:
+            signature = None
+            if snapshot is not None:
+                scale = snapshot.size[0] / screen_width
+                signature = click_guard.signature_from_image(snapshot, scale, x, y, bounds[:2])
+            on_signature(signature)
         callback((x, y))
     
     def on_escape(event):
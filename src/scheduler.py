@@ -0,0 +1,97 @@
+"""
+AFK Auto-Help Module: Deadline Scheduler
+
+Precise waiting for timed input. Callers compute absolute deadlines up
+front (so per-step error never accumulates) and the scheduler sleeps
+coarsely until shortly before each deadline, then spins for the last
+stretch to hit it accurately. Lateness is tracked so callers can see how
+well a run kept time.
+"""
+
+import threading
+from typing import Callable, Optional
+
+from clock import REAL_CLOCK, Clock
+
+
+SPIN_THRESHOLD_NS = 2_000_000
+"""Below this much remaining time (2 ms), spin instead of sleeping."""
+
+POLL_INTERVAL_S = 0.05
+"""Longest single sleep, so stop requests are noticed promptly."""
+
+
+class DeadlineScheduler:
+    """
+    Waits for absolute deadlines on a clock's nanosecond timeline.
+
+    Deadlines are nanosecond timestamps from now_ns() (time.perf_counter_ns()
+    with the default real clock). The scheduler records how late each
+    deadline was actually reached.
+    """
+
+    def __init__(self, should_stop: Optional[Callable[[], bool]] = None,
+                 spin_threshold_ns: int = SPIN_THRESHOLD_NS,
+                 clock: Optional[Clock] = None,
+                 stop_event: Optional[threading.Event] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            should_stop: Called while waiting; waiting is abandoned when it
+                         returns True
+            spin_threshold_ns: Remaining time below which the scheduler
+                               busy-waits instead of sleeping
+            clock: Time source (AppState.clock); simulated clocks never spin
+            stop_event: Event that ends waiting immediately when set
+                        (AppState.stop_event); should_stop is still polled
+        """
+        self.should_stop = should_stop or (lambda: False)
+        self.clock = clock or REAL_CLOCK
+        self.stop_event = stop_event
+        self.spin_threshold_ns = spin_threshold_ns if self.clock.real else 0
+        self.deadlines_hit = 0
+        self.total_lateness_ns = 0
+        self.max_lateness_ns = 0
+
+    def now_ns(self) -> int:
+        """Return the current time on the scheduler's timeline."""
+        return self.clock.now_ns()
+
+    def wait_until(self, deadline_ns: int) -> bool:
+        """
+        Block until the deadline is reached.
+
+        Args:
+            deadline_ns: Absolute deadline from now_ns()
+
+        Returns:
+            bool: True when the deadline was reached, False if stopped first
+        """
+        clock = self.clock
+        while True:
+            if self.should_stop():
+                return False
+            remaining = deadline_ns - clock.now_ns()
+            if remaining <= 0:
+                break
+            if remaining > self.spin_threshold_ns:
+                sleep_s = min((remaining - self.spin_threshold_ns) / 1e9, POLL_INTERVAL_S)
+                if self.stop_event is None:
+                    clock.sleep(sleep_s)
+                elif clock.wait(self.stop_event, sleep_s):
+                    return False
+            # else: spin until the deadline passes
+
+        lateness = clock.now_ns() - deadline_ns
+        self.deadlines_hit += 1
+        self.total_lateness_ns += lateness
+        if lateness > self.max_lateness_ns:
+            self.max_lateness_ns = lateness
+        return True
+
+    def mean_lateness_ms(self) -> float:
+        """Return the average lateness of reached deadlines in milliseconds."""
+        if self.deadlines_hit == 0:
+            return 0.0
+        return self.total_lateness_ns / self.deadlines_hit / 1e6
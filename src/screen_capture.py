@@ -0,0 +1,178 @@
+"""
+AFK Auto-Help Module: Screen Capture Layer
+
+All screenshot access goes through this module. Regions are given in
+logical coordinates (the same space as Tk mouse events and clicks) and
+only that region is captured; the returned image has the display's
+physical resolution, so on a Retina display a 100x10 region comes back
+as 200x20 pixels (see display_geometry for the scale mapping).
+
+Backends, in order of preference, are imported lazily on first capture
+so that application startup does not pay for them:
+- mss (fastest; installed from requirements.txt)
+- PIL.ImageGrab (captures just the requested rectangle)
+- pyautogui (fallback)
+
+Captured frames can additionally be published to a shared-memory ring for
+other processes (see frame_ring and enable_frame_ring()).
+"""
+
+import threading
+from typing import Optional, Tuple
+
+
+_backend_name: Optional[str] = None
+_local = threading.local()
+_frame_ring = None
+_frame_ring_lock = threading.Lock()
+
+
+def _select_backend() -> str:
+    """Pick the best available capture backend (once)."""
+    global _backend_name
+    if _backend_name is None:
+        try:
+            import mss  # noqa: F401
+            _backend_name = "mss"
+        except ImportError:
+            try:
+                from PIL import ImageGrab  # noqa: F401
+                _backend_name = "imagegrab"
+            except ImportError:
+                _backend_name = "pyautogui"
+    return _backend_name
+
+
+def is_backend_loaded() -> bool:
+    """Return True if the capture backend has already been imported."""
+    return _backend_name is not None
+
+
+def backend_name() -> str:
+    """Return the name of the capture backend in use."""
+    return _select_backend()
+
+
+def _mss_instance():
+    """Return this thread's mss instance (mss handles are not thread-safe)."""
+    sct = getattr(_local, "sct", None)
+    if sct is None:
+        import mss
+        sct = mss.mss()
+        _local.sct = sct
+    return sct
+
+
+def enable_frame_ring(name: Optional[str] = None) -> None:
+    """
+    Publish every captured frame to a shared-memory frame ring.
+
+    Args:
+        name: Shared-memory name (frame_ring.DEFAULT_RING_NAME if None)
+    """
+    global _frame_ring
+    import frame_ring
+    with _frame_ring_lock:
+        if _frame_ring is None:
+            _frame_ring = frame_ring.FrameRingWriter(name or frame_ring.DEFAULT_RING_NAME)
+
+
+def disable_frame_ring() -> None:
+    """Stop publishing frames and remove the ring."""
+    global _frame_ring
+    with _frame_ring_lock:
+        if _frame_ring is not None:
+            _frame_ring.close()
+            _frame_ring = None
+
+
+def configure_frame_ring(state) -> Optional[str]:
+    """
+    Enable or disable frame publishing to match AppState.publish_frames.
+
+    Args:
+        state: AppState instance
+
+    Returns:
+        str or None: Why the ring could not be enabled (frames are then not
+                     published), or None on success
+    """
+    if state.publish_frames:
+        try:
+            enable_frame_ring()
+        except Exception as e:
+            return f"Frame ring unavailable: {e}"
+    else:
+        disable_frame_ring()
+    return None
+
+
+def _publish(image, region: Tuple[int, int, int, int]) -> None:
+    """Write a frame to the ring if publishing is enabled."""
+    with _frame_ring_lock:
+        if _frame_ring is not None:
+            _frame_ring.publish(image, region)
+
+
+def grab(region: Tuple[int, int, int, int], publish: bool = True):
+    """
+    Capture exactly one logical region from the screen.
+
+    Args:
+        region (tuple): Logical (x, y, width, height), width/height > 0
+        publish (bool): Also write the frame to the frame ring, if enabled;
+                        off for tiny probes such as click_guard checks
+
+    Returns:
+        PIL.Image: RGB image at the display's physical resolution
+
+    Raises:
+        Exception: Backend errors are propagated to the caller
+    """
+    image = _grab_backend(region)
+    if publish and _frame_ring is not None:
+        _publish(image, region)
+    return image
+
+
+def _grab_backend(region: Tuple[int, int, int, int]):
+    """Capture a logical region with the selected backend."""
+    x, y, width, height = region
+    backend = _select_backend()
+
+    if backend == "mss":
+        from PIL import Image
+        shot = _mss_instance().grab({"left": x, "top": y, "width": width, "height": height})
+        return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+
+    if backend == "imagegrab":
+        from PIL import ImageGrab
+        image = ImageGrab.grab(bbox=(x, y, x + width, y + height), all_screens=True)
+        return image if image.mode == "RGB" else image.convert("RGB")
+
+    import pyautogui
+    return pyautogui.screenshot(region=(x, y, width, height))
+
+
+def capture_region(region: Optional[Tuple[int, int, int, int]]):
+    """
+    Capture a screenshot of the specified screen region.
+
+    Args:
+        region (tuple): Logical (x, y, width, height) of the region to capture
+
+    Returns:
+        PIL.Image: Screenshot image of the region, or None if the region is
+                   missing or has no area
+
+    Raises:
+        Exception: Backend errors are propagated to the caller
+    """
+    if region is None:
+        return None
+
+    x, y, width, height = region
+    if width <= 0 or height <= 0:
+        return None
+
+    return grab((x, y, width, height))
@@ -10,10 +10,59 @@ This file contains the initial scaffolding for Phase 0.
 Full implementation will be completed in Phase 1 (Core GUI Framework).
 """
 
-from typing import Optional, Tuple
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
+from clock import REAL_CLOCK, Clock
 
-# TODO: Phase 7 - Add settings persistence (save/load to file)
+
+DEFAULT_SETTINGS_PATH = os.path.join(os.path.expanduser("~"), ".afk_auto_help.json")
+"""Default location of the saved settings file."""
+
+PERSISTED_FIELDS = (
+    "hunger_region",
+    "hunger_region_norm",
+    "feed_trigger_norm",
+    "chop_trigger_norm",
+    "chop_target_region_norm",
+    "hunger_threshold",
+    "hunger_thresholds",
+    "feed_mode",
+    "feed_trigger",
+    "stew_hotkey",
+    "feed_select_delay",
+    "timer_interval_minutes",
+    "feed_verify",
+    "feed_confirm_window",
+    "feed_confirm_min_rise",
+    "feed_backoff_max",
+    "chop_trigger",
+    "feed_trigger_signature",
+    "chop_trigger_signature",
+    "click_guard_enabled",
+    "chop_click_rate",
+    "chop_duration",
+    "chop_target_region",
+    "chop_target_mode",
+    "chop_plan",
+    "timing_profile",
+    "detection_workers",
+    "publish_frames",
+    "cpu_budget_percent",
+    "anchor_mode",
+    "anchor_region",
+    "anchor_template",
+    "anchor_window_title",
+    "global_hotkeys_enabled",
+    "global_hotkeys",
+    "watchdog_enabled",
+    "watchdog_sentinels",
+    "watchdog_live_region",
+    "watchdog_still_timeout",
+)
+"""AppState attributes that are saved to and loaded from the settings file."""
 
 
 class AppState:
@@ -34,6 +83,9 @@ class AppState:
         self.hunger_region: Optional[Tuple[int, int, int, int]] = None
         """Hunger bar screen region as (x, y, width, height). Set in Phase 2."""
         
+        self.hunger_region_norm: Optional[Tuple[int, float, float, float, float]] = None
+        """Resolution-independent hunger region (monitor, fx, fy, fw, fh). See display_geometry."""
+        
         self.hunger_threshold: float = 10.0
         """Hunger threshold percentage (0-100). Feed when hunger drops below this value."""
         
@@ -43,6 +95,32 @@ class AppState:
         self.feed_trigger: Optional[Tuple[int, int]] = None
         """Feed trigger coordinate as (x, y). Set in Phase 2. User should position stew and click on it."""
         
+        self.stew_hotkey: str = ""
+        """Key that selects the stew slot before each feed click (e.g. "3");
+        empty if the user keeps the stew selected."""
+        
+        self.feed_select_delay: float = 0.12
+        """Seconds between the stew hotkey and the feed click (tune per game)."""
+        
+        self.feed_trigger_norm: Optional[Tuple[int, float, float]] = None
+        """Resolution-independent feed trigger (monitor, fx, fy)."""
+        
+        self.feed_verify: bool = True
+        """Monitor mode: confirm each feed by watching the hunger bar rise."""
+        
+        self.hunger_thresholds: Optional[Dict[str, Any]] = None
+        """Calibrated bar color thresholds (see hunger_detection), or None
+        for the built-in defaults."""
+        
+        self.feed_confirm_window: float = 1.5
+        """Seconds to watch the hunger bar for a rise after a feed click."""
+        
+        self.feed_confirm_min_rise: float = 2.0
+        """Minimum hunger increase (percentage points) that confirms a feed."""
+        
+        self.feed_backoff_max: float = 60.0
+        """Longest delay in seconds between unconfirmed feed attempts."""
+        
         # Timer mode settings
         self.timer_interval_minutes: float = 5.0
         """Timer interval in minutes for timer-based feeding mode."""
@@ -51,28 +129,139 @@ class AppState:
         self.chop_trigger: Optional[Tuple[int, int]] = None
         """Chop trigger coordinate as (x, y). Set in Phase 2."""
         
+        self.chop_trigger_norm: Optional[Tuple[int, float, float]] = None
+        """Resolution-independent chop trigger (monitor, fx, fy)."""
+        
+        self.feed_trigger_signature: Optional[List[List[int]]] = None
+        """Pixels around the feed trigger at record time (see click_guard)."""
+        
+        self.chop_trigger_signature: Optional[List[List[int]]] = None
+        """Pixels around the chop trigger at record time (see click_guard)."""
+        
+        self.click_guard_enabled: bool = True
+        """Check trigger signatures before clicking; skip clicks on mismatch."""
+        
         self.chop_click_rate: float = 1.0
         """Auto-chop click rate in clicks per second."""
         
         self.chop_duration: float = 20.0
         """Auto-chop duration in seconds."""
         
+        self.chop_target_region: Optional[Tuple[int, int, int, int]] = None
+        """Region showing the chop target; auto-chop ends early once it is
+        done (see chop_targets). None chops for the full duration."""
+        
+        self.chop_target_region_norm: Optional[Tuple[int, float, float, float, float]] = None
+        """Resolution-independent chop target region (monitor, fx, fy, fw, fh)."""
+        
+        self.chop_target_mode: str = "GONE"
+        """How the target region shows completion: "GONE" or "PROGRESS"."""
+        
+        self.chop_plan: List[Dict[str, Any]] = []
+        """Chop targets worked through back to back (see chop_targets);
+        empty chops only chop_trigger."""
+        
+        self.detection_workers: int = 0
+        """Worker processes for pixel detection (see detection_pool); 0
+        runs detection on the worker threads."""
+        
+        self.publish_frames: bool = False
+        """Publish captured frames to a shared-memory ring (see frame_ring)."""
+        
+        self.cpu_budget_percent: float = 25.0
+        """CPU use (percent of one core) that background work is slowed down
+        to stay within (see cpu_governor); 0 disables the governor."""
+        
+        self.timing_profile: Optional[Dict[str, Any]] = None
+        """Humanized timing for chop clicks and timed feeds (see
+        timing_model), or None for the built-in profile."""
+        
         self.chop_running: bool = False
         """True while auto-chop worker is active."""
         
         self.chop_worker_thread: Optional[object] = None
         """Thread handle for auto-chop worker."""
         
+        # Region anchoring (see region_anchor)
+        self.anchor_mode: str = "NONE"
+        """Anchor mode: "NONE", "WINDOW" (game window bounds) or "TEMPLATE" (UI patch)."""
+        
+        self.anchor_region: Optional[Tuple[int, int, int, int]] = None
+        """Anchor bounds (x, y, width, height) that the stored coordinates are relative to."""
+        
+        self.anchor_template: Optional[str] = None
+        """Base64 grayscale pixels of the TEMPLATE anchor."""
+        
+        self.anchor_window_title: str = ""
+        """Game window title substring for the WINDOW anchor."""
+        
+        # Global hotkeys (see global_hotkeys)
+        self.global_hotkeys_enabled: bool = True
+        """Listen for system-wide stop and pause/resume hotkeys."""
+        
+        self.global_hotkeys: Optional[Dict[str, str]] = None
+        """Hotkey overrides by action ("stop", "pause"), or None for the defaults."""
+        
+        # Game watchdog (see watchdog)
+        self.watchdog_enabled: bool = True
+        """Pause all tasks while the game loses focus, is covered or freezes."""
+        
+        self.watchdog_sentinels: Tuple[Tuple[int, int, int, int], ...] = ()
+        """Small regions (x, y, width, height) that look the same whenever
+        the game is usable, e.g. a HUD icon."""
+        
+        self.watchdog_live_region: Optional[Tuple[int, int, int, int]] = None
+        """Region that is normally animated; no change means the game froze."""
+        
+        self.watchdog_still_timeout: float = 30.0
+        """Seconds without change in watchdog_live_region before pausing."""
+        
+        self.paused: bool = False
+        """True while the watchdog holds all tasks (runtime only)."""
+        
+        self.hunger_history: Optional[object] = None
+        """HungerHistory that readings and feeds are recorded to (see
+        hunger_history), or None to keep no history (runtime only)."""
+        
+        self.input: Optional[object] = None
+        """input_arbiter.SessionInput the workers click through when several
+        sessions share one arbiter (see multi_session), or None for the
+        process-wide arbiter (runtime only)."""
+        
+        self.hunger_capture: Optional[object] = None
+        """Function returning the image of a hunger region, shared between
+        sessions (see multi_session.CaptureBus), or None to capture it
+        directly (runtime only)."""
+        
         # Status
         self.status_message: str = "Ready"
         """Current status message displayed in the status bar."""
         
         # Thread control (Phase 4)
-        self.stop_all_flag: bool = False
-        """Flag to signal all worker threads to stop."""
+        self.stop_event: threading.Event = threading.Event()
+        """Set to signal all worker threads to stop; waits on it wake at once.
+        stop_all_flag reads and writes it as a bool."""
+        
+        self.user_paused: bool = False
+        """True while the user has paused all tasks (e.g. by global hotkey)."""
         
         self.worker_thread: Optional[object] = None
         """Reference to the currently running worker thread, if any."""
+        
+        self.clock: Clock = REAL_CLOCK
+        """Time source for all workers; a simulated clock in simulations."""
+    
+    @property
+    def stop_all_flag(self) -> bool:
+        """Flag to signal all worker threads to stop."""
+        return self.stop_event.is_set()
+    
+    @stop_all_flag.setter
+    def stop_all_flag(self, value: bool) -> None:
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event.clear()
     
     def __repr__(self) -> str:
         """Return a string representation of AppState for debugging."""
@@ -89,3 +278,64 @@ class AppState:
             f"status_message='{self.status_message}'"
             f")"
         )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the persisted configuration as a JSON-serializable dict.
+        
+        Runtime fields (threads, flags, status) are not included.
+        """
+        return {name: getattr(self, name) for name in PERSISTED_FIELDS}
+    
+    def apply_dict(self, data: Dict[str, Any]) -> None:
+        """
+        Update configuration from a dict produced by to_dict().
+        
+        Unknown keys are ignored. Lists (as produced by JSON) are converted
+        back to tuples for region/coordinate fields.
+        
+        Args:
+            data: Mapping of attribute name to value
+        """
+        for name in PERSISTED_FIELDS:
+            if name not in data:
+                continue
+            value = data[name]
+            if isinstance(value, list):
+                value = tuple(value)
+            setattr(self, name, value)
+
+
+def save_settings(state: AppState, path: str = DEFAULT_SETTINGS_PATH) -> None:
+    """
+    Save the configuration part of an AppState to a JSON file.
+    
+    Args:
+        state: AppState instance to save
+        path: Destination file path
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state.to_dict(), f, indent=2)
+
+
+def load_settings(path: str = DEFAULT_SETTINGS_PATH, state: Optional[AppState] = None) -> AppState:
+    """
+    Load configuration from a JSON settings file.
+    
+    Args:
+        path: Settings file path
+        state: Existing AppState to update in place, or None to create one
+        
+    Returns:
+        AppState: The updated (or newly created) state
+        
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if state is None:
+        state = AppState()
+    state.apply_dict(data)
+    return state
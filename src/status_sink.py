@@ -0,0 +1,134 @@
+"""
+AFK Auto-Help Module: Worker Status Sinks
+
+This module defines the interface worker threads use to report progress.
+Workers never talk to Tkinter directly; they call methods on a status sink,
+which may be the GUI application (AFKAutoHelpApp) or a console/log sink
+used by the headless runner.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import List, Optional, Tuple
+
+
+class StatusSink(ABC):
+    """
+    Receives status updates from background worker threads.
+
+    All methods may be called from any thread. Implementations are
+    responsible for marshalling updates onto their own thread if needed.
+    Subclasses must implement safe_status_update(); the other methods
+    default to doing nothing.
+    """
+
+    @abstractmethod
+    def safe_status_update(self, msg: str) -> None:
+        """
+        Report a human-readable status message.
+
+        Args:
+            msg: Status message to display or log
+        """
+
+    def update_hunger(self, percent: float) -> None:
+        """
+        Report the latest hunger reading.
+
+        Args:
+            percent: Hunger level as a value from 0.0 to 100.0
+        """
+
+    def on_chop_worker_finished(self) -> None:
+        """Called by the auto-chop worker when it finishes."""
+
+
+class LoggingStatusSink(StatusSink):
+    """
+    Status sink that writes all updates to a logger.
+
+    Used by the headless runner, where there is no GUI to update.
+    """
+
+    def __init__(self, state, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the logging sink.
+
+        Args:
+            state: AppState instance shared with the workers
+            logger: Logger to write to (defaults to the "afk_auto_help" logger)
+        """
+        self.state = state
+        self.logger = logger or logging.getLogger("afk_auto_help")
+        self.last_hunger: Optional[float] = None
+
+    def safe_status_update(self, msg: str) -> None:
+        """Log the status message and mirror it into AppState."""
+        self.state.status_message = msg
+        self.logger.info(msg)
+
+    def update_hunger(self, percent: float) -> None:
+        """Remember the latest hunger reading (already logged via status)."""
+        self.last_hunger = percent
+
+    def on_chop_worker_finished(self) -> None:
+        """Reset auto-chop state so the task can be started again."""
+        self.state.chop_running = False
+        self.state.chop_worker_thread = None
+        self.logger.info("Auto-chop idle")
+
+
+class RecordingStatusSink(StatusSink):
+    """
+    Status sink that keeps recent events and forwards everything to
+    another sink.
+
+    Used by the control server to answer "recent events" queries.
+    """
+
+    def __init__(self, inner: StatusSink, max_events: int = 200):
+        """
+        Initialize the recording sink.
+
+        Args:
+            inner: Sink that receives all updates
+            max_events: Number of recent events kept
+        """
+        self.inner = inner
+        self.events = deque(maxlen=max_events)
+        """(sequence number, wall-clock time, message) of recent status messages."""
+        self.seq = 0
+        self.last_hunger: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def safe_status_update(self, msg: str) -> None:
+        """Record the message and forward it."""
+        with self._lock:
+            self.seq += 1
+            self.events.append((self.seq, time.time(), msg))
+        self.inner.safe_status_update(msg)
+
+    def update_hunger(self, percent: float) -> None:
+        """Remember the reading and forward it."""
+        self.last_hunger = percent
+        self.inner.update_hunger(percent)
+
+    def on_chop_worker_finished(self) -> None:
+        """Forward to the inner sink."""
+        self.inner.on_chop_worker_finished()
+
+    def events_since(self, seq: int = 0) -> List[Tuple[int, float, str]]:
+        """
+        Return recorded events newer than a sequence number.
+
+        Args:
+            seq: Last sequence number already seen (0 for all kept events)
+
+        Returns:
+            list: (sequence number, time, message) tuples, oldest first
+        """
+        with self._lock:
+            return [event for event in self.events if event[0] > seq]
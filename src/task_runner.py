@@ -0,0 +1,169 @@
+"""
+AFK Auto-Help Module: Task Runner
+
+This module starts and stops the automation workers without any GUI
+dependency. It is used by the headless runner and mirrors the validation
+performed by the Tkinter application before a worker is started.
+"""
+
+import threading
+from typing import Dict, Optional
+
+import worker_threads
+
+
+TASK_TIMER = "timer"
+TASK_MONITOR = "monitor"
+TASK_CHOP = "chop"
+TASK_FEED = "feed"
+"""Runs the timer or monitor task depending on AppState.feed_mode."""
+
+TASK_NAMES = (TASK_FEED, TASK_TIMER, TASK_MONITOR, TASK_CHOP)
+
+
+def resolve_task(state, task: str) -> str:
+    """
+    Resolve the generic "feed" task to the concrete feed task.
+
+    Args:
+        state: AppState instance with configuration
+        task: Task name from TASK_NAMES
+
+    Returns:
+        str: TASK_TIMER, TASK_MONITOR or TASK_CHOP
+    """
+    if task == TASK_FEED:
+        return TASK_MONITOR if state.feed_mode == "MONITOR_BAR" else TASK_TIMER
+    return task
+
+
+def validate_task(state, task: str) -> Optional[str]:
+    """
+    Check that the configuration required by a task is present.
+
+    Args:
+        state: AppState instance with configuration
+        task: Task name from TASK_NAMES
+
+    Returns:
+        str: Error message if the task cannot run, or None if it can
+    """
+    task = resolve_task(state, task)
+    if task not in (TASK_TIMER, TASK_MONITOR, TASK_CHOP):
+        return f"Unknown task: {task}"
+
+    if task == TASK_CHOP:
+        if state.chop_trigger is None and not state.chop_plan:
+            return "Chop trigger coordinate or chop plan is required"
+        if state.chop_click_rate <= 0:
+            return "Chop click rate must be greater than 0"
+        if state.chop_duration <= 0:
+            return "Chop duration must be greater than 0"
+        return None
+
+    if state.feed_trigger is None:
+        return "Feed trigger coordinate is required"
+    if task == TASK_TIMER and state.timer_interval_minutes <= 0:
+        return "Timer interval must be greater than 0"
+    if task == TASK_MONITOR:
+        if state.hunger_region is None:
+            return "Monitor mode requires a hunger region"
+        if state.hunger_threshold < 0 or state.hunger_threshold > 100:
+            return "Hunger threshold must be between 0 and 100"
+    return None
+
+
+class TaskRunner:
+    """
+    Starts, tracks and stops worker threads for a single AppState.
+
+    Feed tasks (timer/monitor) share AppState.worker_thread, exactly as in
+    the GUI, so only one of them can run at a time. Auto-chop runs on its
+    own thread alongside.
+    """
+
+    def __init__(self, state, sink):
+        """
+        Initialize the task runner.
+
+        Args:
+            state: AppState instance with configuration
+            sink: StatusSink receiving worker status updates
+        """
+        self.state = state
+        self.sink = sink
+
+    def start(self, task: str) -> Optional[str]:
+        """
+        Start a task on a background thread.
+
+        Args:
+            task: Task name from TASK_NAMES
+
+        Returns:
+            str: Error message if the task was not started, or None on success
+        """
+        task = resolve_task(self.state, task)
+        error = validate_task(self.state, task)
+        if error is not None:
+            return error
+
+        if task == TASK_CHOP:
+            if self.state.chop_running:
+                return "Auto-chop is already running"
+            self.state.chop_running = True
+            self.state.stop_all_flag = False
+            thread = threading.Thread(
+                target=worker_threads.auto_chop_worker,
+                args=(self.sink, self.state),
+                daemon=True
+            )
+            self.state.chop_worker_thread = thread
+            thread.start()
+            return None
+
+        if self.state.worker_thread is not None:
+            return "A feed worker is already running"
+
+        self.state.feed_mode = "MONITOR_BAR" if task == TASK_MONITOR else "TIMER"
+        self.state.stop_all_flag = False
+        target = (worker_threads.hunger_monitor_worker if task == TASK_MONITOR
+                  else worker_threads.timer_feed_worker)
+        thread = threading.Thread(target=target, args=(self.sink, self.state), daemon=True)
+        self.state.worker_thread = thread
+        thread.start()
+        return None
+
+    def running(self) -> Dict[str, bool]:
+        """
+        Report which tasks are currently running.
+
+        Returns:
+            dict: Mapping of "feed" and "chop" to running flags
+        """
+        return {
+            TASK_FEED: self.state.worker_thread is not None,
+            TASK_CHOP: self.state.chop_worker_thread is not None,
+        }
+
+    def is_idle(self) -> bool:
+        """Return True when no worker thread is running."""
+        return not any(self.running().values())
+
+    def stop_all(self, timeout: float = 2.0) -> None:
+        """
+        Signal all workers to stop and wait for them to exit.
+
+        Args:
+            timeout: Seconds to wait for each worker thread
+        """
+        self.state.stop_all_flag = True
+        self.state.chop_running = False
+
+        for thread in (self.state.worker_thread, self.state.chop_worker_thread):
+            if thread is not None:
+                thread.join(timeout=timeout)
+
+        self.state.worker_thread = None
+        self.state.chop_worker_thread = None
+        self.state.stop_all_flag = False
@@ -0,0 +1,192 @@
+"""
+AFK Auto-Help Module: Humanized Timing Model
+
+Produces irregular but bounded intervals between automated actions, so
+clicks and feeds do not fire on a perfectly regular beat. A timing profile
+is a plain dict (stored per settings profile, see default_profile()):
+
+- distribution: how each interval is drawn around the mean
+    FIXED     - no jitter (the old regular behaviour)
+    UNIFORM   - uniform within +/- jitter of the mean
+    GAUSSIAN  - normal with standard deviation jitter * mean
+    LOGNORMAL - right-skewed, like human reaction times
+- jitter: relative spread of the distribution
+- micro-pauses: occasional extra pause of micro_pause_min..micro_pause_max s
+- bursts: occasional runs of up to burst_length_max faster intervals
+- min_factor / max_factor: every drawn interval, including any burst
+  speedup, is clamped to this range of the mean, so no profile can
+  produce absurdly short or long gaps. A micro-pause is added after the
+  clamp and is bounded by micro_pause_max instead, so it still shows at
+  high click rates where it is many times the mean
+
+Intervals are generated in batches of BATCH_SIZE into an array of absolute
+deadline offsets. The worker's hot loop only indexes that array; random
+numbers are drawn and memory allocated once per batch, not once per click.
+"""
+
+import math
+import random
+from array import array
+from typing import Any, Dict, Optional
+
+
+DIST_FIXED = "FIXED"
+DIST_UNIFORM = "UNIFORM"
+DIST_GAUSSIAN = "GAUSSIAN"
+DIST_LOGNORMAL = "LOGNORMAL"
+DISTRIBUTIONS = (DIST_FIXED, DIST_UNIFORM, DIST_GAUSSIAN, DIST_LOGNORMAL)
+
+BATCH_SIZE = 256
+"""Intervals generated per batch."""
+
+
+def default_profile() -> Dict[str, Any]:
+    """
+    Return the built-in humanized timing profile.
+
+    Returns:
+        dict: Timing profile usable with IntervalSchedule
+    """
+    return {
+        "distribution": DIST_LOGNORMAL,
+        "jitter": 0.15,
+        "micro_pause_chance": 0.02,
+        "micro_pause_min": 0.3,
+        "micro_pause_max": 1.2,
+        "burst_chance": 0.03,
+        "burst_length_max": 4,
+        "burst_speedup": 0.7,
+        "min_factor": 0.5,
+        "max_factor": 3.0,
+    }
+
+
+def fixed_profile() -> Dict[str, Any]:
+    """Return a profile that reproduces perfectly regular intervals."""
+    profile = default_profile()
+    profile.update(distribution=DIST_FIXED, micro_pause_chance=0.0, burst_chance=0.0)
+    return profile
+
+
+class IntervalSchedule:
+    """
+    Hands out deadlines separated by humanized intervals.
+
+    Usage in a worker loop:
+
+        schedule = IntervalSchedule(1.0 / rate, state.timing_profile)
+        schedule.start(scheduler.now_ns())
+        while ...:
+            if not scheduler.wait_until(schedule.next_deadline_ns()):
+                break
+            click()
+    """
+
+    def __init__(self, mean_interval: float, profile: Optional[Dict[str, Any]] = None,
+                 patterns: bool = True, rng: Optional[random.Random] = None,
+                 batch_size: int = BATCH_SIZE):
+        """
+        Initialize the schedule.
+
+        Args:
+            mean_interval: Mean seconds between actions (before patterns)
+            profile: Timing profile dict, or None for default_profile()
+            patterns: Apply micro-pauses and bursts; disable for long
+                      intervals (e.g. timed feeding) where only jitter fits
+            rng: Random generator (seed one for reproducible runs)
+            batch_size: Intervals generated per batch
+        """
+        if mean_interval <= 0:
+            raise ValueError("mean interval must be positive")
+        if batch_size <= 0:
+            raise ValueError("batch size must be positive")
+        base = default_profile()
+        base.update(profile or {})
+        if base["distribution"] not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown timing distribution: {base['distribution']}")
+        self.mean_interval = mean_interval
+        self.profile = base
+        self.patterns = patterns
+        self.rng = rng or random.Random()
+        self.batch_size = batch_size
+        self._offsets = array("q", bytes(8 * batch_size))
+        self._index = batch_size
+        self._base_ns = 0
+        self._last_ns = 0
+        self._burst_left = 0
+
+    def start(self, now_ns: int) -> None:
+        """
+        Set the time the first interval is measured from.
+
+        Args:
+            now_ns: Current time from time.perf_counter_ns()
+        """
+        self._base_ns = now_ns
+        self._last_ns = now_ns
+        self._burst_left = 0
+        self._refill()
+
+    def _draw(self) -> float:
+        """Draw one raw interval in seconds from the configured distribution."""
+        p = self.profile
+        mean = self.mean_interval
+        jitter = p["jitter"]
+        dist = p["distribution"]
+        if dist == DIST_UNIFORM:
+            return self.rng.uniform(mean * (1.0 - jitter), mean * (1.0 + jitter))
+        if dist == DIST_GAUSSIAN:
+            return self.rng.gauss(mean, jitter * mean)
+        if dist == DIST_LOGNORMAL and jitter > 0:
+            # Parameters chosen so the distribution's mean is `mean`
+            return self.rng.lognormvariate(math.log(mean) - jitter * jitter / 2.0, jitter)
+        return mean
+
+    def _refill(self) -> None:
+        """Generate the next batch of cumulative deadline offsets."""
+        p = self.profile
+        rng = self.rng
+        low = self.mean_interval * p["min_factor"]
+        high = self.mean_interval * p["max_factor"]
+        pause_chance = p["micro_pause_chance"] if self.patterns else 0.0
+        burst_chance = p["burst_chance"] if self.patterns else 0.0
+
+        offsets = self._offsets
+        total_ns = 0
+        for i in range(self.batch_size):
+            interval = self._draw()
+            if self._burst_left > 0:
+                self._burst_left -= 1
+                interval *= p["burst_speedup"]
+            elif burst_chance and rng.random() < burst_chance:
+                self._burst_left = rng.randint(1, p["burst_length_max"])
+            interval = min(high, max(low, interval))
+            if pause_chance and rng.random() < pause_chance:
+                interval += rng.uniform(p["micro_pause_min"], p["micro_pause_max"])
+            total_ns += int(interval * 1e9)
+            offsets[i] = total_ns
+        self._index = 0
+
+    def next_deadline_ns(self) -> int:
+        """
+        Return the next absolute deadline on the perf_counter_ns timeline.
+
+        Deadlines follow each other, not the time they were reached, so a
+        late action does not shift the rest of the schedule.
+        """
+        i = self._index
+        if i == self.batch_size:
+            self._base_ns += self._offsets[i - 1]
+            self._refill()
+            i = 0
+        self._index = i + 1
+        self._last_ns = self._base_ns + self._offsets[i]
+        return self._last_ns
+
+    def next_interval(self) -> float:
+        """
+        Return the next interval in seconds (for sleep-based loops that do
+        not track absolute deadlines).
+        """
+        previous = self._last_ns
+        return (self.next_deadline_ns() - previous) / 1e9
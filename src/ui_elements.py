@@ -88,3 +88,91 @@ def format_region_display(x: Optional[int], y: Optional[int],
     if all(v is not None for v in [x, y, w, h]):
         return f"(x={x}, y={y}, w={w}, h={h})"
     return "Not Set"
+
+
+CHART_RANGES = {
+    "Last hour": (3600.0, "raw"),
+    "Last day": (24 * 3600.0, "minute"),
+    "Last month": (30 * 24 * 3600.0, "hour"),
+}
+"""Hunger chart time span and history resolution per range choice."""
+
+
+class HungerChart:
+    """
+    Small line chart of a HungerHistory on a Tkinter canvas.
+    
+    The line, threshold and feed marks are canvas items created once and
+    moved with coords(), and refresh() does nothing unless the history or
+    the view changed, so it is cheap to call from a periodic after().
+    """
+    
+    def __init__(self, parent, width: int = 360, height: int = 90):
+        """
+        Create the chart canvas (not packed).
+        
+        Args:
+            parent: Parent Tkinter widget
+            width: Canvas width in pixels
+            height: Canvas height in pixels
+        """
+        self.canvas = tk.Canvas(parent, width=width, height=height,
+                                background="white", highlightthickness=1)
+        self.width = width
+        self.height = height
+        self.range_name = "Last hour"
+        self._line = self.canvas.create_line(0, 0, 0, 0, fill="#2a7d2a", width=1.5)
+        self._threshold = self.canvas.create_line(0, 0, width, 0, fill="#c44", dash=(3, 3))
+        self._feeds = []
+        self._drawn = None
+    
+    def set_range(self, range_name: str) -> None:
+        """Select one of CHART_RANGES; takes effect on the next refresh."""
+        self.range_name = range_name
+    
+    def _y(self, percent: float) -> float:
+        """Canvas y coordinate of a hunger percentage."""
+        return (self.height - 2) * (1.0 - min(max(percent, 0.0), 100.0) / 100.0) + 1
+    
+    def refresh(self, history, threshold: float, now: float) -> None:
+        """
+        Redraw the chart if anything changed since the last refresh.
+        
+        Args:
+            history: HungerHistory to plot
+            threshold: Feed threshold percentage, drawn as a dashed line
+            now: Current time (right edge of the chart)
+        """
+        span, resolution = CHART_RANGES[self.range_name]
+        # Redraw at most once per pixel column of elapsed time
+        column = int(now / (span / self.width))
+        key = (history.version, threshold, self.range_name, column)
+        if key == self._drawn:
+            return
+        self._drawn = key
+        
+        start = now - span
+        scale = self.width / span
+        coords = []
+        last_x = None
+        for t, percent in history.series(resolution, start):
+            x = round((t - start) * scale)
+            if x == last_x:
+                coords[-1] = self._y(percent)  # one point per pixel column
+                continue
+            coords.extend((x, self._y(percent)))
+            last_x = x
+        if len(coords) < 4:
+            coords = [0, -1, 0, -1]  # nothing to draw yet
+        self.canvas.coords(self._line, *coords)
+        y = self._y(threshold)
+        self.canvas.coords(self._threshold, 0, y, self.width, y)
+        
+        feeds = [round((t - start) * scale) for t in history.feed_times(start)]
+        while len(self._feeds) < len(feeds):
+            self._feeds.append(self.canvas.create_line(0, 0, 0, 0, fill="#36c"))
+        for i, item in enumerate(self._feeds):
+            if i < len(feeds):
+                self.canvas.coords(item, feeds[i], self.height - 6, feeds[i], self.height)
+            else:
+                self.canvas.coords(item, 0, -1, 0, -1)
@@ -0,0 +1,245 @@
+"""
+AFK Auto-Help Module: Game Watchdog
+
+Pauses all automation while the game is not in a state where input makes
+sense, and resumes it when the game is back. Three cheap checks run every
+few seconds on a watchdog thread:
+
+- focus:     the focused window's title no longer contains
+             AppState.anchor_window_title (when one is configured; not
+             with multi_session, whose arbiter moves focus between the
+             sessions' windows itself)
+- signature: a sentinel region (the TEMPLATE anchor and any regions in
+             AppState.watchdog_sentinels) no longer looks like it did when
+             the tasks started, e.g. a menu, dialog or another app covers it
+- frozen:    AppState.watchdog_live_region, a part of the game that is
+             normally animated, has not changed for watchdog_still_timeout
+             seconds
+
+Sentinels are tiny captures reduced to a coarse grayscale hash, so a check
+costs a few small grabs. While paused (AppState.paused) workers neither
+capture nor click, and the watchdog re-checks with exponential backoff
+instead of polling at full rate.
+
+Workers call ensure_running() when they start; the watchdog thread exits
+by itself once no worker is running.
+"""
+
+import threading
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import cpu_governor
+import screen_capture
+
+
+WATCHDOG_INTERVAL = 2.0
+"""Seconds between checks while the game looks fine."""
+WATCHDOG_BACKOFF_MAX = 30.0
+"""Longest delay between checks while paused; doubles from WATCHDOG_INTERVAL."""
+SENTINEL_HASH_SIZE = 8
+"""Sentinels are reduced to at most this many pixels per side before hashing."""
+SENTINEL_QUANTIZE_SHIFT = 4
+"""Gray levels are divided by 2**shift before hashing to ignore noise."""
+
+REASON_FOCUS = "game window lost focus"
+REASON_SIGNATURE = "game screen not visible"
+REASON_FROZEN = "game appears frozen"
+
+
+def region_hash(region: Tuple[int, int, int, int]) -> int:
+    """
+    Capture a small region and return a noise-tolerant hash of it.
+
+    Args:
+        region: Logical (x, y, width, height)
+
+    Returns:
+        int: CRC32 of the downscaled, quantized grayscale pixels
+    """
+    image = screen_capture.grab(region, publish=False).convert("L")
+    width, height = image.size
+    if width > SENTINEL_HASH_SIZE or height > SENTINEL_HASH_SIZE:
+        image = image.resize((min(width, SENTINEL_HASH_SIZE), min(height, SENTINEL_HASH_SIZE)))
+    shift = SENTINEL_QUANTIZE_SHIFT
+    return zlib.crc32(bytes(value >> shift for value in image.tobytes()))
+
+
+def focused_window_title() -> Optional[str]:
+    """
+    Return the title of the focused window, or None if it cannot be read.
+
+    Uses pygetwindow on Windows and AppKit on macOS.
+    """
+    try:
+        import pygetwindow
+        window = pygetwindow.getActiveWindow()
+        if window is not None:
+            return window.title
+    except Exception:
+        pass
+    try:
+        from AppKit import NSWorkspace
+        app = NSWorkspace.sharedWorkspace().frontmostApplication()
+        return app.localizedName() if app is not None else None
+    except Exception:
+        return None
+
+
+class Watchdog:
+    """Checks the game's state and pauses or resumes the workers."""
+
+    def __init__(self, state, sink):
+        """
+        Initialize the watchdog.
+
+        Args:
+            state: AppState instance shared with the workers
+            sink: StatusSink for pause/resume messages
+        """
+        self.state = state
+        self.sink = sink
+        self.clock = state.clock
+        self.sentinels: List[Tuple[Optional[int], int]] = []
+        """(index into watchdog_sentinels or None for the anchor, hash) pairs;
+        regions are looked up at each check so anchor moves are followed."""
+        self.live_hash: Optional[int] = None
+        self.live_changed_at = 0.0
+        self.delay = WATCHDOG_INTERVAL
+        self.checks = 0
+        """Number of checks performed."""
+
+    def sentinel_regions(self) -> List[Optional[int]]:
+        """
+        Return the sentinels whose appearance must not change.
+
+        Sentinels are indices into AppState.watchdog_sentinels; None stands
+        for the TEMPLATE anchor, which is hashed wherever the anchor
+        tracker last found it.
+        """
+        state = self.state
+        sentinels: List[Optional[int]] = list(range(len(state.watchdog_sentinels or ())))
+        if state.anchor_mode == "TEMPLATE" and state.anchor_region is not None:
+            sentinels.append(None)
+        return sentinels
+
+    def has_checks(self) -> bool:
+        """Return True if any check is configured."""
+        state = self.state
+        return bool(state.anchor_window_title or state.watchdog_live_region or self.sentinel_regions())
+
+    def _sentinel_hash(self, sentinel: Optional[int]) -> int:
+        """Hash a sentinel at its current position (None: the anchor region)."""
+        state = self.state
+        region = state.anchor_region if sentinel is None else state.watchdog_sentinels[sentinel]
+        return region_hash(tuple(region))
+
+    def record_baseline(self) -> None:
+        """Hash the sentinels as they look now (the game is assumed visible)."""
+        self.sentinels = []
+        for sentinel in self.sentinel_regions():
+            try:
+                self.sentinels.append((sentinel, self._sentinel_hash(sentinel)))
+            except Exception:
+                pass
+        self.live_hash = None
+        self.live_changed_at = self.clock.now()
+
+    def check(self) -> Optional[str]:
+        """
+        Run all checks once.
+
+        Returns:
+            str: Reason to pause (REASON_*), or None if the game looks fine
+        """
+        state = self.state
+        self.checks += 1
+
+        title = state.anchor_window_title
+        if title and state.input is None:
+            focused = focused_window_title()
+            if focused is not None and title.lower() not in focused.lower():
+                return REASON_FOCUS
+
+        try:
+            for sentinel, expected in self.sentinels:
+                if self._sentinel_hash(sentinel) != expected:
+                    return REASON_SIGNATURE
+
+            if state.watchdog_live_region:
+                now = self.clock.now()
+                value = region_hash(tuple(state.watchdog_live_region))
+                if value != self.live_hash:
+                    self.live_hash = value
+                    self.live_changed_at = now
+                elif now - self.live_changed_at >= state.watchdog_still_timeout:
+                    return REASON_FROZEN
+        except Exception:
+            return REASON_SIGNATURE
+        return None
+
+    def _workers_running(self) -> bool:
+        """Return True while any worker is active."""
+        state = self.state
+        return state.worker_thread is not None or state.chop_running
+
+    def run(self) -> None:
+        """Watchdog loop: check, pause/resume, back off while paused."""
+        state = self.state
+        meter = cpu_governor.governor_for(state).meter("watchdog")
+        self.record_baseline()
+        try:
+            while not state.stop_all_flag and self._workers_running():
+                reason = self.check()
+                meter.tick()
+                if reason is not None:
+                    if not state.paused:
+                        state.paused = True
+                        self.sink.safe_status_update(f"Paused: {reason}")
+                    else:
+                        self.delay = min(self.delay * 2, WATCHDOG_BACKOFF_MAX)
+                elif state.paused:
+                    state.paused = False
+                    self.delay = WATCHDOG_INTERVAL
+                    self.live_changed_at = self.clock.now()
+                    self.sink.safe_status_update("Game is back - resuming")
+
+                # Sleep in short steps so stopping is not delayed
+                end = self.clock.now() + meter.governor.interval(self.delay)
+                while not state.stop_all_flag and self._workers_running():
+                    remaining = end - self.clock.now()
+                    if remaining <= 0:
+                        break
+                    self.clock.sleep(min(0.25, remaining))
+        finally:
+            state.paused = False
+
+
+_watchdogs: Dict[int, threading.Thread] = {}
+_watchdogs_lock = threading.Lock()
+
+
+def ensure_running(state, sink) -> None:
+    """
+    Start a watchdog for an AppState unless one is already running.
+
+    Does nothing when AppState.watchdog_enabled is False or nothing is
+    configured to check.
+
+    Args:
+        state: AppState instance
+        sink: StatusSink for pause/resume messages
+    """
+    if not state.watchdog_enabled:
+        return
+    key = id(state)
+    with _watchdogs_lock:
+        thread = _watchdogs.get(key)
+        if thread is not None and thread.is_alive():
+            return
+        dog = Watchdog(state, sink)
+        if not dog.has_checks():
+            return
+        thread = threading.Thread(target=dog.run, name="watchdog", daemon=True)
+        _watchdogs[key] = thread
+        thread.start()
@@ -14,24 +14,141 @@ and Phase 5 (Auto-Chop Tool).
 """
 
 import threading
-import time
-import pyautogui
 from typing import Optional
 
+import chop_targets
+import click_guard
+import cpu_governor
+import detection_pool
 import hunger_detection
+import input_arbiter
+import region_anchor
+import timing_model
+import watchdog
+from scheduler import DeadlineScheduler
 
 # TODO: Phase 5 - Implement Auto-Chop worker thread
 
+FEED_SETTLE_DELAY = 0.3
+"""Seconds to wait after a confirmed feed before checking hunger again."""
+FEED_BACKOFF_BASE = 2.0
+"""Delay in seconds after the first unconfirmed feed; doubles each time."""
+INPUT_TIMEOUT = 2.0
+"""Longest wait in seconds for the input arbiter to execute a click."""
+PAUSE_POLL_INTERVAL = 0.02
+"""Seconds between resume checks while paused (stopping wakes at once)."""
+GUARD_REPORT_EVERY = 50
+"""Report skipped chop clicks on the first and then every Nth mismatch."""
+MONITOR_POLL_INTERVAL = 1.5
+"""Seconds between hunger readings while above the threshold (before the
+CPU governor's slowdown)."""
 
-def perform_feed(state):
+
+def _sleep_unless_stopped(state, seconds: float, step: float = 0.1) -> bool:
+    """
+    Sleep in short steps, returning early if the stop flag is set.
+    
+    Returns:
+        bool: True if the full time elapsed, False if stopped
+    """
+    clock = state.clock
+    end = clock.now() + seconds
+    while not state.stop_all_flag:
+        remaining = end - clock.now()
+        if remaining <= 0:
+            return True
+        clock.wait(state.stop_event, min(step, remaining))
+    return False
+
+
+def _is_paused(state) -> bool:
+    """Return True while the watchdog or the user has paused all tasks."""
+    return state.paused or state.user_paused
+
+
+def _wait_while_paused(state) -> bool:
+    """
+    Block while the watchdog or the user has paused all tasks.
+    
+    Returns:
+        bool: True if the worker was paused (callers should re-read anything
+              time-dependent), False if it was not
+    """
+    if not _is_paused(state):
+        return False
+    while _is_paused(state) and not state.clock.wait(state.stop_event, PAUSE_POLL_INTERVAL):
+        pass
+    return True
+
+
+def _hunger_sample_rate(state, governor) -> Optional[int]:
+    """
+    Return the hunger bar sampling step for the governor's slowdown.
+    
+    Returns:
+        int: Sparser sampling step, or None to use the thresholds' own
+    """
+    if governor.slowdown <= 1.0:
+        return None
+    thresholds = state.hunger_thresholds or hunger_detection.default_thresholds()
+    return governor.sample_rate(thresholds.get("sample_rate", hunger_detection.PIXEL_SAMPLE_RATE))
+
+
+def _sleep_following_anchor(sink, state, anchor, seconds: float) -> bool:
+    """
+    Sleep like _sleep_unless_stopped(), re-anchoring the feed trigger
+    between naps so a window moved during a long wait is followed.
+    
+    Returns:
+        bool: True if the full time elapsed, False if stopped
+    """
+    end = state.clock.now() + seconds
+    while True:
+        remaining = end - state.clock.now()
+        if remaining <= 0:
+            return True
+        if not _sleep_unless_stopped(state, min(remaining, anchor.interval), step=1.0):
+            return False
+        if anchor.maybe_update():
+            sink.safe_status_update(f"Game moved - feed trigger re-anchored to {state.feed_trigger}")
+
+
+def _report(sink, message: str) -> None:
+    """Send a message to the worker's status sink, or print it without one."""
+    if sink is not None:
+        sink.safe_status_update(message)
+    else:
+        print(message)
+
+
+def _wait_for_input(arbiter, request, timeout: float) -> bool:
+    """
+    Wait for an input request; on timeout withdraw it so it cannot run
+    after the caller has given up on it.
+    
+    Returns:
+        bool: True if the request ran successfully
+    """
+    if request.wait(timeout):
+        return True
+    if arbiter.cancel(request):
+        return False
+    # Too late to withdraw: it is running now, so report how it went
+    return request.wait(timeout)
+
+
+def perform_feed(state, sink=None):
     """
     Perform the feed action: click the feed trigger point.
     
-    User should have already selected the stew item and positioned it
-    so the trigger point is clickable. This function only clicks.
+    Without a stew hotkey, the user should have already selected the stew
+    item and positioned it so the trigger point is clickable; this
+    function only clicks. With state.stew_hotkey set, the stew is selected
+    first (see _hotkey_feed).
     
     Args:
         state: AppState instance with feed configuration
+        sink: StatusSink told why a feed was skipped (printed if None)
         
     Returns:
         bool: True if feed was successful, False otherwise
@@ -41,18 +158,139 @@ def perform_feed(state):
         if state.feed_trigger is None:
             return False
         
-        # Click at the feed trigger point (user should have stew selected already)
-        x, y = state.feed_trigger
-        pyautogui.click(x, y)
+        if state.stew_hotkey:
+            return _hotkey_feed(state, sink)
         
-        return True
+        # Make sure the trigger still shows what was recorded there; a
+        # menu or dialog over it may close by itself, so retry briefly
+        if state.click_guard_enabled:
+            for attempt in range(click_guard.GUARD_RETRIES + 1):
+                if click_guard.matches(state.feed_trigger, state.feed_trigger_signature):
+                    break
+                if attempt == click_guard.GUARD_RETRIES:
+                    _report(sink, "Feed skipped: feed trigger does not look as recorded")
+                    return False
+                state.clock.sleep(click_guard.GUARD_RETRY_DELAY)
+        
+        # Click at the feed trigger point (user should have stew selected
+        # already); feeding preempts any queued chop clicks
+        x, y = state.feed_trigger
+        arbiter = input_arbiter.arbiter_for(state)
+        request = arbiter.click(
+            x, y, source="feed", priority=input_arbiter.PRIORITY_FEED, stop_event=state.stop_event
+        )
+        return _wait_for_input(arbiter, request, INPUT_TIMEOUT)
     except Exception as e:
         # Log error but don't crash
-        print(f"Error in perform_feed: {e}")
+        _report(sink, f"Error in perform_feed: {e}")
         return False
 
 
-def timer_feed_worker(app, state):
+def _hotkey_feed(state, sink=None) -> bool:
+    """
+    Select the stew with its hotkey and click the feed trigger as one
+    input transaction (nothing else can click in between).
+    
+    The transaction presses state.stew_hotkey, waits state.feed_select_delay
+    for the game to show the item, checks the feed trigger signature
+    (recorded with the stew in hand) and clicks. If the check fails the
+    transaction is retried; pressing the hotkey again also covers games
+    where it toggles an already selected item away. A transaction that has
+    not run within the timeout is withdrawn instead, so the hotkey is never
+    pressed twice for one feed.
+    
+    Args:
+        state: AppState instance with feed configuration
+        sink: StatusSink told if the stew never showed up (printed if None)
+        
+    Returns:
+        bool: True if the click was made
+    """
+    Step = input_arbiter.Step
+    x, y = state.feed_trigger
+    steps = [Step(input_arbiter.ACTION_PRESS, key=state.stew_hotkey, delay=state.feed_select_delay)]
+    if state.click_guard_enabled and state.feed_trigger_signature:
+        steps.append(Step(
+            input_arbiter.ACTION_CHECK,
+            check=lambda: click_guard.matches(state.feed_trigger, state.feed_trigger_signature)
+        ))
+    steps.append(Step(input_arbiter.ACTION_CLICK, x, y))
+    
+    arbiter = input_arbiter.arbiter_for(state)
+    timeout = INPUT_TIMEOUT + state.feed_select_delay
+    for attempt in range(click_guard.GUARD_RETRIES + 1):
+        request = arbiter.transaction(steps, source="feed", priority=input_arbiter.PRIORITY_FEED,
+                                      stop_event=state.stop_event)
+        if request.wait(timeout):
+            return True
+        if not request.done.is_set():
+            if arbiter.cancel(request):
+                _report(sink, "Feed skipped: input was not executed in time")
+                return False
+            # Already running: let it finish instead of queueing another press
+            if request.wait(timeout):
+                return True
+            if not request.done.is_set():
+                _report(sink, "Feed skipped: input was not executed in time")
+                return False
+        # Executed but rejected by the check (or dropped by a stop)
+        if state.stop_all_flag:
+            return False
+        if attempt < click_guard.GUARD_RETRIES:
+            state.clock.sleep(click_guard.GUARD_RETRY_DELAY)
+    _report(sink, "Feed skipped: stew not in hand after pressing the hotkey")
+    return False
+
+
+def _autosave_history(sink, state) -> None:
+    """Save the hunger history on a background thread when an autosave is due."""
+    history = state.hunger_history
+    if history is None or not history.save_due():
+        return
+    
+    def _save():
+        try:
+            history.save()
+        except OSError as e:
+            sink.safe_status_update(f"Could not save hunger history: {e}")
+    
+    threading.Thread(target=_save, name="history-save", daemon=True).start()
+
+
+def perform_verified_feed(state, baseline: float, sink=None) -> Optional[float]:
+    """
+    Perform the feed action and confirm it through the hunger bar.
+    
+    Clicks the feed trigger, then watches the hunger region in a short
+    high-rate capture burst for a rise of at least
+    state.feed_confirm_min_rise percentage points.
+    
+    Args:
+        state: AppState instance with feed configuration
+        baseline: Hunger fill (0.0-1.0) read just before feeding
+        sink: StatusSink told why a feed was skipped (printed if None)
+        
+    Returns:
+        float: Confirmed hunger fill (0.0-1.0) after eating, or None if the
+               click failed or no rise was seen
+    """
+    if not perform_feed(state, sink):
+        return None
+    return hunger_detection.watch_for_rise(
+        state.hunger_region,
+        baseline,
+        state.feed_confirm_min_rise / 100.0,
+        state.feed_confirm_window,
+        should_stop=lambda: state.stop_all_flag,
+        thresholds=state.hunger_thresholds,
+        pool=detection_pool.pool_for(state),
+        clock=state.clock,
+        sample_rate=_hunger_sample_rate(state, cpu_governor.governor_for(state)),
+        capture=state.hunger_capture
+    )
+
+
+def timer_feed_worker(sink, state):
     """
     Timer-based feeding worker thread.
     
@@ -60,44 +298,54 @@ def timer_feed_worker(app, state):
     Runs until state.stop_all_flag is True.
     
     Args:
-        app: AFKAutoHelpApp instance for safe UI updates
+        sink: StatusSink receiving status updates (GUI app or headless logger)
         state: AppState instance with configuration
     """
-    # Convert interval from minutes to seconds
+    # Convert interval from minutes to seconds; each wait is jittered
+    # around it (no bursts or micro-pauses at this timescale)
     interval_seconds = state.timer_interval_minutes * 60
+    schedule = timing_model.IntervalSchedule(
+        interval_seconds, state.timing_profile, patterns=False, batch_size=16
+    )
+    schedule.start(state.clock.now_ns())
+    watchdog.ensure_running(state, sink)
+    
+    # Follow the game window if it moves (no-op without an anchor)
+    anchor = region_anchor.tracker_for(state, pool=detection_pool.pool_for(state))
     
-    app.safe_status_update(f"Timer mode: waiting {state.timer_interval_minutes} minutes")
+    sink.safe_status_update(f"Timer mode: waiting {state.timer_interval_minutes} minutes")
     
     while not state.stop_all_flag:
         # Sleep for the interval, but check stop flag periodically
-        sleep_chunks = int(interval_seconds / 1.0)  # Check every second
-        for _ in range(sleep_chunks):
-            if state.stop_all_flag:
-                break
-            time.sleep(1.0)
+        if not _sleep_following_anchor(sink, state, anchor, schedule.next_interval()):
+            break
         
-        # Check stop flag before feeding
+        # Feed as soon as the game is back rather than skipping the meal
+        _wait_while_paused(state)
         if state.stop_all_flag:
             break
         
         # Perform feed action
-        app.safe_status_update("Performing feed action...")
-        success = perform_feed(state)
+        sink.safe_status_update("Performing feed action...")
+        success = perform_feed(state, sink)
         
         if success:
-            app.safe_status_update(f"Feed complete. Next feed in {state.timer_interval_minutes} minutes")
+            sink.safe_status_update(f"Feed complete. Next feed in {state.timer_interval_minutes} minutes")
+            if state.hunger_history is not None:
+                state.hunger_history.record_feed()
+                _autosave_history(sink, state)
         else:
-            app.safe_status_update("Feed failed - check settings")
+            sink.safe_status_update("Feed failed - check settings")
         
         # Brief delay before next cycle
-        time.sleep(0.5)
+        state.clock.sleep(0.5)
     
     # Worker stopped
-    app.safe_status_update("Timer worker stopped")
+    sink.safe_status_update("Timer worker stopped")
     state.worker_thread = None
 
 
-def hunger_monitor_worker(app, state):
+def hunger_monitor_worker(sink, state):
     """
     Hunger monitoring worker thread.
     
@@ -105,59 +353,118 @@ def hunger_monitor_worker(app, state):
     Runs until state.stop_all_flag is True.
     
     Args:
-        app: AFKAutoHelpApp instance for safe UI updates
+        sink: StatusSink receiving status updates (GUI app or headless logger)
         state: AppState instance with configuration
     """
     # Validate hunger region is set
     if state.hunger_region is None:
-        app.safe_status_update("Error: No hunger region set for monitoring")
+        sink.safe_status_update("Error: No hunger region set for monitoring")
         state.worker_thread = None
         return
     
-    app.safe_status_update("Hunger monitoring started")
+    sink.safe_status_update("Hunger monitoring started")
+    
+    # Exponential backoff between unconfirmed feeds (verified mode)
+    failed_feeds = 0
+    next_feed_time = 0.0
+    
+    # Classify pixels in worker processes if configured, so detection
+    # does not compete with click timing for the GIL
+    pool = detection_pool.pool_for(state)
+    
+    # Follow the game window if it moves (no-op without an anchor)
+    anchor = region_anchor.tracker_for(state, pool=pool)
+    watchdog.ensure_running(state, sink)
+    
+    # Stretch polling and sparsen sampling when over the CPU budget
+    governor = cpu_governor.governor_for(state)
+    meter = governor.meter("monitor")
     
     while not state.stop_all_flag:
         try:
+            # Neither capture nor click while the game is not usable
+            if _wait_while_paused(state):
+                continue
+            
+            meter.tick()
+            anchor.interval = governor.interval(region_anchor.ANCHOR_CHECK_INTERVAL)
+            if anchor.maybe_update():
+                sink.safe_status_update(f"Game moved - hunger region re-anchored to {state.hunger_region}")
+            elif anchor.lost:
+                sink.safe_status_update("Anchor not found - is the game window visible?")
+            
             # Read current hunger percentage
-            hunger_percentage = hunger_detection.read_hunger_percentage(state.hunger_region)
+            hunger_percentage = hunger_detection.read_hunger_percentage(
+                state.hunger_region, state.hunger_thresholds, pool,
+                sample_rate=_hunger_sample_rate(state, governor),
+                capture=state.hunger_capture
+            )
             hunger_percent = hunger_percentage * 100.0
             
             # Update GUI with current hunger
-            app.safe_status_update(f"Hunger detected: {hunger_percent:.1f}%")
+            sink.safe_status_update(f"Hunger detected: {hunger_percent:.1f}%")
             
-            # Update current hunger label
-            app.root.after(0, lambda p=hunger_percent: app.current_hunger_label.config(
-                text=f"Current Hunger: {p:.1f}%"
-            ))
+            # Update current hunger display
+            sink.update_hunger(hunger_percent)
+            if state.hunger_history is not None:
+                state.hunger_history.record(hunger_percent)
+                _autosave_history(sink, state)
             
             # Check if hunger is below threshold
-            if hunger_percent <= state.hunger_threshold:
-                app.safe_status_update(f"Hunger low ({hunger_percent:.1f}%), feeding...")
+            if hunger_percent <= state.hunger_threshold and state.feed_verify:
+                if state.clock.now() < next_feed_time:
+                    # Backing off after unconfirmed feeds; keep monitoring
+                    _sleep_unless_stopped(state, governor.interval(MONITOR_POLL_INTERVAL))
+                    continue
+                
+                sink.safe_status_update(f"Hunger low ({hunger_percent:.1f}%), feeding...")
+                fed = perform_verified_feed(state, hunger_percentage, sink)
+                
+                if fed is not None:
+                    failed_feeds = 0
+                    sink.safe_status_update(f"Feed confirmed. Hunger: {fed * 100.0:.1f}%")
+                    sink.update_hunger(fed * 100.0)
+                    if state.hunger_history is not None:
+                        state.hunger_history.record_feed()
+                        state.hunger_history.record(fed * 100.0)
+                    _sleep_unless_stopped(state, FEED_SETTLE_DELAY)
+                else:
+                    failed_feeds += 1
+                    backoff = min(FEED_BACKOFF_BASE * 2 ** (failed_feeds - 1), state.feed_backoff_max)
+                    next_feed_time = state.clock.now() + backoff
+                    sink.safe_status_update(
+                        f"Feed not confirmed ({failed_feeds}x) - is the stew in hand? "
+                        f"Retrying in {backoff:.0f}s"
+                    )
+            elif hunger_percent <= state.hunger_threshold:
+                sink.safe_status_update(f"Hunger low ({hunger_percent:.1f}%), feeding...")
                 
                 # Perform feed action
-                success = perform_feed(state)
+                success = perform_feed(state, sink)
                 
                 if success:
-                    app.safe_status_update(f"Feed complete. Hunger: {hunger_percent:.1f}%")
+                    sink.safe_status_update(f"Feed complete. Hunger: {hunger_percent:.1f}%")
+                    if state.hunger_history is not None:
+                        state.hunger_history.record_feed()
                 else:
-                    app.safe_status_update("Feed failed - check settings")
+                    sink.safe_status_update("Feed failed - check settings")
                 
                 # Wait a bit after feeding before checking again
-                time.sleep(2.0)
+                _sleep_unless_stopped(state, 2.0)
             else:
                 # Hunger is above threshold, wait before next check
-                time.sleep(1.5)
+                _sleep_unless_stopped(state, governor.interval(MONITOR_POLL_INTERVAL))
             
             # Check stop flag
             if state.stop_all_flag:
                 break
                 
         except Exception as e:
-            app.safe_status_update(f"Error in hunger monitoring: {str(e)}")
-            time.sleep(2.0)  # Wait before retrying
+            sink.safe_status_update(f"Error in hunger monitoring: {str(e)}")
+            _sleep_unless_stopped(state, 2.0)  # Wait before retrying
     
     # Worker stopped
-    app.safe_status_update("Hunger monitor stopped")
+    sink.safe_status_update("Hunger monitor stopped")
     state.worker_thread = None
 
 
@@ -169,21 +476,21 @@ class TimerFeedWorker(threading.Thread):
     Feeds the character at regular intervals regardless of hunger level.
     """
     
-    def __init__(self, app, state):
+    def __init__(self, sink, state):
         """
         Initialize the timer feed worker.
         
         Args:
-            app: AFKAutoHelpApp instance
+            sink: StatusSink receiving status updates
             state: AppState instance with configuration
         """
         super().__init__(daemon=True)
-        self.app = app
+        self.sink = sink
         self.state = state
     
     def run(self):
         """Execute the timer-based feeding loop."""
-        timer_feed_worker(self.app, self.state)
+        timer_feed_worker(self.sink, self.state)
     
     def stop(self):
         """Stop the worker thread gracefully."""
@@ -197,84 +504,233 @@ class HungerMonitorWorker(threading.Thread):
     Continuously monitors the hunger bar and feeds when threshold is reached.
     """
     
-    def __init__(self, app, state):
+    def __init__(self, sink, state):
         """
         Initialize the hunger monitor worker.
         
         Args:
-            app: AFKAutoHelpApp instance
+            sink: StatusSink receiving status updates
             state: AppState instance with configuration
         """
         super().__init__(daemon=True)
-        self.app = app
+        self.sink = sink
         self.state = state
     
     def run(self):
         """Execute the hunger monitoring loop."""
-        hunger_monitor_worker(self.app, self.state)
+        hunger_monitor_worker(self.sink, self.state)
     
     def stop(self):
         """Stop the worker thread gracefully."""
         self.state.stop_all_flag = True
 
 
-def auto_chop_worker(app, state):
+CHOP_CLEARED = "cleared"
+CHOP_TIMED_OUT = "timed out"
+CHOP_STOPPED = "stopped"
+CHOP_FAILED = "failed"
+
+
+def _follow_anchor(state, bounds, point, region):
+    """
+    Move a worker's copy of a point and region to the current anchor.
+    
+    Args:
+        state: AppState instance
+        bounds: anchor_region the copies were made at (None: no anchor)
+        point: Logical (x, y)
+        region: Logical (x, y, width, height), or None
+        
+    Returns:
+        tuple: (bounds, point, region) relative to the current anchor
+    """
+    current = state.anchor_region
+    if bounds is None or current is None or tuple(current) == bounds:
+        return bounds, point, region
+    point = region_anchor.move_point(point, bounds, current)
+    if region is not None:
+        region = region_anchor.move_region(region, bounds, current)
+    return tuple(current), point, region
+
+
+def _chop_target(sink, state, arbiter, scheduler, schedule, target, anchor) -> str:
+    """
+    Chop one plan entry until it is done, its duration ends or stopped.
+    
+    Args:
+        sink: StatusSink receiving status updates
+        state: AppState instance with configuration
+        arbiter: InputArbiter executing the clicks
+        scheduler: DeadlineScheduler for the click deadlines
+        schedule: IntervalSchedule spacing the clicks
+        target: Entry from chop_targets.plan_from_state()
+        anchor: AnchorTracker following the game window
+        
+    Returns:
+        str: CHOP_CLEARED, CHOP_TIMED_OUT, CHOP_STOPPED or CHOP_FAILED
+    """
+    # The window may have moved since the plan was made
+    bounds, (x, y), region = _follow_anchor(
+        state, target["anchor"], target["point"], target["target_region"]
+    )
+    start_ns = scheduler.now_ns()
+    end_ns = start_ns + int(target["duration"] * 1e9)
+    schedule.start(start_ns)
+    
+    # Record the target's look before the first click
+    watch = None
+    if region is not None:
+        watch = chop_targets.watch_for(state, region, target["target_mode"])
+    
+    # Over the CPU budget, the target and the click guard are checked
+    # less often; the click rate itself is left alone
+    governor = cpu_governor.governor_for(state)
+    meter = governor.meter("chop")
+    
+    # First click immediately, then one per humanized interval
+    deadline = start_ns
+    skipped = 0
+    clicks = 0
+    guard_stride = click_guard.check_stride() if state.click_guard_enabled else 1
+    while deadline < end_ns:
+        if not scheduler.wait_until(deadline):
+            return CHOP_STOPPED
+        meter.tick()
+        
+        # Follow the game window; a pass is a small capture every few seconds
+        anchor.maybe_update()
+        moved_from = bounds
+        bounds, (x, y), region = _follow_anchor(state, bounds, (x, y), region)
+        if bounds != moved_from:
+            if watch is not None:
+                watch.region = region
+            sink.safe_status_update(f"Game moved - chop target re-anchored to {x}, {y}")
+        
+        # Time spent paused does not count against the duration, and
+        # the missed clicks are not made up in a burst afterwards
+        if _is_paused(state):
+            paused_at = scheduler.now_ns()
+            _wait_while_paused(state)
+            if state.stop_all_flag or not state.chop_running:
+                return CHOP_STOPPED
+            resumed_at = scheduler.now_ns()
+            end_ns += resumed_at - paused_at
+            schedule.start(resumed_at)
+            deadline = resumed_at
+        
+        # Skip (not retry) clicks while the trigger looks wrong; the
+        # next deadline is only a fraction of a second away. Over the CPU
+        # budget or with slow capture only every Nth click is checked
+        clicks += 1
+        if (state.click_guard_enabled and clicks % (governor.stride() * guard_stride) == 0
+                and not click_guard.matches((x, y), target["signature"])):
+            skipped += 1
+            if skipped % GUARD_REPORT_EVERY == 1:
+                sink.safe_status_update(
+                    f"Chop trigger does not look as recorded - skipped {skipped} clicks"
+                )
+            deadline = schedule.next_deadline_ns()
+            continue
+        
+        # Perform click through the arbiter so a feed can cut in;
+        # waiting for it keeps at most one chop click queued
+        request = arbiter.click(x, y, source="chop", priority=input_arbiter.PRIORITY_CHOP,
+                                stop_event=state.stop_event)
+        if not _wait_for_input(arbiter, request, INPUT_TIMEOUT):
+            if state.stop_all_flag or not state.chop_running:
+                return CHOP_STOPPED
+            reason = f": {request.error}" if request.error else ""
+            sink.safe_status_update(f"Auto-chop click failed{reason}")
+            return CHOP_FAILED
+        
+        # Stop early once the target is chopped down
+        if watch is not None:
+            watch.interval = governor.interval(chop_targets.TARGET_CHECK_INTERVAL)
+            if watch.done():
+                return CHOP_CLEARED
+        
+        deadline = schedule.next_deadline_ns()
+    return CHOP_TIMED_OUT
+
+
+def auto_chop_worker(sink, state):
     """
     Auto-chop worker thread function.
     
     Clicks at state.chop_trigger at a rate of state.chop_click_rate
-    for state.chop_duration seconds, or until stopped.
+    for state.chop_duration seconds, or until stopped. With a chop plan,
+    works through its targets back to back in short-travel order.
     This runs in a background thread.
     
     Args:
-        app: AFKAutoHelpApp instance for safe UI updates
+        sink: StatusSink receiving status updates (GUI app or headless logger)
         state: AppState instance with configuration
     """
     # Validate preconditions
-    if state.chop_trigger is None:
-        app.safe_status_update("Chop trigger not set")
-        app.on_chop_worker_finished()
+    plan = chop_targets.plan_from_state(state)
+    if not plan:
+        sink.safe_status_update("Chop trigger not set")
+        sink.on_chop_worker_finished()
         return
     
     if state.chop_click_rate <= 0:
-        app.safe_status_update("Invalid chop click rate")
-        app.on_chop_worker_finished()
+        sink.safe_status_update("Invalid chop click rate")
+        sink.on_chop_worker_finished()
         return
     
-    if state.chop_duration <= 0:
-        app.safe_status_update("Invalid chop duration")
-        app.on_chop_worker_finished()
+    if any(target["duration"] <= 0 for target in plan):
+        sink.safe_status_update("Invalid chop duration")
+        sink.on_chop_worker_finished()
         return
     
     try:
-        x, y = state.chop_trigger
-        click_interval = 1.0 / state.chop_click_rate
-        end_time = time.time() + state.chop_duration
+        arbiter = input_arbiter.arbiter_for(state)
+        plan = chop_targets.order_plan(plan, arbiter.pointer)
+        scheduler = DeadlineScheduler(
+            should_stop=lambda: state.stop_all_flag or not state.chop_running,
+            clock=state.clock, stop_event=state.stop_event
+        )
+        schedule = timing_model.IntervalSchedule(1.0 / state.chop_click_rate, state.timing_profile)
+        start_ns = scheduler.now_ns()
+        watchdog.ensure_running(state, sink)
+        anchor = region_anchor.tracker_for(state, pool=detection_pool.pool_for(state))
         
-        app.safe_status_update(f"Auto-chop started: {state.chop_click_rate} clicks/sec for {state.chop_duration}s")
+        if len(plan) == 1:
+            sink.safe_status_update(
+                f"Auto-chop started: {state.chop_click_rate} clicks/sec for {plan[0]['duration']}s"
+            )
         
-        while time.time() < end_time:
-            # Check stop conditions
-            if state.stop_all_flag or not state.chop_running:
+        outcomes = []
+        for number, target in enumerate(plan, 1):
+            if len(plan) > 1:
+                sink.safe_status_update(
+                    f"Auto-chop target {number}/{len(plan)} at "
+                    f"{target['point'][0]}, {target['point'][1]}"
+                )
+            outcome = _chop_target(sink, state, arbiter, scheduler, schedule, target, anchor)
+            outcomes.append(outcome)
+            if outcome in (CHOP_STOPPED, CHOP_FAILED):
                 break
-            
-            # Perform click
-            pyautogui.click(x, y)
-            
-            # Sleep for the click interval
-            time.sleep(click_interval)
         
         # Worker finished
+        elapsed = (scheduler.now_ns() - start_ns) / 1e9
         if state.stop_all_flag or not state.chop_running:
-            app.safe_status_update("Auto-chop stopped")
+            sink.safe_status_update("Auto-chop stopped")
+        elif len(plan) > 1:
+            sink.safe_status_update(
+                f"Auto-chop plan finished: {outcomes.count(CHOP_CLEARED)}/{len(plan)} "
+                f"targets cleared in {elapsed:.1f}s"
+            )
+        elif outcomes[-1] == CHOP_CLEARED:
+            sink.safe_status_update(f"Auto-chop finished: target cleared after {elapsed:.1f}s")
         else:
-            app.safe_status_update("Auto-chop finished")
+            sink.safe_status_update("Auto-chop finished")
         
     except Exception as e:
-        app.safe_status_update(f"Error in auto-chop: {str(e)}")
+        sink.safe_status_update(f"Error in auto-chop: {str(e)}")
     finally:
         # Always call finished callback
-        app.on_chop_worker_finished()
+        sink.on_chop_worker_finished()
 
 
 class AutoChopWorker(threading.Thread):
@@ -284,21 +740,21 @@ class AutoChopWorker(threading.Thread):
     Performs automated clicking at the chop trigger point.
     """
     
-    def __init__(self, app, state):
+    def __init__(self, sink, state):
         """
         Initialize the auto-chop worker.
         
         Args:
-            app: AFKAutoHelpApp instance
+            sink: StatusSink receiving status updates
             state: AppState instance with configuration
         """
         super().__init__(daemon=True)
-        self.app = app
+        self.sink = sink
         self.state = state
     
     def run(self):
         """Execute the auto-chop clicking loop."""
-        auto_chop_worker(self.app, self.state)
+        auto_chop_worker(self.sink, self.state)
     
     def stop(self):
         """Stop the worker thread gracefully."""